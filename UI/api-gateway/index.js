@@ -176,13 +176,14 @@ app.get("/users", async (req, res) => {
 app.post("/reservations", async (req, res) => {
   try {
     // Validate input at the gateway level
+    // accepts a single book_id or a book_ids array
     const userId = parseInt(req.body.user_id);
-    const bookId = parseInt(req.body.book_id);
-    if (!Number.isInteger(userId) || !Number.isInteger(bookId) || userId <= 0 || bookId <= 0) {
-      return res.status(400).json({ error: "user_id and book_id are required and must be positive integers" });
+    const bookIds = (Array.isArray(req.body.book_ids) ? req.body.book_ids : [req.body.book_id]).map((id) => parseInt(id));
+    if (!Number.isInteger(userId) || userId <= 0 || bookIds.length === 0 || bookIds.some((id) => !Number.isInteger(id) || id <= 0)) {
+      return res.status(400).json({ error: "user_id and book_id (or book_ids) are required and must be positive integers" });
     }
 
-    const payload = { user_id: userId, book_id: bookId };
+    const payload = { user_id: userId, book_ids: bookIds };
     const response = await reservationService.reserveBook(payload);
     res.json(response);
   } catch (err) {
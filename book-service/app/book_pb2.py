@@ -24,13 +24,15 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nbook.proto\x12\x07library\"a\n\x0e\x41\x64\x64\x42ookRequest\x12\x11\n\tbook_name\x18\x01 \x01(\t\x12\x14\n\x0cpublisher_id\x18\x02 \x01(\x05\x12\x11\n\tauthor_id\x18\x03 \x01(\x05\x12\x13\n\x0b\x63\x61tegory_id\x18\x04 \x01(\x05\"2\n\x0c\x42ookResponse\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x11\n\tbook_name\x18\x02 \x01(\t\"u\n\x11UpdateBookRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x11\n\tbook_name\x18\x02 \x01(\t\x12\x14\n\x0cpublisher_id\x18\x03 \x01(\x05\x12\x11\n\tauthor_id\x18\x04 \x01(\x05\x12\x13\n\x0b\x63\x61tegory_id\x18\x05 \x01(\x05\"$\n\x11\x44\x65leteBookRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\"\x14\n\x12GetAllBooksRequest\"u\n\x0b\x42ookDetails\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x11\n\tbook_name\x18\x02 \x01(\t\x12\x15\n\rcategory_name\x18\x03 \x01(\t\x12\x13\n\x0b\x61uthor_name\x18\x04 \x03(\t\x12\x16\n\x0epublisher_name\x18\x05 \x03(\t\"9\n\x13GetAllBooksResponse\x12\"\n\x04\x62ook\x18\x01 \x03(\x0b\x32\x14.library.BookDetails\"!\n\x0eGetBookRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\"5\n\x0fGetBookResponse\x12\"\n\x04\x62ook\x18\x01 \x01(\x0b\x32\x14.library.BookDetails\"+\n\x12\x41\x64\x64\x43\x61tegoryRequest\x12\x15\n\rcategory_name\x18\x01 \x01(\t\">\n\x10\x43\x61tegoryResponse\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\x12\x15\n\rcategory_name\x18\x02 \x01(\t\"C\n\x15UpdateCategoryRequest\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\x12\x15\n\rcategory_name\x18\x02 \x01(\t\",\n\x15\x44\x65leteCategoryRequest\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\"\x19\n\x17GetAllCategoriesRequest\"=\n\x0f\x43\x61tegoryDetails\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\x12\x15\n\rcategory_name\x18\x02 \x01(\t\"F\n\x18GetAllCategoriesResponse\x12*\n\x08\x63\x61tegory\x18\x01 \x03(\x0b\x32\x18.library.CategoryDetails\")\n\x12GetCategoryRequest\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\"A\n\x13GetCategoryResponse\x12*\n\x08\x63\x61tegory\x18\x01 \x01(\x0b\x32\x18.library.CategoryDetails2\xd6\x05\n\x0b\x42ookService\x12\x39\n\x07\x41\x64\x64\x42ook\x12\x17.library.AddBookRequest\x1a\x15.library.BookResponse\x12?\n\nUpdateBook\x12\x1a.library.UpdateBookRequest\x1a\x15.library.BookResponse\x12?\n\nDeleteBook\x12\x1a.library.DeleteBookRequest\x1a\x15.library.BookResponse\x12H\n\x0bGetAllBooks\x12\x1b.library.GetAllBooksRequest\x1a\x1c.library.GetAllBooksResponse\x12<\n\x07GetBook\x12\x17.library.GetBookRequest\x1a\x18.library.GetBookResponse\x12\x45\n\x0b\x41\x64\x64\x43\x61tegory\x12\x1b.library.AddCategoryRequest\x1a\x19.library.CategoryResponse\x12K\n\x0eUpdateCategory\x12\x1e.library.UpdateCategoryRequest\x1a\x19.library.CategoryResponse\x12K\n\x0e\x44\x65leteCategory\x12\x1e.library.DeleteCategoryRequest\x1a\x19.library.CategoryResponse\x12W\n\x10GetAllCategories\x12 .library.GetAllCategoriesRequest\x1a!.library.GetAllCategoriesResponse\x12H\n\x0bGetCategory\x12\x1b.library.GetCategoryRequest\x1a\x1c.library.GetCategoryResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nbook.proto\x12\x07library\"a\n\x0e\x41\x64\x64\x42ookRequest\x12\x11\n\tbook_name\x18\x01 \x01(\t\x12\x14\n\x0cpublisher_id\x18\x02 \x01(\x05\x12\x11\n\tauthor_id\x18\x03 \x01(\x05\x12\x13\n\x0b\x63\x61tegory_id\x18\x04 \x01(\x05\"2\n\x0c\x42ookResponse\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x11\n\tbook_name\x18\x02 \x01(\t\"u\n\x11UpdateBookRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x11\n\tbook_name\x18\x02 \x01(\t\x12\x14\n\x0cpublisher_id\x18\x03 \x01(\x05\x12\x11\n\tauthor_id\x18\x04 \x01(\x05\x12\x13\n\x0b\x63\x61tegory_id\x18\x05 \x01(\x05\"$\n\x11\x44\x65leteBookRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\"\x14\n\x12GetAllBooksRequest\"u\n\x0b\x42ookDetails\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x11\n\tbook_name\x18\x02 \x01(\t\x12\x15\n\rcategory_name\x18\x03 \x01(\t\x12\x13\n\x0b\x61uthor_name\x18\x04 \x03(\t\x12\x16\n\x0epublisher_name\x18\x05 \x03(\t\"9\n\x13GetAllBooksResponse\x12\"\n\x04\x62ook\x18\x01 \x03(\x0b\x32\x14.library.BookDetails\"!\n\x0eGetBookRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\"5\n\x0fGetBookResponse\x12\"\n\x04\x62ook\x18\x01 \x01(\x0b\x32\x14.library.BookDetails\"\"\n\x0fGetBooksRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x03(\x05\"\xa4\x01\n\x10GetBooksResponse\x12\x33\n\x05\x62ooks\x18\x01 \x03(\x0b\x32$.library.GetBooksResponse.BooksEntry\x12\x17\n\x0fmissing_book_id\x18\x02 \x03(\x05\x1a\x42\n\nBooksEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.library.BookDetails:\x02\x38\x01\"9\n\x10ListBooksRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\"P\n\x11ListBooksResponse\x12\"\n\x04\x62ook\x18\x01 \x03(\x0b\x32\x14.library.BookDetails\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"?\n\x12StreamBooksRequest\x12\x12\n\nbatch_size\x18\x01 \x01(\x05\x12\x15\n\rafter_book_id\x18\x02 \x01(\x05\"_\n\x12SearchBooksRequest\x12\r\n\x05query\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x61tegory_id\x18\x02 \x01(\x05\x12\x11\n\tpage_size\x18\x03 \x01(\x05\x12\x12\n\npage_token\x18\x04 \x01(\t\"R\n\x13SearchBooksResponse\x12\"\n\x04\x62ook\x18\x01 \x03(\x0b\x32\x14.library.BookDetails\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"\x8d\x01\n\rImportBookRow\x12\x11\n\tbook_name\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x61tegory_id\x18\x02 \x01(\x05\x12\x11\n\tauthor_id\x18\x03 \x03(\x05\x12\x13\n\x0b\x61uthor_name\x18\x04 \x03(\t\x12\x14\n\x0cpublisher_id\x18\x05 \x03(\x05\x12\x16\n\x0epublisher_name\x18\x06 \x03(\t\"3\n\x0eImportRowError\x12\x12\n\nrow_number\x18\x01 \x01(\x05\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\x9f\x01\n\x13ImportBooksResponse\x12\x16\n\x0eimported_count\x18\x01 \x01(\x05\x12\x16\n\x0erejected_count\x18\x02 \x01(\x05\x12&\n\x05\x65rror\x18\x03 \x03(\x0b\x32\x17.library.ImportRowError\x12\x17\n\x0f\x65lapsed_seconds\x18\x04 \x01(\x01\x12\x17\n\x0frows_per_second\x18\x05 \x01(\x01\"\x19\n\x17GetCatalogFacetsRequest\":\n\nFacetCount\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nbook_count\x18\x03 \x01(\x05\"\xa3\x01\n\x18GetCatalogFacetsResponse\x12\x13\n\x0btotal_books\x18\x01 \x01(\x05\x12%\n\x08\x63\x61tegory\x18\x02 \x03(\x0b\x32\x13.library.FacetCount\x12#\n\x06\x61uthor\x18\x03 \x03(\x0b\x32\x13.library.FacetCount\x12&\n\tpublisher\x18\x04 \x03(\x0b\x32\x13.library.FacetCount\"+\n\x12\x41\x64\x64\x43\x61tegoryRequest\x12\x15\n\rcategory_name\x18\x01 \x01(\t\">\n\x10\x43\x61tegoryResponse\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\x12\x15\n\rcategory_name\x18\x02 \x01(\t\"C\n\x15UpdateCategoryRequest\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\x12\x15\n\rcategory_name\x18\x02 \x01(\t\",\n\x15\x44\x65leteCategoryRequest\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\"\x19\n\x17GetAllCategoriesRequest\"=\n\x0f\x43\x61tegoryDetails\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\x12\x15\n\rcategory_name\x18\x02 \x01(\t\"F\n\x18GetAllCategoriesResponse\x12*\n\x08\x63\x61tegory\x18\x01 \x03(\x0b\x32\x18.library.CategoryDetails\")\n\x12GetCategoryRequest\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\x05\"A\n\x13GetCategoryResponse\x12*\n\x08\x63\x61tegory\x18\x01 \x01(\x0b\x32\x18.library.CategoryDetails\"\x16\n\x14GetAllAuthorsRequest\"7\n\rAuthorDetails\x12\x11\n\tauthor_id\x18\x01 \x01(\x05\x12\x13\n\x0b\x61uthor_name\x18\x02 \x01(\t\"?\n\x15GetAllAuthorsResponse\x12&\n\x06\x61uthor\x18\x01 \x03(\x0b\x32\x16.library.AuthorDetails\"\x19\n\x17GetAllPublishersRequest\"@\n\x10PublisherDetails\x12\x14\n\x0cpublisher_id\x18\x01 \x01(\x05\x12\x16\n\x0epublisher_name\x18\x02 \x01(\t\"H\n\x18GetAllPublishersResponse\x12,\n\tpublisher\x18\x01 \x03(\x0b\x32\x19.library.PublisherDetails2\xb2\n\n\x0b\x42ookService\x12\x39\n\x07\x41\x64\x64\x42ook\x12\x17.library.AddBookRequest\x1a\x15.library.BookResponse\x12?\n\nUpdateBook\x12\x1a.library.UpdateBookRequest\x1a\x15.library.BookResponse\x12?\n\nDeleteBook\x12\x1a.library.DeleteBookRequest\x1a\x15.library.BookResponse\x12H\n\x0bGetAllBooks\x12\x1b.library.GetAllBooksRequest\x1a\x1c.library.GetAllBooksResponse\x12<\n\x07GetBook\x12\x17.library.GetBookRequest\x1a\x18.library.GetBookResponse\x12?\n\x08GetBooks\x12\x18.library.GetBooksRequest\x1a\x19.library.GetBooksResponse\x12\x42\n\tListBooks\x12\x19.library.ListBooksRequest\x1a\x1a.library.ListBooksResponse\x12\x42\n\x0bStreamBooks\x12\x1b.library.StreamBooksRequest\x1a\x14.library.BookDetails0\x01\x12H\n\x0bSearchBooks\x12\x1b.library.SearchBooksRequest\x1a\x1c.library.SearchBooksResponse\x12\x45\n\x0bImportBooks\x12\x16.library.ImportBookRow\x1a\x1c.library.ImportBooksResponse(\x01\x12W\n\x10GetCatalogFacets\x12 .library.GetCatalogFacetsRequest\x1a!.library.GetCatalogFacetsResponse\x12\x45\n\x0b\x41\x64\x64\x43\x61tegory\x12\x1b.library.AddCategoryRequest\x1a\x19.library.CategoryResponse\x12K\n\x0eUpdateCategory\x12\x1e.library.UpdateCategoryRequest\x1a\x19.library.CategoryResponse\x12K\n\x0e\x44\x65leteCategory\x12\x1e.library.DeleteCategoryRequest\x1a\x19.library.CategoryResponse\x12W\n\x10GetAllCategories\x12 .library.GetAllCategoriesRequest\x1a!.library.GetAllCategoriesResponse\x12H\n\x0bGetCategory\x12\x1b.library.GetCategoryRequest\x1a\x1c.library.GetCategoryResponse\x12N\n\rGetAllAuthors\x12\x1d.library.GetAllAuthorsRequest\x1a\x1e.library.GetAllAuthorsResponse\x12W\n\x10GetAllPublishers\x12 .library.GetAllPublishersRequest\x1a!.library.GetAllPublishersResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'book_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_GETBOOKSRESPONSE_BOOKSENTRY']._loaded_options = None
+  _globals['_GETBOOKSRESPONSE_BOOKSENTRY']._serialized_options = b'8\001'
   _globals['_ADDBOOKREQUEST']._serialized_start=23
   _globals['_ADDBOOKREQUEST']._serialized_end=120
   _globals['_BOOKRESPONSE']._serialized_start=122
@@ -49,24 +51,64 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETBOOKREQUEST']._serialized_end=564
   _globals['_GETBOOKRESPONSE']._serialized_start=566
   _globals['_GETBOOKRESPONSE']._serialized_end=619
-  _globals['_ADDCATEGORYREQUEST']._serialized_start=621
-  _globals['_ADDCATEGORYREQUEST']._serialized_end=664
-  _globals['_CATEGORYRESPONSE']._serialized_start=666
-  _globals['_CATEGORYRESPONSE']._serialized_end=728
-  _globals['_UPDATECATEGORYREQUEST']._serialized_start=730
-  _globals['_UPDATECATEGORYREQUEST']._serialized_end=797
-  _globals['_DELETECATEGORYREQUEST']._serialized_start=799
-  _globals['_DELETECATEGORYREQUEST']._serialized_end=843
-  _globals['_GETALLCATEGORIESREQUEST']._serialized_start=845
-  _globals['_GETALLCATEGORIESREQUEST']._serialized_end=870
-  _globals['_CATEGORYDETAILS']._serialized_start=872
-  _globals['_CATEGORYDETAILS']._serialized_end=933
-  _globals['_GETALLCATEGORIESRESPONSE']._serialized_start=935
-  _globals['_GETALLCATEGORIESRESPONSE']._serialized_end=1005
-  _globals['_GETCATEGORYREQUEST']._serialized_start=1007
-  _globals['_GETCATEGORYREQUEST']._serialized_end=1048
-  _globals['_GETCATEGORYRESPONSE']._serialized_start=1050
-  _globals['_GETCATEGORYRESPONSE']._serialized_end=1115
-  _globals['_BOOKSERVICE']._serialized_start=1118
-  _globals['_BOOKSERVICE']._serialized_end=1844
+  _globals['_GETBOOKSREQUEST']._serialized_start=621
+  _globals['_GETBOOKSREQUEST']._serialized_end=655
+  _globals['_GETBOOKSRESPONSE']._serialized_start=658
+  _globals['_GETBOOKSRESPONSE']._serialized_end=822
+  _globals['_GETBOOKSRESPONSE_BOOKSENTRY']._serialized_start=756
+  _globals['_GETBOOKSRESPONSE_BOOKSENTRY']._serialized_end=822
+  _globals['_LISTBOOKSREQUEST']._serialized_start=824
+  _globals['_LISTBOOKSREQUEST']._serialized_end=881
+  _globals['_LISTBOOKSRESPONSE']._serialized_start=883
+  _globals['_LISTBOOKSRESPONSE']._serialized_end=963
+  _globals['_STREAMBOOKSREQUEST']._serialized_start=965
+  _globals['_STREAMBOOKSREQUEST']._serialized_end=1028
+  _globals['_SEARCHBOOKSREQUEST']._serialized_start=1030
+  _globals['_SEARCHBOOKSREQUEST']._serialized_end=1125
+  _globals['_SEARCHBOOKSRESPONSE']._serialized_start=1127
+  _globals['_SEARCHBOOKSRESPONSE']._serialized_end=1209
+  _globals['_IMPORTBOOKROW']._serialized_start=1212
+  _globals['_IMPORTBOOKROW']._serialized_end=1353
+  _globals['_IMPORTROWERROR']._serialized_start=1355
+  _globals['_IMPORTROWERROR']._serialized_end=1406
+  _globals['_IMPORTBOOKSRESPONSE']._serialized_start=1409
+  _globals['_IMPORTBOOKSRESPONSE']._serialized_end=1568
+  _globals['_GETCATALOGFACETSREQUEST']._serialized_start=1570
+  _globals['_GETCATALOGFACETSREQUEST']._serialized_end=1595
+  _globals['_FACETCOUNT']._serialized_start=1597
+  _globals['_FACETCOUNT']._serialized_end=1655
+  _globals['_GETCATALOGFACETSRESPONSE']._serialized_start=1658
+  _globals['_GETCATALOGFACETSRESPONSE']._serialized_end=1821
+  _globals['_ADDCATEGORYREQUEST']._serialized_start=1823
+  _globals['_ADDCATEGORYREQUEST']._serialized_end=1866
+  _globals['_CATEGORYRESPONSE']._serialized_start=1868
+  _globals['_CATEGORYRESPONSE']._serialized_end=1930
+  _globals['_UPDATECATEGORYREQUEST']._serialized_start=1932
+  _globals['_UPDATECATEGORYREQUEST']._serialized_end=1999
+  _globals['_DELETECATEGORYREQUEST']._serialized_start=2001
+  _globals['_DELETECATEGORYREQUEST']._serialized_end=2045
+  _globals['_GETALLCATEGORIESREQUEST']._serialized_start=2047
+  _globals['_GETALLCATEGORIESREQUEST']._serialized_end=2072
+  _globals['_CATEGORYDETAILS']._serialized_start=2074
+  _globals['_CATEGORYDETAILS']._serialized_end=2135
+  _globals['_GETALLCATEGORIESRESPONSE']._serialized_start=2137
+  _globals['_GETALLCATEGORIESRESPONSE']._serialized_end=2207
+  _globals['_GETCATEGORYREQUEST']._serialized_start=2209
+  _globals['_GETCATEGORYREQUEST']._serialized_end=2250
+  _globals['_GETCATEGORYRESPONSE']._serialized_start=2252
+  _globals['_GETCATEGORYRESPONSE']._serialized_end=2317
+  _globals['_GETALLAUTHORSREQUEST']._serialized_start=2319
+  _globals['_GETALLAUTHORSREQUEST']._serialized_end=2341
+  _globals['_AUTHORDETAILS']._serialized_start=2343
+  _globals['_AUTHORDETAILS']._serialized_end=2398
+  _globals['_GETALLAUTHORSRESPONSE']._serialized_start=2400
+  _globals['_GETALLAUTHORSRESPONSE']._serialized_end=2463
+  _globals['_GETALLPUBLISHERSREQUEST']._serialized_start=2465
+  _globals['_GETALLPUBLISHERSREQUEST']._serialized_end=2490
+  _globals['_PUBLISHERDETAILS']._serialized_start=2492
+  _globals['_PUBLISHERDETAILS']._serialized_end=2556
+  _globals['_GETALLPUBLISHERSRESPONSE']._serialized_start=2558
+  _globals['_GETALLPUBLISHERSRESPONSE']._serialized_end=2630
+  _globals['_BOOKSERVICE']._serialized_start=2633
+  _globals['_BOOKSERVICE']._serialized_end=3963
 # @@protoc_insertion_point(module_scope)
@@ -59,6 +59,36 @@ class BookServiceStub(object):
                 request_serializer=book__pb2.GetBookRequest.SerializeToString,
                 response_deserializer=book__pb2.GetBookResponse.FromString,
                 _registered_method=True)
+        self.GetBooks = channel.unary_unary(
+                '/library.BookService/GetBooks',
+                request_serializer=book__pb2.GetBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.GetBooksResponse.FromString,
+                _registered_method=True)
+        self.ListBooks = channel.unary_unary(
+                '/library.BookService/ListBooks',
+                request_serializer=book__pb2.ListBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.ListBooksResponse.FromString,
+                _registered_method=True)
+        self.StreamBooks = channel.unary_stream(
+                '/library.BookService/StreamBooks',
+                request_serializer=book__pb2.StreamBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.BookDetails.FromString,
+                _registered_method=True)
+        self.SearchBooks = channel.unary_unary(
+                '/library.BookService/SearchBooks',
+                request_serializer=book__pb2.SearchBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.SearchBooksResponse.FromString,
+                _registered_method=True)
+        self.ImportBooks = channel.stream_unary(
+                '/library.BookService/ImportBooks',
+                request_serializer=book__pb2.ImportBookRow.SerializeToString,
+                response_deserializer=book__pb2.ImportBooksResponse.FromString,
+                _registered_method=True)
+        self.GetCatalogFacets = channel.unary_unary(
+                '/library.BookService/GetCatalogFacets',
+                request_serializer=book__pb2.GetCatalogFacetsRequest.SerializeToString,
+                response_deserializer=book__pb2.GetCatalogFacetsResponse.FromString,
+                _registered_method=True)
         self.AddCategory = channel.unary_unary(
                 '/library.BookService/AddCategory',
                 request_serializer=book__pb2.AddCategoryRequest.SerializeToString,
@@ -84,6 +114,16 @@ class BookServiceStub(object):
                 request_serializer=book__pb2.GetCategoryRequest.SerializeToString,
                 response_deserializer=book__pb2.GetCategoryResponse.FromString,
                 _registered_method=True)
+        self.GetAllAuthors = channel.unary_unary(
+                '/library.BookService/GetAllAuthors',
+                request_serializer=book__pb2.GetAllAuthorsRequest.SerializeToString,
+                response_deserializer=book__pb2.GetAllAuthorsResponse.FromString,
+                _registered_method=True)
+        self.GetAllPublishers = channel.unary_unary(
+                '/library.BookService/GetAllPublishers',
+                request_serializer=book__pb2.GetAllPublishersRequest.SerializeToString,
+                response_deserializer=book__pb2.GetAllPublishersResponse.FromString,
+                _registered_method=True)
 
 
 class BookServiceServicer(object):
@@ -120,6 +160,42 @@ class BookServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ImportBooks(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCatalogFacets(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def AddCategory(self, request, context):
         """for book category
         """
@@ -151,6 +227,20 @@ class BookServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetAllAuthors(self, request, context):
+        """for book authors
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAllPublishers(self, request, context):
+        """for book publishers
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_BookServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -179,6 +269,36 @@ def add_BookServiceServicer_to_server(servicer, server):
                     request_deserializer=book__pb2.GetBookRequest.FromString,
                     response_serializer=book__pb2.GetBookResponse.SerializeToString,
             ),
+            'GetBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBooks,
+                    request_deserializer=book__pb2.GetBooksRequest.FromString,
+                    response_serializer=book__pb2.GetBooksResponse.SerializeToString,
+            ),
+            'ListBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListBooks,
+                    request_deserializer=book__pb2.ListBooksRequest.FromString,
+                    response_serializer=book__pb2.ListBooksResponse.SerializeToString,
+            ),
+            'StreamBooks': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamBooks,
+                    request_deserializer=book__pb2.StreamBooksRequest.FromString,
+                    response_serializer=book__pb2.BookDetails.SerializeToString,
+            ),
+            'SearchBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchBooks,
+                    request_deserializer=book__pb2.SearchBooksRequest.FromString,
+                    response_serializer=book__pb2.SearchBooksResponse.SerializeToString,
+            ),
+            'ImportBooks': grpc.stream_unary_rpc_method_handler(
+                    servicer.ImportBooks,
+                    request_deserializer=book__pb2.ImportBookRow.FromString,
+                    response_serializer=book__pb2.ImportBooksResponse.SerializeToString,
+            ),
+            'GetCatalogFacets': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCatalogFacets,
+                    request_deserializer=book__pb2.GetCatalogFacetsRequest.FromString,
+                    response_serializer=book__pb2.GetCatalogFacetsResponse.SerializeToString,
+            ),
             'AddCategory': grpc.unary_unary_rpc_method_handler(
                     servicer.AddCategory,
                     request_deserializer=book__pb2.AddCategoryRequest.FromString,
@@ -204,6 +324,16 @@ def add_BookServiceServicer_to_server(servicer, server):
                     request_deserializer=book__pb2.GetCategoryRequest.FromString,
                     response_serializer=book__pb2.GetCategoryResponse.SerializeToString,
             ),
+            'GetAllAuthors': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAllAuthors,
+                    request_deserializer=book__pb2.GetAllAuthorsRequest.FromString,
+                    response_serializer=book__pb2.GetAllAuthorsResponse.SerializeToString,
+            ),
+            'GetAllPublishers': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAllPublishers,
+                    request_deserializer=book__pb2.GetAllPublishersRequest.FromString,
+                    response_serializer=book__pb2.GetAllPublishersResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'library.BookService', rpc_method_handlers)
@@ -350,6 +480,168 @@ class BookService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetBooks',
+            book__pb2.GetBooksRequest.SerializeToString,
+            book__pb2.GetBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/ListBooks',
+            book__pb2.ListBooksRequest.SerializeToString,
+            book__pb2.ListBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/library.BookService/StreamBooks',
+            book__pb2.StreamBooksRequest.SerializeToString,
+            book__pb2.BookDetails.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/SearchBooks',
+            book__pb2.SearchBooksRequest.SerializeToString,
+            book__pb2.SearchBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ImportBooks(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/library.BookService/ImportBooks',
+            book__pb2.ImportBookRow.SerializeToString,
+            book__pb2.ImportBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCatalogFacets(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetCatalogFacets',
+            book__pb2.GetCatalogFacetsRequest.SerializeToString,
+            book__pb2.GetCatalogFacetsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def AddCategory(request,
             target,
@@ -484,3 +776,57 @@ class BookService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetAllAuthors(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetAllAuthors',
+            book__pb2.GetAllAuthorsRequest.SerializeToString,
+            book__pb2.GetAllAuthorsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetAllPublishers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetAllPublishers',
+            book__pb2.GetAllPublishersRequest.SerializeToString,
+            book__pb2.GetAllPublishersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,31 @@
+import os
+from common.cache import TTLCache
+
+# BOOK_CACHE_SIZE=0 turns the cache off entirely
+BOOK_CACHE_SIZE = int(os.getenv("BOOK_CACHE_SIZE", "10000"))
+BOOK_CACHE_TTL_SECONDS = float(os.getenv("BOOK_CACHE_TTL_SECONDS", "60"))
+
+# BookDetails messages by book_id
+book_cache = TTLCache("book_details", BOOK_CACHE_SIZE, BOOK_CACHE_TTL_SECONDS, metric_prefix="book_cache")
+# whole-catalog responses (GetAllBooksResponse); only ever holds one key
+catalog_cache = TTLCache("catalog", 1 if BOOK_CACHE_SIZE > 0 else 0, BOOK_CACHE_TTL_SECONDS, metric_prefix="book_cache")
+
+ALL_BOOKS = "all"
+
+
+def invalidate_book(book_id):
+    # a single book changed: its own entry and any listing containing it
+    book_cache.invalidate(book_id)
+    catalog_cache.clear()
+
+
+def invalidate_books(book_ids):
+    for book_id in book_ids:
+        book_cache.invalidate(book_id)
+    catalog_cache.clear()
+
+
+def invalidate_catalog():
+    # a category (shared by many books) changed: drop everything
+    book_cache.clear()
+    catalog_cache.clear()
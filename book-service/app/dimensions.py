@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import os
+from database import get_session
+from models import Category, Author, Publisher
+from repositories import DimensionRepository
+
+# how often each replica checks dimension_version for changes made elsewhere
+DIMENSION_REFRESH_SECONDS = float(os.getenv("DIMENSION_REFRESH_SECONDS", "30"))
+
+console = logging.getLogger("book-dimensions")
+
+
+class DimensionDictionary:
+    """In-memory id -> name map for one small, rarely changing table."""
+
+    def __init__(self, name, id_column, name_column):
+        self.name = name
+        self.id_column = id_column
+        self.name_column = name_column
+        self.names = {}
+        self.version = None  # dimension_version last loaded; None until loaded
+
+    @property
+    def loaded(self):
+        return self.version is not None
+
+    def get(self, item_id):
+        return self.names.get(item_id)
+
+    def items(self):
+        return sorted(self.names.items())
+
+    async def reload(self, session, version):
+        self.names = await DimensionRepository.load_names(session, self.id_column, self.name_column)
+        self.version = version
+        console.info("Loaded %d %s names (version %s)", len(self.names), self.name, version)
+
+
+# keyed by table name, which is also the dimension_version key
+categories = DimensionDictionary("category", Category.category_id, Category.category_name)
+authors = DimensionDictionary("author", Author.author_id, Author.author_name)
+publishers = DimensionDictionary("publisher", Publisher.publisher_id, Publisher.publisher_name)
+DIMENSIONS = (categories, authors, publishers)
+
+
+async def refresh_stale():
+    # one tiny query when nothing changed; reloads only the tables whose
+    # version moved since they were last loaded
+    async with get_session() as session:
+        versions = await DimensionRepository.get_versions(session)
+        for dimension in DIMENSIONS:
+            version = versions.get(dimension.name, 0)
+            if dimension.version != version:
+                await dimension.reload(session, version)
+
+
+async def refresh_after_write():
+    # the write has already committed; if this fails the poller catches up
+    try:
+        await refresh_stale()
+    except Exception:
+        console.exception("Refreshing dimension dictionaries failed")
+
+
+async def ensure_loaded(dimension):
+    if not dimension.loaded:
+        await refresh_stale()
+
+
+async def refresh_forever():
+    while True:
+        try:
+            await refresh_stale()
+        except Exception:
+            console.exception("Refreshing dimension dictionaries failed")
+        await asyncio.sleep(DIMENSION_REFRESH_SECONDS)
@@ -1,10 +1,19 @@
 import asyncio
+from sqlalchemy import text, delete
 from database import engine, Base
 import models
+from repositories import refresh_details_stmt, facet_deltas_stmt
 
 async def init_db():
     async with engine.begin() as conn:
+        # trigram indexes used by SearchBooks
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+        # (re)build the book_details read model from the normalised tables
+        await conn.execute(refresh_details_stmt(scoped=False))
+        # recount catalog_facet from scratch
+        await conn.execute(delete(models.CatalogFacet))
+        await conn.execute(facet_deltas_stmt(scoped=False), {"sign": 1})
 
 asyncio.run(init_db())
 # This script initializes the database by creating all tables defined in the models.
\ No newline at end of file
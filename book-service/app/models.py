@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table
+from sqlalchemy import Column, Integer, BigInteger, String, ForeignKey, Table, Index, func, text
 from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import ARRAY
 from database import Base
 
 # Many-to-many
@@ -39,3 +40,51 @@ class Category(Base):
     __tablename__ = "category"
     category_id = Column(Integer, primary_key=True)
     category_name = Column(String(100), nullable=False)
+
+# Bumped in the same transaction as any change to the category, author or
+# publisher tables, so every book-service replica can tell that its in-memory
+# id -> name dictionary for that table is stale.
+class DimensionVersion(Base):
+    __tablename__ = "dimension_version"
+    dimension = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+# Denormalised read model: one row per book with its category, author and
+# publisher names already resolved. Written by BookRepository/CategoryRepository
+# in the same transaction as the normalised tables; all catalog reads use it.
+class CatalogEntry(Base):
+    __tablename__ = "book_details"
+    book_id = Column(Integer, ForeignKey("book.book_id", ondelete="CASCADE"), primary_key=True)
+    book_name = Column(String(255), nullable=False)
+    category_id = Column(Integer)
+    category_name = Column(String(100))
+    authors = Column(ARRAY(String(255)), nullable=False, server_default=text("'{}'"))
+    publishers = Column(ARRAY(String(255)), nullable=False, server_default=text("'{}'"))
+
+# Maintained book counts per facet value: facet is "category", "author" or
+# "publisher" with facet_id the dimension id, or "total" with facet_id 0.
+# Adjusted by FacetRepository in the same transaction as every book write.
+class CatalogFacet(Base):
+    __tablename__ = "catalog_facet"
+    facet = Column(String(20), primary_key=True)
+    facet_id = Column(Integer, primary_key=True)
+    book_count = Column(Integer, nullable=False, default=0)
+
+# Full-text search configurations: titles are stemmed, names of people and
+# organisations are not. Queries must use the same expressions so the planner
+# picks these indexes.
+TS_TITLE_CONFIG = text("'english'::regconfig")
+TS_NAME_CONFIG = text("'simple'::regconfig")
+
+Index("idx_book_category", Book.category_id)
+Index("idx_book_details_category", CatalogEntry.category_id)
+Index("idx_book_authors_author", book_authors_table.c.author_id)
+Index("idx_book_publisher_publisher", book_publisher_table.c.publisher_id)
+
+# GIN indexes backing SearchBooks; trigram indexes need the pg_trgm extension
+Index("idx_book_name_fts", func.to_tsvector(TS_TITLE_CONFIG, Book.book_name), postgresql_using="gin")
+Index("idx_book_name_trgm", Book.book_name, postgresql_using="gin", postgresql_ops={"book_name": "gin_trgm_ops"})
+Index("idx_author_name_fts", func.to_tsvector(TS_NAME_CONFIG, Author.author_name), postgresql_using="gin")
+Index("idx_author_name_trgm", Author.author_name, postgresql_using="gin", postgresql_ops={"author_name": "gin_trgm_ops"})
+Index("idx_publisher_name_fts", func.to_tsvector(TS_NAME_CONFIG, Publisher.publisher_name), postgresql_using="gin")
+Index("idx_publisher_name_trgm", Publisher.publisher_name, postgresql_using="gin", postgresql_ops={"publisher_name": "gin_trgm_ops"})
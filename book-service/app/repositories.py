@@ -1,47 +1,464 @@
 from sqlalchemy.orm import aliased
-from sqlalchemy import select, join, func
-from models import Book, Author, Publisher, Category, book_publisher_table, book_authors_table
+from sqlalchemy import select, join, func, any_, bindparam, literal, Integer, String, insert, update, delete, or_, union_all
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from models import Book, Author, Publisher, Category, CatalogEntry, CatalogFacet, DimensionVersion
+from models import book_publisher_table, book_authors_table
+from models import TS_TITLE_CONFIG, TS_NAME_CONFIG
+from common.paging import stream_rows
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 console = logging.getLogger("book-repository")
 
+# Hot statements are built once, here, with bind parameters for everything
+# that varies per call. Executing the same statement object lets SQLAlchemy
+# reuse its compiled form without rebuilding joins/aliases, and keeps the SQL
+# text stable so asyncpg's prepared-statement cache is hit as well.
+# See benchmarks/bench_statements.py.
+
+_BOOK_IDS = bindparam("book_ids", type_=ARRAY(Integer))
+
+
+def _aggregate_details_stmt():
+    # book_id, book_name, category_id, category_name, authors[], publishers[]
+    # per book, aggregated from the normalised tables. Only used to (re)build
+    # book_details rows; reads go to book_details directly.
+    # Outer joins keep books that have no category, author or publisher yet;
+    # array_remove drops the NULL such a book would otherwise aggregate to.
+    b = aliased(Book)
+    c = aliased(Category)
+    a = aliased(Author)
+    p = aliased(Publisher)
+
+    stmt = (
+        select(
+            b.book_id,
+            b.book_name,
+            b.category_id,
+            c.category_name,
+            func.array_remove(func.array_agg(func.distinct(a.author_name)), None).label("authors"),
+            func.array_remove(func.array_agg(func.distinct(p.publisher_name)), None).label("publishers"),
+        )
+        .outerjoin(c, b.category_id == c.category_id)
+        .outerjoin(book_authors_table, b.book_id == book_authors_table.c.book_id)
+        .outerjoin(a, book_authors_table.c.author_id == a.author_id)
+        .outerjoin(book_publisher_table, b.book_id == book_publisher_table.c.book_id)
+        .outerjoin(p, book_publisher_table.c.publisher_id == p.publisher_id)
+        .group_by(b.book_id, b.book_name, b.category_id, c.category_name)
+    )
+    return stmt, b
+
+
+_DETAIL_COLUMNS = ["book_id", "book_name", "category_id", "category_name", "authors", "publishers"]
+
+
+def refresh_details_stmt(scoped=True):
+    # upsert book_details for the books bound to :book_ids, or for every book
+    # when scoped is False (init_db)
+    source, b = _aggregate_details_stmt()
+    if scoped:
+        source = source.where(b.book_id == any_(_BOOK_IDS))
+    # on the Core table: the ORM's bulk INSERT path does not take INSERT ... SELECT
+    table = CatalogEntry.__table__
+    stmt = pg_insert(table).from_select(_DETAIL_COLUMNS, source)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.book_id],
+        set_={name: stmt.excluded[name] for name in _DETAIL_COLUMNS[1:]},
+    )
+
+
+def facet_deltas_stmt(scoped=True):
+    # adds :sign * (each book's contribution to every facet) to catalog_facet,
+    # for the books bound to :book_ids, or the whole catalog when scoped is False
+    def scope(stmt, book_id_column):
+        if not scoped:
+            return stmt
+        return stmt.where(book_id_column == any_(_BOOK_IDS))
+
+    delta = func.count() * bindparam("sign", type_=Integer)
+    ba = book_authors_table.c
+    bp = book_publisher_table.c
+    deltas = union_all(
+        scope(select(literal("total"), literal(0), delta).select_from(Book), Book.book_id),
+        scope(
+            select(literal("category"), Book.category_id, delta)
+            .where(Book.category_id.isnot(None))
+            .group_by(Book.category_id),
+            Book.book_id,
+        ),
+        scope(select(literal("author"), ba.author_id, delta).group_by(ba.author_id), ba.book_id),
+        scope(select(literal("publisher"), bp.publisher_id, delta).group_by(bp.publisher_id), bp.book_id),
+    )
+    # on the Core table, like refresh_details_stmt
+    table = CatalogFacet.__table__
+    stmt = pg_insert(table).from_select(["facet", "facet_id", "book_count"], deltas)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.facet, table.c.facet_id],
+        set_={"book_count": table.c.book_count + stmt.excluded.book_count},
+    )
+
+
+# the row shape utils.to_book_details expects; a plain primary-key or
+# category_id index scan on book_details, no joins or grouping
+_DETAILS_SELECT = select(
+    CatalogEntry.book_id,
+    CatalogEntry.book_name,
+    CatalogEntry.category_name,
+    CatalogEntry.authors,
+    CatalogEntry.publishers,
+)
+
+
+def _name_match(column, config, term):
+    # (filter, score) for one searchable name column: full-text match on the
+    # GIN tsvector index, or a trigram word match (typo tolerance) on the
+    # gin_trgm_ops index
+    vector = func.to_tsvector(config, column)
+    query = func.websearch_to_tsquery(config, term)
+    matches = or_(vector.op("@@")(query), column.op("%>")(term))
+    score = func.ts_rank(vector, query) + func.word_similarity(term, column)
+    return matches, score
+
+
+def _search_stmt(in_category: bool):
+    # binds :term, :limit, :offset and, when in_category, :category_id
+    term = bindparam("term", type_=String)
+
+    title_match, title_score = _name_match(Book.book_name, TS_TITLE_CONFIG, term)
+    author_match, author_score = _name_match(Author.author_name, TS_NAME_CONFIG, term)
+    publisher_match, publisher_score = _name_match(Publisher.publisher_name, TS_NAME_CONFIG, term)
+
+    # every index hit, from whichever table it came from, as (book_id, score)
+    hits = union_all(
+        select(Book.book_id.label("book_id"), title_score.label("score")).where(title_match),
+        select(book_authors_table.c.book_id, author_score)
+        .join_from(Author, book_authors_table, book_authors_table.c.author_id == Author.author_id)
+        .where(author_match),
+        select(book_publisher_table.c.book_id, publisher_score)
+        .join_from(Publisher, book_publisher_table, book_publisher_table.c.publisher_id == Publisher.publisher_id)
+        .where(publisher_match),
+    ).subquery("hits")
+
+    ranked = select(hits.c.book_id, func.max(hits.c.score).label("score")).group_by(hits.c.book_id)
+    if in_category:
+        ranked = ranked.join(Book, Book.book_id == hits.c.book_id).where(
+            Book.category_id == bindparam("category_id", type_=Integer)
+        )
+    ranked = (
+        ranked.order_by(func.max(hits.c.score).desc(), hits.c.book_id)
+        .limit(bindparam("limit", type_=Integer))
+        .offset(bindparam("offset", type_=Integer))
+        .subquery("ranked")
+    )
+
+    # only the requested page is joined out to full book details
+    return (
+        _DETAILS_SELECT.join(ranked, ranked.c.book_id == CatalogEntry.book_id)
+        .order_by(ranked.c.score.desc(), CatalogEntry.book_id)
+    )
+
+
+# -- book reads
+_BOOK_BY_ID = select(Book).where(Book.book_id == bindparam("book_id"))
+# UpdateBook/DeleteBook hold this row lock while they move the book's facet
+# counts, so a concurrent or retried call waits and then sees the new row
+_LOCK_BOOK = _BOOK_BY_ID.with_for_update().execution_options(populate_existing=True)
+_BOOK_DETAILS_BY_ID = _DETAILS_SELECT.where(CatalogEntry.book_id == bindparam("book_id"))
+_BOOK_DETAILS_BY_IDS = _DETAILS_SELECT.where(CatalogEntry.book_id == any_(_BOOK_IDS))
+_ALL_BOOK_DETAILS = _DETAILS_SELECT.order_by(CatalogEntry.book_id)
+# keyset page: the primary key index drives both the filter and the ordering,
+# so page N costs the same as page 1
+_BOOK_DETAILS_AFTER = (
+    _DETAILS_SELECT.where(CatalogEntry.book_id > bindparam("after_id"))
+    .order_by(CatalogEntry.book_id)
+    .limit(bindparam("limit", type_=Integer))
+)
+_SEARCH = _search_stmt(in_category=False)
+_SEARCH_IN_CATEGORY = _search_stmt(in_category=True)
+
+# -- book writes
+_INSERT_BOOKS = insert(Book).returning(Book.book_id, sort_by_parameter_order=True)
+_LINK_AUTHOR = pg_insert(book_authors_table).on_conflict_do_nothing()
+_LINK_PUBLISHER = pg_insert(book_publisher_table).on_conflict_do_nothing()
+_UNLINK_AUTHORS = delete(book_authors_table).where(book_authors_table.c.book_id == bindparam("book_id"))
+_UNLINK_PUBLISHERS = delete(book_publisher_table).where(book_publisher_table.c.book_id == bindparam("book_id"))
+_DELETE_BOOK = delete(Book).where(Book.book_id == bindparam("book_id"))
+_REFRESH_DETAILS = refresh_details_stmt()
+_FACET_DELTAS = facet_deltas_stmt()
+
+# -- dimension tables (only the ones ImportBooks resolves)
+_EXISTING_IDS = {
+    model: select(pk).where(pk == any_(bindparam("ids", type_=ARRAY(Integer))))
+    for model, pk in (
+        (Category, Category.category_id),
+        (Author, Author.author_id),
+        (Publisher, Publisher.publisher_id),
+    )
+}
+_IDS_BY_NAME = {
+    model: select(name, func.min(pk))
+    .where(name == any_(bindparam("names", type_=ARRAY(String))))
+    .group_by(name)
+    for model, pk, name in (
+        (Author, Author.author_id, Author.author_name),
+        (Publisher, Publisher.publisher_id, Publisher.publisher_name),
+    )
+}
+# (statement, name column key)
+_INSERT_NAMES = {
+    Author: (insert(Author).returning(Author.author_name, Author.author_id), "author_name"),
+    Publisher: (insert(Publisher).returning(Publisher.publisher_name, Publisher.publisher_id), "publisher_name"),
+}
+
+# -- categories, facets, dimension versions
+_CATEGORY_BY_ID = select(Category).where(Category.category_id == bindparam("category_id"))
+_RENAME_CATEGORY_DETAILS = (
+    update(CatalogEntry)
+    .where(CatalogEntry.category_id == bindparam("old_category_id"))
+    .values(category_name=bindparam("new_category_name"))
+)
+_UNCATEGORISE_BOOKS = (
+    update(Book).where(Book.category_id == bindparam("old_category_id")).values(category_id=None)
+)
+_UNCATEGORISE_DETAILS = (
+    update(CatalogEntry)
+    .where(CatalogEntry.category_id == bindparam("old_category_id"))
+    .values(category_id=None, category_name=None)
+)
+_DROP_FACET = delete(CatalogFacet).where(
+    CatalogFacet.facet == bindparam("facet"), CatalogFacet.facet_id == bindparam("facet_id")
+)
+_FACET_COUNTS = select(CatalogFacet.facet, CatalogFacet.facet_id, CatalogFacet.book_count).where(
+    CatalogFacet.book_count > 0
+)
+_BUMP_VERSION = (
+    pg_insert(DimensionVersion)
+    .values(dimension=bindparam("dimension"), version=1)
+    .on_conflict_do_update(
+        index_elements=[DimensionVersion.dimension],
+        set_={"version": DimensionVersion.version + 1},
+    )
+)
+_DIMENSION_VERSIONS = select(DimensionVersion.dimension, DimensionVersion.version)
+
+
 class BookRepository:
 
     @staticmethod
     async def create(session, book: Book):
         session.add(book)
+        await session.flush()
+        return book
+
+    @staticmethod
+    async def add_links(session, book_id: int, author_id: int = None, publisher_id: int = None):
+        # AddBook/UpdateBook carry at most one author and one publisher;
+        # linking an already-linked one is a no-op
+        if author_id:
+            await session.execute(_LINK_AUTHOR, {"book_id": book_id, "author_id": author_id})
+        if publisher_id:
+            await session.execute(_LINK_PUBLISHER, {"book_id": book_id, "publisher_id": publisher_id})
+
+    @staticmethod
+    async def create_many(session, books):
+        # books is a list of {"book_name", "category_id"} dicts. SQLAlchemy
+        # batches this into multi-row INSERT ... RETURNING statements, and
+        # sort_by_parameter_order keeps the returned ids in input order.
+        result = await session.execute(_INSERT_BOOKS, books)
+        return result.scalars().all()
+
+    @staticmethod
+    async def add_links_many(session, author_links, publisher_links):
+        # lists of {"book_id", "author_id"} / {"book_id", "publisher_id"} dicts
+        if author_links:
+            await session.execute(_LINK_AUTHOR, author_links)
+        if publisher_links:
+            await session.execute(_LINK_PUBLISHER, publisher_links)
+
+    @staticmethod
+    async def existing_ids(session, model, ids):
+        # the subset of ids present in model's (Category/Author/Publisher) table
+        if not ids:
+            return set()
+        result = await session.execute(_EXISTING_IDS[model], {"ids": list(ids)})
+        return set(result.scalars().all())
+
+    @staticmethod
+    async def resolve_names(session, model, names):
+        # name -> id for Author or Publisher, inserting the names that do not
+        # exist yet. Names are not unique in these tables, so an existing
+        # duplicate resolves to its lowest id.
+        if not names:
+            return {}
+        result = await session.execute(_IDS_BY_NAME[model], {"names": list(names)})
+        ids = dict(result.all())
+        missing = [name for name in names if name not in ids]
+        if missing:
+            stmt, name_key = _INSERT_NAMES[model]
+            result = await session.execute(stmt, [{name_key: name} for name in missing])
+            ids.update(result.all())
+            await DimensionRepository.bump_version(session, model.__tablename__)
+        return ids
+
+    @staticmethod
+    async def refresh_details(session, book_ids):
+        # call after any change to a book or its author/publisher links,
+        # inside the same transaction
+        await session.execute(_REFRESH_DETAILS, {"book_ids": list(book_ids)})
+
+    @staticmethod
+    async def update_book(session, book_id: int, **fields):
+        book = await BookRepository.get_by_id(session, book_id)
+        if not book:
+            return None
+        for k, v in fields.items():
+            if hasattr(book, k) and v:
+                setattr(book, k, v)
+        await session.flush()
+        return book
+
+    @staticmethod
+    async def delete_book(session, book_id: int):
+        book = await BookRepository.get_by_id(session, book_id)
+        if not book:
+            return None
+        params = {"book_id": book_id}
+        await session.execute(_UNLINK_AUTHORS, params)
+        await session.execute(_UNLINK_PUBLISHERS, params)
+        # Core delete: session.delete() would lazy-load the many-to-many
+        # collections, which the async session cannot do. book_details
+        # follows through ON DELETE CASCADE.
+        await session.execute(_DELETE_BOOK, params)
         return book
 
+    @staticmethod
+    async def lock_by_id(session, book_id: int):
+        # the book, locked until the transaction ends; None if it does not exist
+        result = await session.execute(_LOCK_BOOK, {"book_id": book_id})
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def get_by_id(session, book_id: int):
-        stmt = select(Book).where(Book.book_id == book_id)
-        result = await session.execute(stmt)
+        result = await session.execute(_BOOK_BY_ID, {"book_id": book_id})
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def get_details_by_id(session, book_id: int):
+        result = await session.execute(_BOOK_DETAILS_BY_ID, {"book_id": book_id})
+        return result.first()
+
     @staticmethod
     async def get_all_books(session):
         console.info("Fetching all books with related data")
-        b = aliased(Book)
-        c = aliased(Category)
-        a = aliased(Author)
-        p = aliased(Publisher)
-
-        stmt = (
-            select(
-                b.book_id,
-                b.book_name,
-                c.category_name,
-                func.array_agg(func.distinct(a.author_name)).label("authors"),
-                func.array_agg(func.distinct(p.publisher_name)).label("publishers"),
+        result = await session.execute(_ALL_BOOK_DETAILS)
+        return result.all()
+
+    @staticmethod
+    async def get_books_by_ids(session, book_ids):
+        # one bound array parameter instead of an expanding IN list, so the
+        # statement text is the same for any number of ids
+        result = await session.execute(_BOOK_DETAILS_BY_IDS, {"book_ids": list(book_ids)})
+        return result.all()
+
+    @staticmethod
+    async def get_books_page(session, after_id: int, limit: int):
+        result = await session.execute(_BOOK_DETAILS_AFTER, {"after_id": after_id, "limit": limit})
+        return result.all()
+
+    @staticmethod
+    async def search_books(session, term: str, category_id: int, limit: int, offset: int):
+        params = {"term": term, "limit": limit, "offset": offset}
+        if category_id:
+            params["category_id"] = category_id
+            result = await session.execute(_SEARCH_IN_CATEGORY, params)
+        else:
+            result = await session.execute(_SEARCH, params)
+        return result.all()
+
+    @staticmethod
+    def stream_books(session, after_id: int, limit: int):
+        return stream_rows(session, _BOOK_DETAILS_AFTER, {"after_id": after_id, "limit": limit})
+
+
+class CategoryRepository:
+
+    @staticmethod
+    async def create(session, category: Category):
+        session.add(category)
+        await session.flush()
+        await DimensionRepository.bump_version(session, "category")
+        return category
+
+    @staticmethod
+    async def get_by_id(session, category_id: int):
+        result = await session.execute(_CATEGORY_BY_ID, {"category_id": category_id})
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    async def update_category(session, category_id: int, category_name: str):
+        category = await CategoryRepository.get_by_id(session, category_id)
+        if not category:
+            return None
+        if category_name:
+            category.category_name = category_name
+            await session.execute(
+                _RENAME_CATEGORY_DETAILS,
+                {"old_category_id": category_id, "new_category_name": category_name},
             )
-            .join(c, b.category_id == c.category_id)
-            .join(book_authors_table, b.book_id == book_authors_table.c.book_id)
-            .join(a, book_authors_table.c.author_id == a.author_id)
-            .join(book_publisher_table, b.book_id == book_publisher_table.c.book_id)
-            .join(p, book_publisher_table.c.publisher_id == p.publisher_id)
-            .group_by(b.book_id, b.book_name, c.category_name)
-        )
-        result = await session.execute(stmt)
+        await session.flush()
+        await DimensionRepository.bump_version(session, "category")
+        return category
+
+    @staticmethod
+    async def delete_category(session, category_id: int):
+        category = await CategoryRepository.get_by_id(session, category_id)
+        if not category:
+            return None
+        # books in the category stay in the catalog, uncategorised
+        params = {"old_category_id": category_id}
+        await session.execute(_UNCATEGORISE_BOOKS, params)
+        await session.execute(_UNCATEGORISE_DETAILS, params)
+        await FacetRepository.drop_facet(session, "category", category_id)
+        await session.delete(category)
+        await session.flush()
+        await DimensionRepository.bump_version(session, "category")
+        return category
+
+
+class FacetRepository:
+
+    @staticmethod
+    async def add_books(session, book_ids):
+        # call after the books and their links are written
+        await session.execute(_FACET_DELTAS, {"book_ids": list(book_ids), "sign": 1})
+
+    @staticmethod
+    async def remove_books(session, book_ids):
+        # call before the books or their links are changed or deleted
+        await session.execute(_FACET_DELTAS, {"book_ids": list(book_ids), "sign": -1})
+
+    @staticmethod
+    async def drop_facet(session, facet: str, facet_id: int):
+        await session.execute(_DROP_FACET, {"facet": facet, "facet_id": facet_id})
+
+    @staticmethod
+    async def get_counts(session):
+        result = await session.execute(_FACET_COUNTS)
         return result.all()
- 
\ No newline at end of file
+
+
+class DimensionRepository:
+
+    @staticmethod
+    async def bump_version(session, dimension: str):
+        await session.execute(_BUMP_VERSION, {"dimension": dimension})
+
+    @staticmethod
+    async def get_versions(session):
+        result = await session.execute(_DIMENSION_VERSIONS)
+        return dict(result.all())
+
+    @staticmethod
+    async def load_names(session, id_column, name_column):
+        result = await session.execute(select(id_column, name_column))
+        return dict(result.all())
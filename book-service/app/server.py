@@ -2,19 +2,30 @@
 import asyncio
 from grpc.experimental import aio
 from opentelemetry.instrumentation.grpc import GrpcInstrumentorServer
-from common.telemetry import setup_tracing
+from common.telemetry import setup_tracing, setup_metrics
 import book_pb2_grpc
 from service import BookService
+from dimensions import refresh_forever
 
 setup_tracing("book-service")
+setup_metrics("book-service")
 GrpcInstrumentorServer().instrument()
 
+# let clients keep idle connections alive with pings (reservation-service
+# pings every 30s); the default minimum is 5 minutes
+SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_recv_ping_interval_without_data_ms", 20000),
+]
+
 async def serve():
-    server = aio.server()
+    server = aio.server(options=SERVER_OPTIONS)
     #register service here
     book_pb2_grpc.add_BookServiceServicer_to_server(BookService(), server)
     server.add_insecure_port("[::]:5002")
     await server.start()
+    # loads the category/author/publisher dictionaries now, then polls for changes
+    dimension_refresh = asyncio.create_task(refresh_forever())
     print("book-service running")
     await server.wait_for_termination()
 
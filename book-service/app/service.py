@@ -1,14 +1,95 @@
 import book_pb2
 import book_pb2_grpc
-from models import Book
-from repositories import BookRepository
+from models import Book, Category, Author, Publisher
+from repositories import BookRepository, CategoryRepository, FacetRepository
 from database import get_session
 from opentelemetry import trace
 from collections import defaultdict
-from utils import map_to_proto
+from utils import map_to_proto, to_book_details
+from common.paging import clamp_page_size, decode_page_token, keyset_page, offset_page, stream_in_batches
+from common.ingest import ingest_stream
+import dimensions
+from cache import book_cache, catalog_cache, invalidate_book, invalidate_books, invalidate_catalog, ALL_BOOKS
 
 tracer = trace.get_tracer(__name__)
 
+MAX_BATCH_IDS = 1000
+
+
+def clean_names(names):
+    return {name.strip() for name in names if name.strip()}
+
+
+def import_row_problem(row, known_categories, known_authors, known_publishers):
+    if not row.book_name.strip():
+        return "book_name is required"
+    if row.category_id and row.category_id not in known_categories:
+        return f"unknown category_id {row.category_id}"
+    unknown_authors = set(row.author_id) - known_authors
+    if unknown_authors:
+        return f"unknown author_id {sorted(unknown_authors)}"
+    unknown_publishers = set(row.publisher_id) - known_publishers
+    if unknown_publishers:
+        return f"unknown publisher_id {sorted(unknown_publishers)}"
+    return None
+
+
+async def import_batch(batch):
+    # Writes one batch of (row_number, ImportBookRow) in a single transaction
+    # and returns (new book_ids, {row_number: error}). Invalid rows are skipped;
+    # if the transaction itself fails every remaining row is rejected.
+    rejected = {}
+    valid = batch
+    try:
+        async with get_session() as session:
+            known_categories = await BookRepository.existing_ids(
+                session, Category, {row.category_id for _, row in batch if row.category_id}
+            )
+            known_authors = await BookRepository.existing_ids(
+                session, Author, {a for _, row in batch for a in row.author_id}
+            )
+            known_publishers = await BookRepository.existing_ids(
+                session, Publisher, {p for _, row in batch for p in row.publisher_id}
+            )
+
+            valid = []
+            for row_number, row in batch:
+                problem = import_row_problem(row, known_categories, known_authors, known_publishers)
+                if problem:
+                    rejected[row_number] = problem
+                else:
+                    valid.append((row_number, row))
+            if not valid:
+                return [], rejected
+
+            author_ids = await BookRepository.resolve_names(
+                session, Author, clean_names(n for _, row in valid for n in row.author_name)
+            )
+            publisher_ids = await BookRepository.resolve_names(
+                session, Publisher, clean_names(n for _, row in valid for n in row.publisher_name)
+            )
+
+            book_ids = await BookRepository.create_many(session, [
+                {"book_name": row.book_name.strip(), "category_id": row.category_id or None}
+                for _, row in valid
+            ])
+
+            author_links = []
+            publisher_links = []
+            for book_id, (_, row) in zip(book_ids, valid):
+                authors = set(row.author_id) | {author_ids[n] for n in clean_names(row.author_name)}
+                publishers = set(row.publisher_id) | {publisher_ids[n] for n in clean_names(row.publisher_name)}
+                author_links.extend({"book_id": book_id, "author_id": a} for a in authors)
+                publisher_links.extend({"book_id": book_id, "publisher_id": p} for p in publishers)
+            await BookRepository.add_links_many(session, author_links, publisher_links)
+            await BookRepository.refresh_details(session, book_ids)
+            await FacetRepository.add_books(session, book_ids)
+        return book_ids, rejected
+    except Exception as e:
+        for row_number, _ in valid:
+            rejected[row_number] = f"batch failed: {e}"
+        return [], rejected
+
 class BookService(book_pb2_grpc.BookServiceServicer):
 
     async def AddBook(self, request, context):
@@ -16,37 +97,291 @@ class BookService(book_pb2_grpc.BookServiceServicer):
             async with get_session() as session:
                 book = Book(
                     book_name=request.book_name,
-                    category_id=request.category_id
+                    category_id=request.category_id or None
                 )
                 await BookRepository.create(session, book)
-                # BookResponse proto only contains book_id and book_name
-                return book_pb2.BookResponse(
-                    book_id=book.book_id,
-                    book_name=book.book_name,
+                await BookRepository.add_links(session, book.book_id, request.author_id, request.publisher_id)
+                await BookRepository.refresh_details(session, [book.book_id])
+                await FacetRepository.add_books(session, [book.book_id])
+            # invalidate only once the transaction has committed
+            invalidate_book(book.book_id)
+            # BookResponse proto only contains book_id and book_name
+            return book_pb2.BookResponse(
+                book_id=book.book_id,
+                book_name=book.book_name,
+            )
+
+    async def UpdateBook(self, request, context):
+        with tracer.start_as_current_span("update_book"):
+            async with get_session() as session:
+                if not await BookRepository.lock_by_id(session, request.book_id):
+                    context.set_code(5)  # NOT_FOUND
+                    context.set_details("Book not found")
+                    return book_pb2.BookResponse()
+                # with the row locked, take the book's old category/author/
+                # publisher out of the facet counts, change it, add it back
+                await FacetRepository.remove_books(session, [request.book_id])
+                book = await BookRepository.update_book(
+                    session,
+                    request.book_id,
+                    book_name=request.book_name,
+                    category_id=request.category_id
                 )
+                await BookRepository.add_links(session, book.book_id, request.author_id, request.publisher_id)
+                await BookRepository.refresh_details(session, [book.book_id])
+                await FacetRepository.add_books(session, [book.book_id])
+            invalidate_book(book.book_id)
+            return book_pb2.BookResponse(book_id=book.book_id, book_name=book.book_name)
 
-    async def GetBook(self, request, context):
-        with tracer.start_as_current_span("get_book"):
+    async def DeleteBook(self, request, context):
+        with tracer.start_as_current_span("delete_book"):
             async with get_session() as session:
-                book = await BookRepository.get_by_id(session, request.book_id)
-                if not book:
+                if not await BookRepository.lock_by_id(session, request.book_id):
                     context.set_code(5)  # NOT_FOUND
                     context.set_details("Book not found")
-                    return book_pb2.GetBookResponse()
+                    return book_pb2.BookResponse()
+                await FacetRepository.remove_books(session, [request.book_id])
+                book = await BookRepository.delete_book(session, request.book_id)
+            invalidate_book(book.book_id)
+            return book_pb2.BookResponse(book_id=book.book_id, book_name=book.book_name)
+
+    async def GetBook(self, request, context):
+        with tracer.start_as_current_span("get_book"):
+            # taken before the read: a write that invalidates the book while
+            # this read is in flight keeps it from being cached
+            generation = book_cache.generation(request.book_id)
+            cached = book_cache.get(request.book_id)
+            if cached is not None:
+                return book_pb2.GetBookResponse(book=cached)
+
+            async with get_session() as session:
+                row = await BookRepository.get_details_by_id(session, request.book_id)
+            if not row:
+                context.set_code(5)  # NOT_FOUND
+                context.set_details("Book not found")
+                return book_pb2.GetBookResponse()
+
+            # category, authors and publishers come from the same book_details row
+            book_details = to_book_details(row)
+            book_cache.set(row.book_id, book_details, generation)
+            return book_pb2.GetBookResponse(book=book_details)
 
-                # Return GetBookResponse containing BookDetails (which includes category_name)
-                book_details = book_pb2.BookDetails(
-                    book_id=book.book_id,
-                    book_name=book.book_name,
-                    category_name=getattr(book, "category_name", "")
-                )
-                return book_pb2.GetBookResponse(book=book_details)
-            
     async def GetAllBooks(self, request, context):
         with tracer.start_as_current_span("get_all_books"):
+            generation = catalog_cache.generation(ALL_BOOKS)
+            cached = catalog_cache.get(ALL_BOOKS)
+            if cached is not None:
+                return cached
+
             async with get_session() as session:
                 rows = await BookRepository.get_all_books(session)
-                response = map_to_proto(rows)
-                return response
+            response = map_to_proto(rows)
+            catalog_cache.set(ALL_BOOKS, response, generation)
+            return response
+
+    async def GetBooks(self, request, context):
+        with tracer.start_as_current_span("get_books"):
+            book_ids = set(request.book_id)
+            if len(book_ids) > MAX_BATCH_IDS:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details(f"At most {MAX_BATCH_IDS} book ids per request")
+                return book_pb2.GetBooksResponse()
+            if not book_ids:
+                return book_pb2.GetBooksResponse()
+
+            generations = {book_id: book_cache.generation(book_id) for book_id in book_ids}
+            books = {}
+            for book_id in book_ids:
+                cached = book_cache.get(book_id)
+                if cached is not None:
+                    books[book_id] = cached
+
+            uncached = book_ids - books.keys()
+            if uncached:
+                async with get_session() as session:
+                    rows = await BookRepository.get_books_by_ids(session, uncached)
+                for row in rows:
+                    book_details = to_book_details(row)
+                    book_cache.set(row.book_id, book_details, generations[row.book_id])
+                    books[row.book_id] = book_details
+
+            missing = sorted(book_ids - books.keys())
+            return book_pb2.GetBooksResponse(books=books, missing_book_id=missing)
+
+    async def ListBooks(self, request, context):
+        with tracer.start_as_current_span("list_books"):
+            page_size = clamp_page_size(request.page_size)
+            try:
+                after_id = decode_page_token(request.page_token)
+            except ValueError:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("Invalid page_token")
+                return book_pb2.ListBooksResponse()
+
+            async with get_session() as session:
+                rows, next_page_token = await keyset_page(
+                    lambda after_id, limit: BookRepository.get_books_page(session, after_id, limit),
+                    after_id, page_size, key=lambda row: row.book_id,
+                )
+            return book_pb2.ListBooksResponse(
+                book=[to_book_details(row) for row in rows],
+                next_page_token=next_page_token,
+            )
+
+    async def SearchBooks(self, request, context):
+        with tracer.start_as_current_span("search_books"):
+            term = request.query.strip()
+            if not term:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("query is required")
+                return book_pb2.SearchBooksResponse()
+            page_size = clamp_page_size(request.page_size)
+            try:
+                offset = decode_page_token(request.page_token)
+            except ValueError:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("Invalid page_token")
+                return book_pb2.SearchBooksResponse()
+
+            async with get_session() as session:
+                rows, next_page_token = await offset_page(
+                    lambda offset, limit: BookRepository.search_books(session, term, request.category_id, limit, offset),
+                    offset, page_size,
+                )
+            return book_pb2.SearchBooksResponse(
+                book=[to_book_details(row) for row in rows],
+                next_page_token=next_page_token,
+            )
+
+    async def StreamBooks(self, request, context):
+        with tracer.start_as_current_span("stream_books"):
+            batch_size = clamp_page_size(request.batch_size)
+            after_id = max(request.after_book_id, 0)
+            rows = stream_in_batches(
+                get_session, BookRepository.stream_books, after_id, batch_size, key=lambda row: row.book_id
+            )
+            async for row in rows:
+                yield to_book_details(row)
+
+    async def ImportBooks(self, request_iterator, context):
+        with tracer.start_as_current_span("import_books"):
+            async def write_batch(batch):
+                book_ids, rejected = await import_batch(batch)
+                if book_ids:
+                    invalidate_books(book_ids)
+                return book_ids, rejected
+
+            result = await ingest_stream(request_iterator, write_batch)
+            # new author/publisher names may have been created
+            await dimensions.refresh_after_write()
+
+            return book_pb2.ImportBooksResponse(
+                imported_count=result.written,
+                rejected_count=result.rejected_count,
+                error=[book_pb2.ImportRowError(row_number=row_number, error=error) for row_number, error in result.errors],
+                elapsed_seconds=result.elapsed_seconds,
+                rows_per_second=result.rows_per_second,
+            )
+
+    async def GetCatalogFacets(self, request, context):
+        with tracer.start_as_current_span("get_catalog_facets"):
+            async with get_session() as session:
+                rows = await FacetRepository.get_counts(session)
+            for dimension in dimensions.DIMENSIONS:
+                await dimensions.ensure_loaded(dimension)
+
+            response = book_pb2.GetCatalogFacetsResponse()
+            facet_lists = {
+                "category": (response.category, dimensions.categories),
+                "author": (response.author, dimensions.authors),
+                "publisher": (response.publisher, dimensions.publishers),
+            }
+            for facet, facet_id, book_count in rows:
+                if facet == "total":
+                    response.total_books = book_count
+                    continue
+                counts, names = facet_lists[facet]
+                counts.add(id=facet_id, name=names.get(facet_id) or "", book_count=book_count)
+            for counts, _ in facet_lists.values():
+                counts.sort(key=lambda c: (-c.book_count, c.id))
+            return response
+
+    async def AddCategory(self, request, context):
+        with tracer.start_as_current_span("add_category"):
+            async with get_session() as session:
+                category = Category(category_name=request.category_name)
+                await CategoryRepository.create(session, category)
+            await dimensions.refresh_after_write()
+            return book_pb2.CategoryResponse(
+                category_id=category.category_id,
+                category_name=category.category_name,
+            )
+
+    async def UpdateCategory(self, request, context):
+        with tracer.start_as_current_span("update_category"):
+            async with get_session() as session:
+                category = await CategoryRepository.update_category(
+                    session, request.category_id, request.category_name
+                )
+                if not category:
+                    context.set_code(5)  # NOT_FOUND
+                    context.set_details("Category not found")
+                    return book_pb2.CategoryResponse()
+            # category_name is denormalised into every cached BookDetails
+            invalidate_catalog()
+            await dimensions.refresh_after_write()
+            return book_pb2.CategoryResponse(
+                category_id=category.category_id,
+                category_name=category.category_name,
+            )
+
+    async def DeleteCategory(self, request, context):
+        with tracer.start_as_current_span("delete_category"):
+            async with get_session() as session:
+                category = await CategoryRepository.delete_category(session, request.category_id)
+                if not category:
+                    context.set_code(5)  # NOT_FOUND
+                    context.set_details("Category not found")
+                    return book_pb2.CategoryResponse()
+            invalidate_catalog()
+            await dimensions.refresh_after_write()
+            return book_pb2.CategoryResponse(
+                category_id=category.category_id,
+                category_name=category.category_name,
+            )
+
+    async def GetAllCategories(self, request, context):
+        with tracer.start_as_current_span("get_all_categories"):
+            await dimensions.ensure_loaded(dimensions.categories)
+            return book_pb2.GetAllCategoriesResponse(category=[
+                book_pb2.CategoryDetails(category_id=category_id, category_name=name)
+                for category_id, name in dimensions.categories.items()
+            ])
+
+    async def GetCategory(self, request, context):
+        with tracer.start_as_current_span("get_category"):
+            await dimensions.ensure_loaded(dimensions.categories)
+            name = dimensions.categories.get(request.category_id)
+            if name is None:
+                context.set_code(5)  # NOT_FOUND
+                context.set_details("Category not found")
+                return book_pb2.GetCategoryResponse()
+            return book_pb2.GetCategoryResponse(
+                category=book_pb2.CategoryDetails(category_id=request.category_id, category_name=name)
+            )
+
+    async def GetAllAuthors(self, request, context):
+        with tracer.start_as_current_span("get_all_authors"):
+            await dimensions.ensure_loaded(dimensions.authors)
+            return book_pb2.GetAllAuthorsResponse(author=[
+                book_pb2.AuthorDetails(author_id=author_id, author_name=name)
+                for author_id, name in dimensions.authors.items()
+            ])
 
-    
+    async def GetAllPublishers(self, request, context):
+        with tracer.start_as_current_span("get_all_publishers"):
+            await dimensions.ensure_loaded(dimensions.publishers)
+            return book_pb2.GetAllPublishersResponse(publisher=[
+                book_pb2.PublisherDetails(publisher_id=publisher_id, publisher_name=name)
+                for publisher_id, name in dimensions.publishers.items()
+            ])
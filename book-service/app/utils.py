@@ -27,17 +27,17 @@ from book_pb2 import BookDetails, GetAllBooksResponse
 #             book_messages.append(book_msg)
 
 #         return GetAllBooksResponse(book=book_messages)
-def map_to_proto(rows):
-    book_messages = []
+def to_book_details(row):
+    book_id, book_name, category_name, authors, publishers = row
+    return BookDetails(
+        book_id=book_id,
+        book_name=book_name,
+        category_name=category_name or "",
+        author_name=authors or [],
+        publisher_name=publishers or []
+    )
 
-    for book_id, book_name, category_name, authors, publishers in rows:
-        book_msg = BookDetails(
-            book_id=book_id,
-            book_name=book_name,
-            category_name=category_name,
-            author_name=authors or [],
-            publisher_name=publishers or []
-        )
-        book_messages.append(book_msg)
 
+def map_to_proto(rows):
+    book_messages = [to_book_details(row) for row in rows]
     return GetAllBooksResponse(book=book_messages)
@@ -0,0 +1,104 @@
+"""Per-call SQLAlchemy overhead of building statements on every call vs once.
+
+Measures what happens in-process before a query reaches asyncpg: statement
+construction, cache-key generation and the compiled-cache lookup. No database
+is needed. Run from book-service/:
+
+    PYTHONPATH=..:app python benchmarks/bench_statements.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import select, func, any_, bindparam, Integer
+from sqlalchemy.orm import aliased
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+import repositories
+from models import Book, Author, Publisher, Category, CatalogEntry, book_authors_table, book_publisher_table
+
+DIALECT = asyncpg_dialect()
+CALLS = 2000
+
+
+def legacy_get_all_books():
+    # get_all_books as it was: four aliased() entities, joins and group-by per call
+    b = aliased(Book)
+    c = aliased(Category)
+    a = aliased(Author)
+    p = aliased(Publisher)
+    return (
+        select(
+            b.book_id,
+            b.book_name,
+            c.category_name,
+            func.array_agg(func.distinct(a.author_name)).label("authors"),
+            func.array_agg(func.distinct(p.publisher_name)).label("publishers"),
+        )
+        .join(c, b.category_id == c.category_id)
+        .join(book_authors_table, b.book_id == book_authors_table.c.book_id)
+        .join(a, book_authors_table.c.author_id == a.author_id)
+        .join(book_publisher_table, b.book_id == book_publisher_table.c.book_id)
+        .join(p, book_publisher_table.c.publisher_id == p.publisher_id)
+        .group_by(b.book_id, b.book_name, c.category_name)
+    )
+
+
+def legacy_get_by_id():
+    return select(Book).where(Book.book_id == 42)
+
+
+def legacy_get_books_by_ids():
+    return select(
+        CatalogEntry.book_id, CatalogEntry.book_name, CatalogEntry.category_name,
+        CatalogEntry.authors, CatalogEntry.publishers,
+    ).where(CatalogEntry.book_id == any_(bindparam("book_ids", [1, 2, 3], type_=ARRAY(Integer))))
+
+
+def legacy_search():
+    return repositories._search_stmt(in_category=True)
+
+
+def legacy_refresh_details():
+    return repositories.refresh_details_stmt()
+
+
+def legacy_facet_deltas():
+    return repositories.facet_deltas_stmt()
+
+
+CASES = [
+    ("get_all_books", legacy_get_all_books, repositories._ALL_BOOK_DETAILS),
+    ("get_by_id", legacy_get_by_id, repositories._BOOK_BY_ID),
+    ("get_books_by_ids", legacy_get_books_by_ids, repositories._BOOK_DETAILS_BY_IDS),
+    ("search_books", legacy_search, repositories._SEARCH_IN_CATEGORY),
+    ("refresh_details", legacy_refresh_details, repositories._REFRESH_DETAILS),
+    ("facet_deltas", legacy_facet_deltas, repositories._FACET_DELTAS),
+]
+
+
+def per_call_us(make_stmt):
+    # what Connection.execute does up to the DBAPI call
+    cache = {}
+
+    def call():
+        make_stmt()._compile_w_cache(DIALECT, compiled_cache=cache, column_keys=[])
+
+    call()  # warm the compiled cache, as a running service would have
+    return timeit.timeit(call, number=CALLS) / CALLS * 1e6
+
+
+def main():
+    print(f"{'statement':<18}{'built per call':>16}{'built once':>14}{'speedup':>10}")
+    for name, legacy, prebuilt in CASES:
+        before = per_call_us(legacy)
+        after = per_call_us(lambda: prebuilt)
+        print(f"{name:<18}{before:>13.1f} us{after:>11.1f} us{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import asyncio
+
+import book_pb2
+from conftest import Context
+from database import get_session, AsyncSessionLocal
+from repositories import BookRepository, FacetRepository
+from service import BookService
+
+service = BookService()
+
+
+async def facet_counts():
+    async with get_session() as session:
+        return sorted(await FacetRepository.get_counts(session))
+
+
+async def add_book():
+    # a book in the seeded category, author and publisher 1, so it shows up
+    # in three facet counts
+    response = await service.AddBook(
+        book_pb2.AddBookRequest(book_name="facet test book", category_id=1, author_id=1, publisher_id=1),
+        Context(),
+    )
+    return response.book_id
+
+
+async def delete_book(book_id):
+    context = Context()
+    response = await service.DeleteBook(book_pb2.DeleteBookRequest(book_id=book_id), context)
+    return response.book_id, context.code
+
+
+def test_delete_missing_book_leaves_facets_alone(run):
+    async def test():
+        before = await facet_counts()
+        assert await delete_book(2_000_000_000) == (0, 5)
+        assert await facet_counts() == before
+
+    run(test())
+
+
+def test_repeated_delete_subtracts_once(run):
+    async def test():
+        before = await facet_counts()
+        book_id = await add_book()
+        assert await facet_counts() != before
+
+        assert await delete_book(book_id) == (book_id, None)
+        assert await delete_book(book_id) == (0, 5)
+        assert await facet_counts() == before
+
+    run(test())
+
+
+def test_concurrent_deletes_subtract_once(run):
+    async def test():
+        before = await facet_counts()
+        book_id = await add_book()
+
+        # hold the book's row lock so that both deletes are in flight at once
+        async with AsyncSessionLocal() as blocker:
+            await BookRepository.lock_by_id(blocker, book_id)
+            deletes = asyncio.gather(delete_book(book_id), delete_book(book_id))
+            await asyncio.sleep(0.5)
+            await blocker.rollback()
+        results = await deletes
+
+        assert sorted(results) == [(0, 5), (book_id, None)]
+        assert await facet_counts() == before
+
+    run(test())
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from opentelemetry import metrics
+
+# cached in place of a value for keys known not to exist
+NOT_FOUND = object()
+
+meter = metrics.get_meter(__name__)
+_instruments = {}
+
+
+def _counters(metric_prefix):
+    # one set of counters per prefix (e.g. "user_cache"), shared by every
+    # cache reporting under it and told apart by the "cache" attribute
+    if metric_prefix not in _instruments:
+        _instruments[metric_prefix] = (
+            meter.create_counter(f"{metric_prefix}.hits", description="Cache hits (positive and negative)"),
+            meter.create_counter(f"{metric_prefix}.misses", description="Cache misses"),
+            meter.create_counter(f"{metric_prefix}.evictions", description="Cache evictions (capacity, expiry or invalidation)"),
+        )
+    return _instruments[metric_prefix]
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after a per-entry TTL.
+
+    NOT_FOUND answers are kept for negative_ttl_seconds (ttl_seconds if not
+    given). Used from the asyncio event loop only, so no locking is needed.
+
+    A reader that awaits between reading the database and calling set()
+    takes generation(key) first and passes it to set(); if the key was
+    invalidated (or the cache cleared) in between, the value it read may
+    predate the write and is not stored.
+    """
+
+    def __init__(self, name, max_entries, ttl_seconds, negative_ttl_seconds=None, metric_prefix="cache"):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = ttl_seconds if negative_ttl_seconds is None else negative_ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        # key -> generation of its last invalidation, for the most recently
+        # invalidated keys; older keys report _floor, which is at least the
+        # generation of any key that was dropped from here
+        self._generations = OrderedDict()
+        self._last_generation = 0
+        self._floor = 0
+        self._attrs = {"cache": name}
+        self._hit_counter, self._miss_counter, self._eviction_counter = _counters(metric_prefix)
+
+    @property
+    def enabled(self):
+        return self.max_entries > 0
+
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key):
+        # returns the cached value, NOT_FOUND for a cached miss, or None
+        if not self.enabled:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[key]
+            self._eviction_counter.add(1, {**self._attrs, "reason": "expired"})
+            entry = None
+        if entry is None:
+            self.misses += 1
+            self._miss_counter.add(1, self._attrs)
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        self._hit_counter.add(1, {**self._attrs, "negative": entry[1] is NOT_FOUND})
+        return entry[1]
+
+    def generation(self, key):
+        return self._generations.get(key, self._floor)
+
+    def set(self, key, value, generation=None):
+        if not self.enabled:
+            return
+        if generation is not None and generation != self.generation(key):
+            return
+        ttl = self.negative_ttl_seconds if value is NOT_FOUND else self.ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._eviction_counter.add(1, {**self._attrs, "reason": "capacity"})
+
+    def invalidate(self, key):
+        if self._entries.pop(key, None) is not None:
+            self._eviction_counter.add(1, {**self._attrs, "reason": "invalidated"})
+        self._last_generation += 1
+        self._generations[key] = self._last_generation
+        self._generations.move_to_end(key)
+        while len(self._generations) > max(self.max_entries, 1):
+            _, dropped = self._generations.popitem(last=False)
+            self._floor = max(self._floor, dropped)
+
+    def clear(self):
+        if self._entries:
+            self._eviction_counter.add(len(self._entries), {**self._attrs, "reason": "invalidated"})
+            self._entries.clear()
+        # every key moves to a new generation
+        self._last_generation += 1
+        self._floor = self._last_generation
+        self._generations.clear()
@@ -0,0 +1,53 @@
+import time
+
+# rows written per transaction by the client-streaming bulk ingests
+# (CreateUsers, ImportBooks)
+INGEST_BATCH_SIZE = 1000
+# per-row errors echoed back by a bulk ingest; rejected_count is always exact
+MAX_REPORTED_ERRORS = 1000
+
+
+class IngestResult:
+    def __init__(self):
+        self.written = 0
+        self.rejected_count = 0
+        # (row_number, error) in row order, at most MAX_REPORTED_ERRORS
+        self.errors = []
+        self.elapsed_seconds = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.written / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+async def ingest_stream(rows, write_batch, batch_size=INGEST_BATCH_SIZE):
+    """Numbers rows from 1 and writes them batch_size at a time.
+
+    write_batch([(row_number, row)]) returns (written, {row_number: error}),
+    where written is a collection of whatever was created for the batch.
+    """
+    started = time.perf_counter()
+    result = IngestResult()
+
+    async def flush(batch):
+        written, rejected = await write_batch(batch)
+        result.written += len(written)
+        result.rejected_count += len(rejected)
+        for row_number in sorted(rejected):
+            if len(result.errors) >= MAX_REPORTED_ERRORS:
+                break
+            result.errors.append((row_number, rejected[row_number]))
+
+    batch = []
+    row_number = 0
+    async for row in rows:
+        row_number += 1
+        batch.append((row_number, row))
+        if len(batch) >= batch_size:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+
+    result.elapsed_seconds = time.perf_counter() - started
+    return result
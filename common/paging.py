@@ -0,0 +1,76 @@
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def clamp_page_size(page_size):
+    if page_size <= 0:
+        return DEFAULT_PAGE_SIZE
+    return min(page_size, MAX_PAGE_SIZE)
+
+
+def encode_page_token(position):
+    # position is the last id seen (keyset pages) or a row offset (search)
+    return str(position)
+
+
+def decode_page_token(page_token):
+    # empty token means "start from the beginning"; raises ValueError on garbage
+    if not page_token:
+        return 0
+    position = int(page_token)
+    if position < 0:
+        raise ValueError("page_token must not be negative")
+    return position
+
+# rows fetched per round trip when streaming through a server-side cursor
+STREAM_FETCH_SIZE = 500
+
+
+def _page(rows, page_size, next_position):
+    if len(rows) <= page_size:
+        return rows, ""
+    rows = rows[:page_size]
+    return rows, encode_page_token(next_position(rows))
+
+
+async def keyset_page(fetch, after_id, page_size, key):
+    """One keyset page: (rows, next_page_token).
+
+    fetch(after_id, limit) reads rows ordered by key(row) above after_id;
+    the token is the key of the last row returned.
+    """
+    # fetch one extra row to learn whether another page exists
+    rows = await fetch(after_id, page_size + 1)
+    return _page(rows, page_size, lambda rows: key(rows[-1]))
+
+
+async def offset_page(fetch, offset, page_size):
+    """One offset page (search results): (rows, next_page_token)."""
+    rows = await fetch(offset, page_size + 1)
+    return _page(rows, page_size, lambda rows: offset + page_size)
+
+
+async def stream_rows(session, statement, params):
+    # session.stream() opens a server-side cursor, so only STREAM_FETCH_SIZE
+    # rows are held in memory at a time regardless of the statement's limit
+    result = await session.stream(statement, params, execution_options={"yield_per": STREAM_FETCH_SIZE})
+    async for row in result:
+        yield row
+
+
+async def stream_in_batches(open_session, fetch_batch, after_id, batch_size, key):
+    """Yields every row above after_id in key order, batch_size at a time.
+
+    fetch_batch(session, after_id, limit) iterates one keyset batch.
+    """
+    while True:
+        # one short transaction per batch, so a slow consumer never pins a
+        # snapshot for the whole table
+        sent = 0
+        async with open_session() as session:
+            async for row in fetch_batch(session, after_id, batch_size):
+                yield row
+                after_id = key(row)
+                sent += 1
+        if sent < batch_size:
+            return
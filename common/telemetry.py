@@ -1,13 +1,27 @@
 
-from opentelemetry import trace
+from opentelemetry import trace, metrics
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+
+OTEL_COLLECTOR_ENDPOINT = "http://otel-collector:4317"
 
 def setup_tracing(service):
     provider = TracerProvider(resource=Resource.create({"service.name": service}))
     trace.set_tracer_provider(provider)
-    exporter = OTLPSpanExporter(endpoint="http://otel-collector:4317", insecure=True)
+    exporter = OTLPSpanExporter(endpoint=OTEL_COLLECTOR_ENDPOINT, insecure=True)
     provider.add_span_processor(BatchSpanProcessor(exporter))
     return trace.get_tracer(service)
+
+def setup_metrics(service):
+    # instruments created earlier through metrics.get_meter() are proxies and
+    # start exporting once this provider is installed
+    exporter = OTLPMetricExporter(endpoint=OTEL_COLLECTOR_ENDPOINT, insecure=True)
+    reader = PeriodicExportingMetricReader(exporter)
+    provider = MeterProvider(resource=Resource.create({"service.name": service}), metric_readers=[reader])
+    metrics.set_meter_provider(provider)
+    return metrics.get_meter(service)
@@ -2,7 +2,14 @@
 -- Drop existing tables if they exist
 -- =========================
 DROP TABLE IF EXISTS user_reservation CASCADE;
+DROP TABLE IF EXISTS user_reservation_archive CASCADE;
+DROP TABLE IF EXISTS reservation_archive CASCADE;
+DROP TABLE IF EXISTS book_inventory CASCADE;
+DROP TABLE IF EXISTS user_change CASCADE;
 DROP TABLE IF EXISTS reservation CASCADE;
+DROP TABLE IF EXISTS book_details CASCADE;
+DROP TABLE IF EXISTS dimension_version CASCADE;
+DROP TABLE IF EXISTS catalog_facet CASCADE;
 DROP TABLE IF EXISTS book_authors CASCADE;
 DROP TABLE IF EXISTS book_publisher CASCADE;
 DROP TABLE IF EXISTS book CASCADE;
@@ -29,6 +36,22 @@ CREATE TABLE user_member (
 CREATE INDEX idx_user_email ON user_member(email_id);
 CREATE INDEX idx_user_status ON user_member(status);
 
+-- SearchUsers: partial indexes over active members only
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_user_name_trgm ON user_member USING GIN (user_name gin_trgm_ops) WHERE status = 'ACTIVE';
+CREATE INDEX idx_user_email_prefix ON user_member (lower(email_id) text_pattern_ops) WHERE status = 'ACTIVE';
+CREATE INDEX idx_user_contactno_prefix ON user_member (contactno text_pattern_ops) WHERE status = 'ACTIVE';
+
+-- =========================
+-- User change log (WatchUsers)
+-- =========================
+CREATE TABLE user_change (
+    seq BIGSERIAL PRIMARY KEY,
+    user_id INT NOT NULL,
+    change_type VARCHAR(10) NOT NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- =========================
 -- Category Table
 -- =========================
@@ -80,6 +103,55 @@ CREATE TABLE book_authors (
     PRIMARY KEY (book_id, author_id)
 );
 
+-- =========================
+-- Book details read model (denormalised, maintained by book-service)
+-- =========================
+CREATE TABLE book_details (
+    book_id INT PRIMARY KEY REFERENCES book(book_id) ON DELETE CASCADE,
+    book_name VARCHAR(255) NOT NULL,
+    category_id INT,
+    category_name VARCHAR(100),
+    authors VARCHAR(255)[] NOT NULL DEFAULT '{}',
+    publishers VARCHAR(255)[] NOT NULL DEFAULT '{}'
+);
+
+CREATE INDEX idx_book_details_category ON book_details(category_id);
+
+-- =========================
+-- Dimension versions (bumped on category/author/publisher changes so
+-- book-service replicas reload their in-memory name dictionaries)
+-- =========================
+CREATE TABLE dimension_version (
+    dimension VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+-- =========================
+-- Catalog facet counts (books per category/author/publisher, plus 'total')
+-- =========================
+CREATE TABLE catalog_facet (
+    facet VARCHAR(20),
+    facet_id INT,
+    book_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (facet, facet_id)
+);
+
+-- =========================
+-- Catalog indexes (lookups by category/author/publisher and SearchBooks)
+-- =========================
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX idx_book_category ON book(category_id);
+CREATE INDEX idx_book_authors_author ON book_authors(author_id);
+CREATE INDEX idx_book_publisher_publisher ON book_publisher(publisher_id);
+
+CREATE INDEX idx_book_name_fts ON book USING GIN (to_tsvector('english', book_name));
+CREATE INDEX idx_book_name_trgm ON book USING GIN (book_name gin_trgm_ops);
+CREATE INDEX idx_author_name_fts ON author USING GIN (to_tsvector('simple', author_name));
+CREATE INDEX idx_author_name_trgm ON author USING GIN (author_name gin_trgm_ops);
+CREATE INDEX idx_publisher_name_fts ON publisher USING GIN (to_tsvector('simple', publisher_name));
+CREATE INDEX idx_publisher_name_trgm ON publisher USING GIN (publisher_name gin_trgm_ops);
+
 -- =========================
 -- Reservation Table
 -- =========================
@@ -100,6 +172,42 @@ CREATE TABLE user_reservation (
     PRIMARY KEY (reservation_id, book_id)
 );
 
+-- ListReservations filters; (user_id, reservation_id) also serves the keyset order
+CREATE INDEX idx_reservation_user ON reservation(user_id, reservation_id);
+CREATE INDEX idx_reservation_return_date ON reservation(reservation_return_date);
+CREATE INDEX idx_reservation_created_date ON reservation(reservation_created_date);
+CREATE INDEX idx_user_reservation_book ON user_reservation(book_id);
+
+-- =========================
+-- Copy inventory (books without a row are not tracked)
+-- =========================
+CREATE TABLE book_inventory (
+    book_id INT PRIMARY KEY,
+    total_copies INT NOT NULL,
+    available_copies INT NOT NULL,
+    CONSTRAINT ck_book_inventory_available CHECK (available_copies >= 0 AND available_copies <= total_copies)
+);
+
+-- =========================
+-- Reservation archive (PurgeReservations)
+-- =========================
+CREATE TABLE reservation_archive (
+    reservation_id INT PRIMARY KEY,
+    user_id INT,
+    reservation_created_date TIMESTAMP,
+    reservation_return_date TIMESTAMP,
+    archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE user_reservation_archive (
+    reservation_id INT,
+    book_id INT,
+    book_return_date TIMESTAMP,
+    PRIMARY KEY (reservation_id, book_id)
+);
+
+CREATE INDEX idx_reservation_archive_user ON reservation_archive(user_id);
+
 -- =========================
 -- Users Table Data Insertion
 -- =========================
@@ -203,6 +311,56 @@ INSERT INTO book_publisher (book_id, publisher_id) VALUES
 (9, 2),
 (10, 10);
 
+-- =========================
+-- Three copies of every seeded book
+-- =========================
+INSERT INTO book_inventory (book_id, total_copies, available_copies)
+SELECT book_id, 3, 3 FROM book;
+
+-- =========================
+-- Populate the book details read model from the rows above
+-- =========================
+INSERT INTO book_details (book_id, book_name, category_id, category_name, authors, publishers)
+SELECT
+    b.book_id,
+    b.book_name,
+    b.category_id,
+    c.category_name,
+    ARRAY_REMOVE(ARRAY_AGG(DISTINCT a.author_name), NULL),
+    ARRAY_REMOVE(ARRAY_AGG(DISTINCT p.publisher_name), NULL)
+FROM book b
+LEFT JOIN category c ON b.category_id = c.category_id
+LEFT JOIN book_authors ba ON b.book_id = ba.book_id
+LEFT JOIN author a ON ba.author_id = a.author_id
+LEFT JOIN book_publisher bp ON b.book_id = bp.book_id
+LEFT JOIN publisher p ON bp.publisher_id = p.publisher_id
+GROUP BY b.book_id, b.book_name, b.category_id, c.category_name
+ON CONFLICT (book_id) DO UPDATE SET
+    book_name = EXCLUDED.book_name,
+    category_id = EXCLUDED.category_id,
+    category_name = EXCLUDED.category_name,
+    authors = EXCLUDED.authors,
+    publishers = EXCLUDED.publishers;
+
+-- =========================
+-- Log a CREATE for every seeded user, so WatchUsers replays them
+-- =========================
+INSERT INTO user_change (user_id, change_type)
+SELECT user_id, 'CREATE' FROM user_member ORDER BY user_id;
+
+-- =========================
+-- Count the rows above into catalog_facet
+-- =========================
+DELETE FROM catalog_facet;
+INSERT INTO catalog_facet (facet, facet_id, book_count)
+SELECT 'total', 0, COUNT(*) FROM book
+UNION ALL
+SELECT 'category', category_id, COUNT(*) FROM book WHERE category_id IS NOT NULL GROUP BY category_id
+UNION ALL
+SELECT 'author', author_id, COUNT(*) FROM book_authors GROUP BY author_id
+UNION ALL
+SELECT 'publisher', publisher_id, COUNT(*) FROM book_publisher GROUP BY publisher_id;
+
 
 -- The STRING_AGG function in SQL is an aggregate function that concatenates string values from multiple rows 
 -- into a single string, with a specified separator
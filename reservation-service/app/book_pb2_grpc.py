@@ -0,0 +1,832 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+import book_pb2 as book__pb2
+
+GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in book_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class BookServiceStub(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.AddBook = channel.unary_unary(
+                '/library.BookService/AddBook',
+                request_serializer=book__pb2.AddBookRequest.SerializeToString,
+                response_deserializer=book__pb2.BookResponse.FromString,
+                _registered_method=True)
+        self.UpdateBook = channel.unary_unary(
+                '/library.BookService/UpdateBook',
+                request_serializer=book__pb2.UpdateBookRequest.SerializeToString,
+                response_deserializer=book__pb2.BookResponse.FromString,
+                _registered_method=True)
+        self.DeleteBook = channel.unary_unary(
+                '/library.BookService/DeleteBook',
+                request_serializer=book__pb2.DeleteBookRequest.SerializeToString,
+                response_deserializer=book__pb2.BookResponse.FromString,
+                _registered_method=True)
+        self.GetAllBooks = channel.unary_unary(
+                '/library.BookService/GetAllBooks',
+                request_serializer=book__pb2.GetAllBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.GetAllBooksResponse.FromString,
+                _registered_method=True)
+        self.GetBook = channel.unary_unary(
+                '/library.BookService/GetBook',
+                request_serializer=book__pb2.GetBookRequest.SerializeToString,
+                response_deserializer=book__pb2.GetBookResponse.FromString,
+                _registered_method=True)
+        self.GetBooks = channel.unary_unary(
+                '/library.BookService/GetBooks',
+                request_serializer=book__pb2.GetBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.GetBooksResponse.FromString,
+                _registered_method=True)
+        self.ListBooks = channel.unary_unary(
+                '/library.BookService/ListBooks',
+                request_serializer=book__pb2.ListBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.ListBooksResponse.FromString,
+                _registered_method=True)
+        self.StreamBooks = channel.unary_stream(
+                '/library.BookService/StreamBooks',
+                request_serializer=book__pb2.StreamBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.BookDetails.FromString,
+                _registered_method=True)
+        self.SearchBooks = channel.unary_unary(
+                '/library.BookService/SearchBooks',
+                request_serializer=book__pb2.SearchBooksRequest.SerializeToString,
+                response_deserializer=book__pb2.SearchBooksResponse.FromString,
+                _registered_method=True)
+        self.ImportBooks = channel.stream_unary(
+                '/library.BookService/ImportBooks',
+                request_serializer=book__pb2.ImportBookRow.SerializeToString,
+                response_deserializer=book__pb2.ImportBooksResponse.FromString,
+                _registered_method=True)
+        self.GetCatalogFacets = channel.unary_unary(
+                '/library.BookService/GetCatalogFacets',
+                request_serializer=book__pb2.GetCatalogFacetsRequest.SerializeToString,
+                response_deserializer=book__pb2.GetCatalogFacetsResponse.FromString,
+                _registered_method=True)
+        self.AddCategory = channel.unary_unary(
+                '/library.BookService/AddCategory',
+                request_serializer=book__pb2.AddCategoryRequest.SerializeToString,
+                response_deserializer=book__pb2.CategoryResponse.FromString,
+                _registered_method=True)
+        self.UpdateCategory = channel.unary_unary(
+                '/library.BookService/UpdateCategory',
+                request_serializer=book__pb2.UpdateCategoryRequest.SerializeToString,
+                response_deserializer=book__pb2.CategoryResponse.FromString,
+                _registered_method=True)
+        self.DeleteCategory = channel.unary_unary(
+                '/library.BookService/DeleteCategory',
+                request_serializer=book__pb2.DeleteCategoryRequest.SerializeToString,
+                response_deserializer=book__pb2.CategoryResponse.FromString,
+                _registered_method=True)
+        self.GetAllCategories = channel.unary_unary(
+                '/library.BookService/GetAllCategories',
+                request_serializer=book__pb2.GetAllCategoriesRequest.SerializeToString,
+                response_deserializer=book__pb2.GetAllCategoriesResponse.FromString,
+                _registered_method=True)
+        self.GetCategory = channel.unary_unary(
+                '/library.BookService/GetCategory',
+                request_serializer=book__pb2.GetCategoryRequest.SerializeToString,
+                response_deserializer=book__pb2.GetCategoryResponse.FromString,
+                _registered_method=True)
+        self.GetAllAuthors = channel.unary_unary(
+                '/library.BookService/GetAllAuthors',
+                request_serializer=book__pb2.GetAllAuthorsRequest.SerializeToString,
+                response_deserializer=book__pb2.GetAllAuthorsResponse.FromString,
+                _registered_method=True)
+        self.GetAllPublishers = channel.unary_unary(
+                '/library.BookService/GetAllPublishers',
+                request_serializer=book__pb2.GetAllPublishersRequest.SerializeToString,
+                response_deserializer=book__pb2.GetAllPublishersResponse.FromString,
+                _registered_method=True)
+
+
+class BookServiceServicer(object):
+    """Missing associated documentation comment in .proto file."""
+
+    def AddBook(self, request, context):
+        """for books
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAllBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBook(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchBooks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ImportBooks(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCatalogFacets(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AddCategory(self, request, context):
+        """for book category
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateCategory(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteCategory(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAllCategories(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCategory(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAllAuthors(self, request, context):
+        """for book authors
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetAllPublishers(self, request, context):
+        """for book publishers
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_BookServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'AddBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddBook,
+                    request_deserializer=book__pb2.AddBookRequest.FromString,
+                    response_serializer=book__pb2.BookResponse.SerializeToString,
+            ),
+            'UpdateBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateBook,
+                    request_deserializer=book__pb2.UpdateBookRequest.FromString,
+                    response_serializer=book__pb2.BookResponse.SerializeToString,
+            ),
+            'DeleteBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteBook,
+                    request_deserializer=book__pb2.DeleteBookRequest.FromString,
+                    response_serializer=book__pb2.BookResponse.SerializeToString,
+            ),
+            'GetAllBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAllBooks,
+                    request_deserializer=book__pb2.GetAllBooksRequest.FromString,
+                    response_serializer=book__pb2.GetAllBooksResponse.SerializeToString,
+            ),
+            'GetBook': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBook,
+                    request_deserializer=book__pb2.GetBookRequest.FromString,
+                    response_serializer=book__pb2.GetBookResponse.SerializeToString,
+            ),
+            'GetBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBooks,
+                    request_deserializer=book__pb2.GetBooksRequest.FromString,
+                    response_serializer=book__pb2.GetBooksResponse.SerializeToString,
+            ),
+            'ListBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListBooks,
+                    request_deserializer=book__pb2.ListBooksRequest.FromString,
+                    response_serializer=book__pb2.ListBooksResponse.SerializeToString,
+            ),
+            'StreamBooks': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamBooks,
+                    request_deserializer=book__pb2.StreamBooksRequest.FromString,
+                    response_serializer=book__pb2.BookDetails.SerializeToString,
+            ),
+            'SearchBooks': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchBooks,
+                    request_deserializer=book__pb2.SearchBooksRequest.FromString,
+                    response_serializer=book__pb2.SearchBooksResponse.SerializeToString,
+            ),
+            'ImportBooks': grpc.stream_unary_rpc_method_handler(
+                    servicer.ImportBooks,
+                    request_deserializer=book__pb2.ImportBookRow.FromString,
+                    response_serializer=book__pb2.ImportBooksResponse.SerializeToString,
+            ),
+            'GetCatalogFacets': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCatalogFacets,
+                    request_deserializer=book__pb2.GetCatalogFacetsRequest.FromString,
+                    response_serializer=book__pb2.GetCatalogFacetsResponse.SerializeToString,
+            ),
+            'AddCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddCategory,
+                    request_deserializer=book__pb2.AddCategoryRequest.FromString,
+                    response_serializer=book__pb2.CategoryResponse.SerializeToString,
+            ),
+            'UpdateCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateCategory,
+                    request_deserializer=book__pb2.UpdateCategoryRequest.FromString,
+                    response_serializer=book__pb2.CategoryResponse.SerializeToString,
+            ),
+            'DeleteCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteCategory,
+                    request_deserializer=book__pb2.DeleteCategoryRequest.FromString,
+                    response_serializer=book__pb2.CategoryResponse.SerializeToString,
+            ),
+            'GetAllCategories': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAllCategories,
+                    request_deserializer=book__pb2.GetAllCategoriesRequest.FromString,
+                    response_serializer=book__pb2.GetAllCategoriesResponse.SerializeToString,
+            ),
+            'GetCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCategory,
+                    request_deserializer=book__pb2.GetCategoryRequest.FromString,
+                    response_serializer=book__pb2.GetCategoryResponse.SerializeToString,
+            ),
+            'GetAllAuthors': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAllAuthors,
+                    request_deserializer=book__pb2.GetAllAuthorsRequest.FromString,
+                    response_serializer=book__pb2.GetAllAuthorsResponse.SerializeToString,
+            ),
+            'GetAllPublishers': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetAllPublishers,
+                    request_deserializer=book__pb2.GetAllPublishersRequest.FromString,
+                    response_serializer=book__pb2.GetAllPublishersResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'library.BookService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('library.BookService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class BookService(object):
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def AddBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/AddBook',
+            book__pb2.AddBookRequest.SerializeToString,
+            book__pb2.BookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/UpdateBook',
+            book__pb2.UpdateBookRequest.SerializeToString,
+            book__pb2.BookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/DeleteBook',
+            book__pb2.DeleteBookRequest.SerializeToString,
+            book__pb2.BookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetAllBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetAllBooks',
+            book__pb2.GetAllBooksRequest.SerializeToString,
+            book__pb2.GetAllBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBook(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetBook',
+            book__pb2.GetBookRequest.SerializeToString,
+            book__pb2.GetBookResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetBooks',
+            book__pb2.GetBooksRequest.SerializeToString,
+            book__pb2.GetBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/ListBooks',
+            book__pb2.ListBooksRequest.SerializeToString,
+            book__pb2.ListBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/library.BookService/StreamBooks',
+            book__pb2.StreamBooksRequest.SerializeToString,
+            book__pb2.BookDetails.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchBooks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/SearchBooks',
+            book__pb2.SearchBooksRequest.SerializeToString,
+            book__pb2.SearchBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ImportBooks(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/library.BookService/ImportBooks',
+            book__pb2.ImportBookRow.SerializeToString,
+            book__pb2.ImportBooksResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCatalogFacets(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetCatalogFacets',
+            book__pb2.GetCatalogFacetsRequest.SerializeToString,
+            book__pb2.GetCatalogFacetsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AddCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/AddCategory',
+            book__pb2.AddCategoryRequest.SerializeToString,
+            book__pb2.CategoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/UpdateCategory',
+            book__pb2.UpdateCategoryRequest.SerializeToString,
+            book__pb2.CategoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/DeleteCategory',
+            book__pb2.DeleteCategoryRequest.SerializeToString,
+            book__pb2.CategoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetAllCategories(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetAllCategories',
+            book__pb2.GetAllCategoriesRequest.SerializeToString,
+            book__pb2.GetAllCategoriesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetCategory',
+            book__pb2.GetCategoryRequest.SerializeToString,
+            book__pb2.GetCategoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetAllAuthors(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetAllAuthors',
+            book__pb2.GetAllAuthorsRequest.SerializeToString,
+            book__pb2.GetAllAuthorsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetAllPublishers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.BookService/GetAllPublishers',
+            book__pb2.GetAllPublishersRequest.SerializeToString,
+            book__pb2.GetAllPublishersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
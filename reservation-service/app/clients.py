@@ -0,0 +1,47 @@
+import os
+from grpc.experimental import aio
+import user_pb2_grpc
+import book_pb2_grpc
+
+USER_SERVICE_TARGET = os.getenv("USER_SERVICE_TARGET", "user-service:5001")
+BOOK_SERVICE_TARGET = os.getenv("BOOK_SERVICE_TARGET", "book-service:5002")
+# per-call deadline for lookups made while serving a request
+LOOKUP_DEADLINE_SECONDS = float(os.getenv("LOOKUP_DEADLINE_SECONDS", "2"))
+
+# Ping idle connections so a dead peer is noticed before the next request
+# rather than by it; the user/book servers accept pings at this interval.
+CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+]
+
+
+class ServiceClients:
+    """Long-lived channels and stubs to user-service and book-service.
+
+    gRPC channels multiplex every call over one HTTP/2 connection, so a single
+    channel per target is shared by all requests. open() must run inside the
+    server's event loop.
+    """
+
+    def __init__(self):
+        self._channels = []
+        self.users = None
+        self.books = None
+
+    def open(self):
+        user_channel = aio.insecure_channel(USER_SERVICE_TARGET, options=CHANNEL_OPTIONS)
+        book_channel = aio.insecure_channel(BOOK_SERVICE_TARGET, options=CHANNEL_OPTIONS)
+        self._channels = [user_channel, book_channel]
+        self.users = user_pb2_grpc.UserServiceStub(user_channel)
+        self.books = book_pb2_grpc.BookServiceStub(book_channel)
+
+    async def close(self):
+        for channel in self._channels:
+            await channel.close()
+        self._channels = []
+
+
+clients = ServiceClients()
@@ -0,0 +1,288 @@
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from opentelemetry import metrics
+import user_pb2
+import book_pb2
+from clients import clients
+
+# where the directory is saved between restarts; empty disables snapshots
+NAME_DIRECTORY_SNAPSHOT = os.getenv("NAME_DIRECTORY_SNAPSHOT", "name_directory.json.gz")
+NAME_DIRECTORY_SNAPSHOT_SECONDS = float(os.getenv("NAME_DIRECTORY_SNAPSHOT_SECONDS", "60"))
+# new books are picked up this often; renamed or deleted books only on the
+# full resync
+BOOK_SYNC_SECONDS = float(os.getenv("BOOK_SYNC_SECONDS", "10"))
+BOOK_RESYNC_SECONDS = float(os.getenv("BOOK_RESYNC_SECONDS", "600"))
+SYNC_RETRY_SECONDS = 5
+SYNC_BATCH_SIZE = 1000
+# WatchUsers initial metadata: the newest seq when the stream opened
+HEAD_SEQ_HEADER = "head-seq"
+
+console = logging.getLogger("reservation-directory")
+# lag is measured from process start until the first sync
+STARTED_AT = time.time()
+
+meter = metrics.get_meter(__name__)
+directory_hits = meter.create_counter("name_directory.hits", description="Names resolved from the local directory")
+directory_misses = meter.create_counter("name_directory.misses", description="Names the local directory could not resolve")
+
+
+class NameDirectory:
+    """Local id -> name replica of the users or the books table.
+
+    An id without a name is looked up remotely, even at or below max_id:
+    a change can be applied after later ones (ids are not committed in
+    order), so a gap does not prove the id does not exist. Ids known not to
+    exist are kept as tombstones and resolve to a blank name without a
+    remote call: deleted ones for as long as they stay deleted, and ones a
+    remote lookup reported missing until the next sync.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.names = {}
+        self.deleted = set()  # ids the sync reported deleted
+        self.missing = set()  # ids a remote lookup reported missing; cleared on sync
+        self.max_id = 0
+        self.synced_at = None  # wall-clock time the replica was last known current
+        self.dirty = False
+        self._attrs = {"directory": name}
+
+    def set(self, item_id, name):
+        # name is None for a deleted id
+        if name is None:
+            self.names.pop(item_id, None)
+            self.deleted.add(item_id)
+        else:
+            self.names[item_id] = name
+            self.deleted.discard(item_id)
+        self.missing.discard(item_id)
+        self.max_id = max(self.max_id, item_id)
+        self.dirty = True
+
+    def remember(self, names):
+        # names fetched remotely for unknown ids, "" for ids reported missing;
+        # max_id is left alone since the ids in between were not covered
+        for item_id, name in names.items():
+            if name:
+                self.names[item_id] = name
+            else:
+                self.missing.add(item_id)
+        self.dirty = True
+
+    def lookup(self, ids):
+        # ({id: name} for every id the directory can answer, [ids to look
+        # up]); tombstoned ids resolve to ""
+        found = {}
+        unknown = []
+        for item_id in ids:
+            name = self.names.get(item_id)
+            if name is not None:
+                found[item_id] = name
+            elif item_id in self.deleted or item_id in self.missing:
+                found[item_id] = ""
+            else:
+                unknown.append(item_id)
+        directory_hits.add(len(found), self._attrs)
+        if unknown:
+            directory_misses.add(len(unknown), self._attrs)
+        return found, unknown
+
+    def lag_seconds(self):
+        return max(time.time() - (self.synced_at or STARTED_AT), 0.0)
+
+    def to_snapshot(self):
+        # a copy, since the snapshot is written out on another thread; remote
+        # misses are not saved, they only last until the next sync anyway
+        return {
+            "names": dict(self.names), "deleted": sorted(self.deleted),
+            "max_id": self.max_id, "synced_at": self.synced_at,
+        }
+
+    def load_snapshot(self, data):
+        self.names = {int(item_id): name for item_id, name in data["names"].items()}
+        self.deleted = set(data.get("deleted", ()))
+        self.max_id = data["max_id"]
+        self.synced_at = data["synced_at"]
+
+
+class UserDirectory(NameDirectory):
+    """Fed by user-service's WatchUsers change feed, resumed from seq."""
+
+    def __init__(self):
+        super().__init__("users")
+        self.seq = 0
+        self.watching = False  # stream open and caught up with its head seq
+
+    def lag_seconds(self):
+        # once caught up, changes are pushed as they commit; while the
+        # backlog is replayed the directory is as old as its last sync
+        return 0.0 if self.watching else super().lag_seconds()
+
+    def staleness_bound_seconds(self):
+        return self.lag_seconds()
+
+    def to_snapshot(self):
+        return {**super().to_snapshot(), "seq": self.seq}
+
+    def load_snapshot(self, data):
+        super().load_snapshot(data)
+        self.seq = data["seq"]
+
+
+class BookDirectory(NameDirectory):
+    """Fed by StreamBooks: deltas after max_id, plus periodic full resyncs."""
+
+    def __init__(self):
+        super().__init__("books")
+        self.resynced_at = None  # wall-clock time of the last full resync
+
+    def staleness_bound_seconds(self):
+        # new books are as old as the last delta, renames and deletes as old
+        # as the last full resync
+        return max(time.time() - (self.resynced_at or STARTED_AT), 0.0)
+
+    def to_snapshot(self):
+        return {**super().to_snapshot(), "resynced_at": self.resynced_at}
+
+    def load_snapshot(self, data):
+        super().load_snapshot(data)
+        self.resynced_at = data["resynced_at"]
+
+
+users = UserDirectory()
+books = BookDirectory()
+DIRECTORIES = (users, books)
+
+
+def observe(measure):
+    def callback(options):
+        for directory in DIRECTORIES:
+            yield metrics.Observation(measure(directory), {"directory": directory.name})
+    return callback
+
+
+meter.create_observable_gauge(
+    "name_directory.entries", callbacks=[observe(lambda d: len(d.names))],
+    description="Names held in the local directory",
+)
+meter.create_observable_gauge(
+    "name_directory.lag_seconds", callbacks=[observe(lambda d: d.lag_seconds())],
+    description="Seconds since the directory was last known to be in sync",
+)
+meter.create_observable_gauge(
+    "name_directory.staleness_bound_seconds", callbacks=[observe(lambda d: d.staleness_bound_seconds())],
+    description="Upper bound on how out of date any name in the directory can be",
+)
+
+
+async def watch_users_forever():
+    while True:
+        try:
+            stream = clients.users.WatchUsers(
+                user_pb2.WatchUsersRequest(after_seq=users.seq, batch_size=SYNC_BATCH_SIZE)
+            )
+            # WatchUsers sends its headers, with the newest seq, as soon as it
+            # is subscribed; everything up to that seq is backlog
+            metadata = dict(await stream.initial_metadata())
+            head_seq = int(metadata.get(HEAD_SEQ_HEADER, 0))
+            # remote misses may have been created since; the feed replays them
+            users.missing.clear()
+            users.watching = users.seq >= head_seq
+            async for change in stream:
+                users.set(change.user_id, change.user.name if change.HasField("user") else None)
+                users.seq = change.seq
+                if not users.watching and users.seq >= head_seq:
+                    users.watching = True
+        except Exception:
+            console.exception("Watching user changes failed")
+        finally:
+            if users.watching:
+                users.watching = False
+                users.synced_at = time.time()
+        await asyncio.sleep(SYNC_RETRY_SECONDS)
+
+
+async def sync_books(full):
+    # a full resync rebuilds the map, so deleted books drop out of it
+    after_id = 0 if full else books.max_id
+    fetched = {}
+    async for book in clients.books.StreamBooks(
+        book_pb2.StreamBooksRequest(after_book_id=after_id, batch_size=SYNC_BATCH_SIZE)
+    ):
+        fetched[book.book_id] = book.book_name
+    now = time.time()
+    if full:
+        books.names = fetched
+        books.deleted = set()
+        books.max_id = max(fetched, default=0)
+        books.dirty = True
+        books.resynced_at = now
+    else:
+        for book_id, name in fetched.items():
+            books.set(book_id, name)
+    books.missing.clear()
+    books.synced_at = now
+
+
+async def sync_books_forever():
+    while True:
+        try:
+            due = books.resynced_at is None or time.time() - books.resynced_at >= BOOK_RESYNC_SECONDS
+            await sync_books(full=due)
+        except Exception:
+            console.exception("Syncing book names failed")
+        await asyncio.sleep(BOOK_SYNC_SECONDS)
+
+
+def load_snapshot():
+    if not NAME_DIRECTORY_SNAPSHOT or not os.path.exists(NAME_DIRECTORY_SNAPSHOT):
+        return
+    try:
+        with gzip.open(NAME_DIRECTORY_SNAPSHOT, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        users.load_snapshot(data["users"])
+        books.load_snapshot(data["books"])
+        console.info("Loaded %d user and %d book names from %s", len(users.names), len(books.names), NAME_DIRECTORY_SNAPSHOT)
+    except Exception:
+        console.exception("Ignoring unreadable snapshot %s", NAME_DIRECTORY_SNAPSHOT)
+
+
+async def save_snapshot():
+    data = {"users": users.to_snapshot(), "books": books.to_snapshot()}
+    for directory in DIRECTORIES:
+        directory.dirty = False
+    # compressing and writing can take a while for large directories, so it
+    # runs off the event loop
+    await asyncio.to_thread(write_snapshot, data)
+
+
+def write_snapshot(data):
+    # write then rename, so a crash never leaves a half-written snapshot
+    partial = NAME_DIRECTORY_SNAPSHOT + ".tmp"
+    with gzip.open(partial, "wt", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(partial, NAME_DIRECTORY_SNAPSHOT)
+
+
+async def snapshot_forever():
+    while True:
+        await asyncio.sleep(NAME_DIRECTORY_SNAPSHOT_SECONDS)
+        if any(directory.dirty for directory in DIRECTORIES):
+            try:
+                await save_snapshot()
+            except Exception:
+                console.exception("Saving snapshot %s failed", NAME_DIRECTORY_SNAPSHOT)
+
+
+async def sync_forever():
+    # starts from the saved snapshot, if any, then keeps both directories
+    # current; the user feed resumes from the snapshot's seq
+    load_snapshot()
+    tasks = [watch_users_forever(), sync_books_forever()]
+    if NAME_DIRECTORY_SNAPSHOT:
+        tasks.append(snapshot_forever())
+    await asyncio.gather(*tasks)
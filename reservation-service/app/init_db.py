@@ -1,10 +1,22 @@
 import asyncio
+from sqlalchemy import update
 from database import engine, Base
 import models
 
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # reservations returned before books tracked their own return date:
+        # mark their books returned too, so they no longer count as holding a copy
+        await conn.execute(
+            update(models.UserReservation)
+            .where(
+                models.UserReservation.reservation_id == models.Reservation.reservation_id,
+                models.Reservation.reservation_return_date.is_not(None),
+                models.UserReservation.book_return_date.is_(None),
+            )
+            .values(book_return_date=models.Reservation.reservation_return_date)
+        )
 
 asyncio.run(init_db())
 # This script initializes the database by creating all tables defined in the models.
\ No newline at end of file
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+import os
+import grpc
+import user_pb2
+import book_pb2
+from clients import clients, LOOKUP_DEADLINE_SECONDS
+
+# ids per GetUsers/GetBooks call; both services accept at most 1000
+LOOKUP_BATCH_SIZE = int(os.getenv("LOOKUP_BATCH_SIZE", "500"))
+# batch calls in flight at once, per service
+LOOKUP_CONCURRENCY = int(os.getenv("LOOKUP_CONCURRENCY", "4"))
+
+console = logging.getLogger("reservation-lookups")
+
+
+async def names_in_batches(ids, fetch_batch, service):
+    # {id: name} for ids, fetched LOOKUP_BATCH_SIZE at a time with at most
+    # LOOKUP_CONCURRENCY calls in flight; ids the service reported missing map
+    # to "". A failed batch leaves its ids out instead of failing the whole
+    # lookup.
+    ids = sorted(ids)
+    semaphore = asyncio.Semaphore(LOOKUP_CONCURRENCY)
+
+    async def fetch(batch):
+        async with semaphore:
+            try:
+                return await fetch_batch(batch)
+            except grpc.aio.AioRpcError as e:
+                console.warning("%s lookup of %d ids failed: %s", service, len(batch), e.code())
+                return {}
+
+    names = {}
+    pages = await asyncio.gather(*(
+        fetch(ids[i:i + LOOKUP_BATCH_SIZE]) for i in range(0, len(ids), LOOKUP_BATCH_SIZE)
+    ))
+    for page in pages:
+        names.update(page)
+    return names
+
+
+async def fetch_user_names(user_ids):
+    response = await clients.users.GetUsers(
+        user_pb2.GetUsersRequest(user_id=user_ids), timeout=LOOKUP_DEADLINE_SECONDS
+    )
+    names = {user_id: user.name for user_id, user in response.users.items()}
+    # missing or deleted users resolve to "", which the directory keeps as a tombstone
+    names.update((user_id, "") for user_id in response.missing_user_id)
+    return names
+
+
+async def fetch_book_names(book_ids):
+    response = await clients.books.GetBooks(
+        book_pb2.GetBooksRequest(book_id=book_ids), timeout=LOOKUP_DEADLINE_SECONDS
+    )
+    names = {book_id: book.book_name for book_id, book in response.books.items()}
+    names.update((book_id, "") for book_id in response.missing_book_id)
+    return names
+
+
+async def user_names(user_ids):
+    return await names_in_batches(user_ids, fetch_user_names, "user-service")
+
+
+async def book_names(book_ids):
+    return await names_in_batches(book_ids, fetch_book_names, "book-service")
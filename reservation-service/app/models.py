@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, func
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, CheckConstraint, func, Index
 from database import Base
 
 class Reservation(Base):
@@ -12,6 +12,40 @@ class Reservation(Base):
 
 class UserReservation(Base):
     __tablename__ = "user_reservation"
+    reservation_id = Column(Integer, ForeignKey("reservation.reservation_id", ondelete="CASCADE"), primary_key=True)
+    book_id = Column(Integer, primary_key=True)
+    book_return_date = Column(DateTime, nullable=True)
+
+# Copies of a title that can be reserved. A copy is held by every
+# user_reservation row whose book_return_date is still NULL. Books without a
+# row here are not tracked and can always be reserved.
+class BookInventory(Base):
+    __tablename__ = "book_inventory"
+    book_id = Column(Integer, primary_key=True)
+    total_copies = Column(Integer, nullable=False)
+    available_copies = Column(Integer, nullable=False)
+    __table_args__ = (
+        CheckConstraint("available_copies >= 0 AND available_copies <= total_copies", name="ck_book_inventory_available"),
+    )
+
+# PurgeReservations moves returned reservations here, out of the hot tables
+class ReservationArchive(Base):
+    __tablename__ = "reservation_archive"
+    reservation_id = Column(Integer, primary_key=True)
+    user_id = Column(Integer)
+    reservation_created_date = Column(DateTime)
+    reservation_return_date = Column(DateTime)
+    archived_at = Column(DateTime, server_default=func.now())
+
+class UserReservationArchive(Base):
+    __tablename__ = "user_reservation_archive"
     reservation_id = Column(Integer, primary_key=True)
     book_id = Column(Integer, primary_key=True)
     book_return_date = Column(DateTime, nullable=True)
+
+# ListReservations filters; (user_id, reservation_id) also serves the keyset order
+Index("idx_reservation_user", Reservation.user_id, Reservation.reservation_id)
+Index("idx_reservation_return_date", Reservation.reservation_return_date)
+Index("idx_reservation_created_date", Reservation.reservation_created_date)
+Index("idx_user_reservation_book", UserReservation.book_id)
+Index("idx_reservation_archive_user", ReservationArchive.user_id)
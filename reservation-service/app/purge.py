@@ -0,0 +1,43 @@
+import asyncio
+import logging
+import os
+from datetime import datetime, timedelta
+from database import get_session
+from repositories import ReservationRepository
+
+PURGE_BATCH_SIZE = 1000
+# background purge: reservations returned more than this many days ago are
+# archived every RESERVATION_PURGE_INTERVAL_SECONDS; 0 turns the job off
+RESERVATION_RETENTION_DAYS = float(os.getenv("RESERVATION_RETENTION_DAYS", "0"))
+RESERVATION_PURGE_INTERVAL_SECONDS = float(os.getenv("RESERVATION_PURGE_INTERVAL_SECONDS", "3600"))
+
+console = logging.getLogger("reservation-purge")
+
+
+async def purge_returned_before(cutoff, batch_size=PURGE_BATCH_SIZE):
+    # Archives every reservation returned before cutoff (naive UTC), one
+    # short transaction per batch so locks are only ever held on batch_size
+    # rows. Returns (reservations, books, batches).
+    reservations = books = batches = 0
+    while True:
+        async with get_session() as session:
+            moved, moved_books = await ReservationRepository.archive_returned_batch(session, cutoff, batch_size)
+        reservations += moved
+        books += moved_books
+        batches += 1
+        if moved < batch_size:
+            return reservations, books, batches
+        # let other work on the event loop in between batches
+        await asyncio.sleep(0)
+
+
+async def purge_forever():
+    while True:
+        cutoff = datetime.utcnow() - timedelta(days=RESERVATION_RETENTION_DAYS)
+        try:
+            reservations, books, batches = await purge_returned_before(cutoff)
+            if reservations:
+                console.info("Archived %d reservations (%d books) returned before %s", reservations, books, cutoff)
+        except Exception:
+            console.exception("Purging returned reservations failed")
+        await asyncio.sleep(RESERVATION_PURGE_INTERVAL_SECONDS)
@@ -1,52 +1,281 @@
-from sqlalchemy import select, join
+from sqlalchemy import select, insert, update, delete, join, exists, func, any_, bindparam, Integer, DateTime
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.orm import aliased
-from models import Reservation, UserReservation
+from models import Reservation, UserReservation, ReservationArchive, UserReservationArchive, BookInventory
 from datetime import datetime
 from types import SimpleNamespace
 
-class ReservationRepository:
+# a reservation and all of its user_reservation rows in one statement: the
+# reservation insert feeds its id to a multi-row insert over the book_ids
+# array. Built on the Core tables, since the ORM's bulk INSERT path does not
+# take an INSERT ... SELECT.
+_RESERVATION_TABLE = Reservation.__table__
+_USER_RESERVATION_TABLE = UserReservation.__table__
+_NEW_RESERVATION = (
+    insert(_RESERVATION_TABLE)
+    .values(user_id=bindparam("user_id", type_=Integer))
+    .returning(_RESERVATION_TABLE.c.reservation_id)
+    .cte("new_reservation")
+)
+_CREATE_RESERVATION = insert(_USER_RESERVATION_TABLE).from_select(
+    ["reservation_id", "book_id"],
+    select(
+        _NEW_RESERVATION.c.reservation_id,
+        func.unnest(bindparam("book_ids", type_=ARRAY(Integer))),
+    ),
+).returning(_USER_RESERVATION_TABLE.c.reservation_id)
 
-    @staticmethod
-    async def create_reservation(session, reservation: Reservation):
-        session.add(reservation)
-        await session.flush()
-        return reservation
+# one statement for the reservation and its books, whether or not the
+# database has the ON DELETE CASCADE foreign key (init_db-created schemas
+# from before it was added to the models do not). Returns the reservation_id
+# and the book_ids whose copies it still held.
+_DELETED_BOOKS = (
+    delete(UserReservation)
+    .where(UserReservation.reservation_id == bindparam("reservation_id", type_=Integer))
+    .returning(UserReservation.book_id, UserReservation.book_return_date)
+    .cte("deleted_books")
+)
+_DELETED = (
+    delete(Reservation)
+    .where(Reservation.reservation_id == bindparam("reservation_id", type_=Integer))
+    .returning(Reservation.reservation_id)
+    .cte("deleted")
+)
+_DELETE_RESERVATION = select(
+    _DELETED.c.reservation_id,
+    func.array(
+        select(_DELETED_BOOKS.c.book_id).where(_DELETED_BOOKS.c.book_return_date.is_(None)).scalar_subquery()
+    ),
+).add_cte(_DELETED_BOOKS)
+
+# marks an unreturned reservation and its books returned; returns the
+# reservation_id and the book_ids whose copies come back. The id parameter
+# must not be named after a column, or UPDATE takes it as a SET value.
+_RETURNED = (
+    update(Reservation)
+    .where(
+        Reservation.reservation_id == bindparam("target_reservation_id", type_=Integer),
+        Reservation.reservation_return_date.is_(None),
+    )
+    .values(reservation_return_date=bindparam("returned_at", type_=DateTime))
+    .returning(Reservation.reservation_id)
+    .cte("returned")
+)
+_RETURNED_BOOKS = (
+    update(UserReservation)
+    .where(
+        UserReservation.reservation_id == _RETURNED.c.reservation_id,
+        UserReservation.book_return_date.is_(None),
+    )
+    .values(book_return_date=bindparam("returned_at", type_=DateTime))
+    .returning(UserReservation.book_id)
+    .cte("returned_books")
+)
+_MARK_RETURN = select(
+    _RETURNED.c.reservation_id,
+    func.array(select(_RETURNED_BOOKS.c.book_id).scalar_subquery()),
+)
+
+
+def _copies_stmt(delta):
+    # Locks the inventory rows of :book_ids in book_id order (so two
+    # multi-book reservations can never deadlock) and moves available_copies
+    # by delta. Taking a copy only touches rows that still have one; the row
+    # lock is held until commit, so concurrent reservations of a hot title
+    # queue on that one row rather than overselling it.
+    condition = [BookInventory.book_id == any_(bindparam("book_ids", type_=ARRAY(Integer)))]
+    if delta < 0:
+        condition.append(BookInventory.available_copies > 0)
+    locked = (
+        select(BookInventory.book_id)
+        .where(*condition)
+        .order_by(BookInventory.book_id)
+        .with_for_update()
+        .cte("locked")
+    )
+    moved = BookInventory.available_copies + delta
+    if delta > 0:
+        # a loan taken while the title was untracked never took a copy, so
+        # its return must not push available_copies past total_copies
+        moved = func.least(moved, BookInventory.total_copies)
+    return (
+        update(BookInventory)
+        .where(BookInventory.book_id == locked.c.book_id)
+        .values(available_copies=moved)
+        .returning(BookInventory.book_id)
+    )
+
+
+_TAKE_COPIES = _copies_stmt(-1).cte("taken")
+# tracked books among :book_ids that had no copy left to take
+_UNAVAILABLE_COPIES = select(BookInventory.book_id).where(
+    BookInventory.book_id == any_(bindparam("book_ids", type_=ARRAY(Integer))),
+    BookInventory.book_id.not_in(select(_TAKE_COPIES.c.book_id)),
+)
+_RETURN_COPIES = _copies_stmt(1)
+
+# sets a title's copy count, keeping the copies currently held out on loan.
+# A title tracked for the first time starts with its open loans already
+# taken; fewer copies than open loans fails ck_book_inventory_available.
+_OPEN_LOANS = (
+    select(func.count())
+    .select_from(UserReservation)
+    .where(
+        UserReservation.book_id == bindparam("book_id", type_=Integer),
+        UserReservation.book_return_date.is_(None),
+    )
+    .scalar_subquery()
+)
+_SET_COPIES = (
+    pg_insert(BookInventory)
+    .values(
+        book_id=bindparam("book_id", type_=Integer),
+        total_copies=bindparam("total_copies", type_=Integer),
+        available_copies=bindparam("total_copies", type_=Integer) - _OPEN_LOANS,
+    )
+)
+_SET_COPIES = _SET_COPIES.on_conflict_do_update(
+    index_elements=[BookInventory.book_id],
+    set_={
+        "total_copies": _SET_COPIES.excluded.total_copies,
+        "available_copies": BookInventory.available_copies
+        + _SET_COPIES.excluded.total_copies
+        - BookInventory.total_copies,
+    },
+).returning(BookInventory.book_id, BookInventory.total_copies, BookInventory.available_copies)
+
+
+def _archive_batch_stmt():
+    # Moves up to :batch_size reservations returned before :cutoff, with their
+    # books, into the archive tables, and returns (reservations, books) moved.
+    # SKIP LOCKED passes over rows another transaction is working on, so a
+    # purge never queues behind (or blocks) live traffic for long.
+    batch = (
+        select(Reservation.reservation_id)
+        .where(Reservation.reservation_return_date < bindparam("cutoff", type_=DateTime))
+        .order_by(Reservation.reservation_id)
+        .limit(bindparam("batch_size", type_=Integer))
+        .with_for_update(skip_locked=True)
+        .cte("batch")
+    )
+    moved_books = (
+        delete(UserReservation)
+        .where(UserReservation.reservation_id == batch.c.reservation_id)
+        .returning(UserReservation.reservation_id, UserReservation.book_id, UserReservation.book_return_date)
+        .cte("moved_books")
+    )
+    archived_books = (
+        insert(UserReservationArchive)
+        .from_select(["reservation_id", "book_id", "book_return_date"], select(moved_books))
+        .returning(UserReservationArchive.reservation_id)
+        .cte("archived_books")
+    )
+    moved = (
+        delete(Reservation)
+        .where(Reservation.reservation_id == batch.c.reservation_id)
+        .returning(
+            Reservation.reservation_id,
+            Reservation.user_id,
+            Reservation.reservation_created_date,
+            Reservation.reservation_return_date,
+        )
+        .cte("moved")
+    )
+    archived = (
+        insert(ReservationArchive)
+        .from_select(
+            ["reservation_id", "user_id", "reservation_created_date", "reservation_return_date"],
+            select(moved),
+        )
+        .returning(ReservationArchive.reservation_id)
+        .cte("archived")
+    )
+    return select(
+        select(func.count()).select_from(archived).scalar_subquery(),
+        select(func.count()).select_from(archived_books).scalar_subquery(),
+    )
+
+
+_ARCHIVE_BATCH = _archive_batch_stmt()
+
+
+def reservations_page_stmt(user_id=None, book_id=None, returned=None, created_from=None, created_to=None):
+    # one page of reservations after :after_id (at most :limit of them, in
+    # reservation_id order) with their books outer-joined. Filters left as
+    # None are omitted, so every combination keeps an index-friendly WHERE;
+    # SQLAlchemy caches the compiled form per combination.
+    conditions = [Reservation.reservation_id > bindparam("after_id", type_=Integer)]
+    if user_id is not None:
+        conditions.append(Reservation.user_id == user_id)
+    if book_id is not None:
+        conditions.append(exists().where(
+            UserReservation.reservation_id == Reservation.reservation_id,
+            UserReservation.book_id == book_id,
+        ))
+    if returned is True:
+        conditions.append(Reservation.reservation_return_date.is_not(None))
+    elif returned is False:
+        conditions.append(Reservation.reservation_return_date.is_(None))
+    if created_from is not None:
+        conditions.append(Reservation.reservation_created_date >= created_from)
+    if created_to is not None:
+        conditions.append(Reservation.reservation_created_date < created_to)
+
+    page = (
+        select(
+            Reservation.reservation_id,
+            Reservation.user_id,
+            Reservation.reservation_created_date,
+            Reservation.reservation_return_date,
+        )
+        .where(*conditions)
+        .order_by(Reservation.reservation_id)
+        .limit(bindparam("limit", type_=Integer))
+        .subquery("page")
+    )
+    return (
+        select(page, UserReservation.book_id, UserReservation.book_return_date)
+        .outerjoin(UserReservation, UserReservation.reservation_id == page.c.reservation_id)
+        .order_by(page.c.reservation_id, UserReservation.book_id)
+    )
+
+
+class ReservationRepository:
 
     @staticmethod
-    async def create_user_reservation(session, user_reservation: UserReservation):
-        session.add(user_reservation)
-        await session.flush()
-        return user_reservation
+    async def create_reservation(session, user_id: int, book_ids):
+        # returns the new reservation_id; book_ids must be non-empty and distinct
+        result = await session.execute(_CREATE_RESERVATION, {"user_id": user_id, "book_ids": list(book_ids)})
+        return result.scalars().first()
 
     @staticmethod
     async def mark_return(session, reservation_id: int):
-        stmt = select(Reservation).where(Reservation.reservation_id == reservation_id)
-        result = await session.execute(stmt)
-        reservation = result.scalar_one_or_none()
-        if not reservation:
+        # (reservation_id, book_ids whose copies come back), with no book_ids
+        # if it had already been returned, or None if there is no such
+        # reservation
+        result = await session.execute(
+            _MARK_RETURN, {"target_reservation_id": reservation_id, "returned_at": datetime.utcnow()}
+        )
+        row = result.one_or_none()
+        if row is not None:
+            return row[0], row[1]
+        if await ReservationRepository.get_reservation_by_id(session, reservation_id) is None:
             return None
-        reservation.reservation_return_date = datetime.utcnow()
-        await session.flush()
-        return reservation
+        return reservation_id, []
 
     @staticmethod
     async def delete_reservation(session, reservation_id: int):
-        stmt = select(Reservation).where(Reservation.reservation_id == reservation_id)
-        result = await session.execute(stmt)
-        reservation = result.scalar_one_or_none()
-        if not reservation:
-            return None
-
-        # delete related UserReservation rows
-        stmt2 = select(UserReservation).where(UserReservation.reservation_id == reservation_id)
-        res2 = await session.execute(stmt2)
-        user_res = res2.scalars().all()
-        for ur in user_res:
-            await session.delete(ur)
+        # (reservation_id, book_ids whose copies it still held), or None if
+        # there was no such reservation
+        result = await session.execute(_DELETE_RESERVATION, {"reservation_id": reservation_id})
+        row = result.one_or_none()
+        return (row[0], row[1]) if row is not None else None
 
-        await session.delete(reservation)
-        await session.flush()
-        return reservation
+    @staticmethod
+    async def archive_returned_batch(session, cutoff, batch_size: int):
+        # (reservations, books) moved to the archive tables
+        result = await session.execute(_ARCHIVE_BATCH, {"cutoff": cutoff, "batch_size": batch_size})
+        return tuple(result.one())
 
     @staticmethod
     async def get_reservation_by_id(session, reservation_id: int):
@@ -54,6 +283,14 @@ class ReservationRepository:
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    @staticmethod
+    async def list_reservations(session, after_id: int, limit: int, **filters):
+        # rows of up to limit reservations, one row per reserved book
+        result = await session.execute(
+            reservations_page_stmt(**filters), {"after_id": after_id, "limit": limit}
+        )
+        return result.all()
+
     @staticmethod
     async def get_all_reservations(session):
         # Simpler SQLAlchemy query: join Reservation with UserReservation
@@ -98,3 +335,25 @@ class ReservationRepository:
             out.append((reservation_obj, agg))
 
         return out
+
+
+class InventoryRepository:
+
+    @staticmethod
+    async def take_copies(session, book_ids):
+        # takes one copy of each tracked book and returns the tracked
+        # book_ids that had none left; the caller must roll back if any did
+        result = await session.execute(_UNAVAILABLE_COPIES, {"book_ids": list(book_ids)})
+        return result.scalars().all()
+
+    @staticmethod
+    async def return_copies(session, book_ids):
+        if book_ids:
+            await session.execute(_RETURN_COPIES, {"book_ids": list(book_ids)})
+
+    @staticmethod
+    async def set_copies(session, book_id: int, total_copies: int):
+        # (book_id, total_copies, available_copies); raises IntegrityError if
+        # total_copies is below the copies currently on loan
+        result = await session.execute(_SET_COPIES, {"book_id": book_id, "total_copies": total_copies})
+        return result.one()
@@ -22,29 +22,42 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11reservation.proto\x12\x07library\"6\n\x12ReservationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x62ook_id\x18\x02 \x01(\x05\"-\n\x13ReservationResponse\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\"+\n\x11ReturnbookRequest\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\"-\n\x13\x44\x65leteReservRequest\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\"\x15\n\x13GetAllReservRequest\"u\n\x13Reservation_details\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x11\n\tuser_name\x18\x03 \x01(\t\x12\x0f\n\x07\x62ook_id\x18\x04 \x01(\x05\x12\x11\n\tbook_name\x18\x05 \x01(\t\"I\n\x14GetAllReservResponse\x12\x31\n\x0bReservation\x18\x01 \x03(\x0b\x32\x1c.library.Reservation_details2\xca\x02\n\x12ReservationService\x12H\n\x0bReserveBook\x12\x1b.library.ReservationRequest\x1a\x1c.library.ReservationResponse\x12\x46\n\nReturnbook\x12\x1a.library.ReturnbookRequest\x1a\x1c.library.ReservationResponse\x12O\n\x11\x44\x65leteReservation\x12\x1c.library.DeleteReservRequest\x1a\x1c.library.ReservationResponse\x12Q\n\x12GetAllReservations\x12\x1c.library.GetAllReservRequest\x1a\x1d.library.GetAllReservResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11reservation.proto\x12\x07library\x1a\x1fgoogle/protobuf/timestamp.proto\"H\n\x12ReservationRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x62ook_id\x18\x02 \x01(\x05\x12\x10\n\x08\x62ook_ids\x18\x03 \x03(\x05\"-\n\x13ReservationResponse\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\"+\n\x11ReturnbookRequest\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\"-\n\x13\x44\x65leteReservRequest\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\"\x15\n\x13GetAllReservRequest\"\xa6\x02\n\x13Reservation_details\x12\x16\n\x0ereservation_id\x18\x01 \x01(\x05\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x11\n\tuser_name\x18\x03 \x01(\t\x12\x0f\n\x07\x62ook_id\x18\x04 \x01(\x05\x12\x11\n\tbook_name\x18\x05 \x01(\t\x12<\n\x18reservation_created_date\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12;\n\x17reservation_return_date\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x34\n\x10\x62ook_return_date\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"I\n\x14GetAllReservResponse\x12\x31\n\x0bReservation\x18\x01 \x03(\x0b\x32\x1c.library.Reservation_details\"\xd4\x01\n\x17ListReservationsRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0f\n\x07\x62ook_id\x18\x02 \x01(\x05\x12\x0e\n\x06status\x18\x03 \x01(\t\x12\x30\n\x0c\x63reated_from\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\ncreated_to\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tpage_size\x18\x06 \x01(\x05\x12\x12\n\npage_token\x18\x07 \x01(\t\"f\n\x18ListReservationsResponse\x12\x31\n\x0bReservation\x18\x01 \x03(\x0b\x32\x1c.library.Reservation_details\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"c\n\x18PurgeReservationsRequest\x12\x33\n\x0freturned_before\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\"|\n\x19PurgeReservationsResponse\x12\x1d\n\x15\x61rchived_reservations\x18\x01 \x01(\x05\x12\x16\n\x0e\x61rchived_books\x18\x02 \x01(\x05\x12\x0f\n\x07\x62\x61tches\x18\x03 \x01(\x05\x12\x17\n\x0f\x65lapsed_seconds\x18\x04 \x01(\x01\"=\n\x14SetBookCopiesRequest\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x14\n\x0ctotal_copies\x18\x02 \x01(\x05\"U\n\x12\x42ookCopiesResponse\x12\x0f\n\x07\x62ook_id\x18\x01 \x01(\x05\x12\x14\n\x0ctotal_copies\x18\x02 \x01(\x05\x12\x18\n\x10\x61vailable_copies\x18\x03 \x01(\x05\x32\xcc\x04\n\x12ReservationService\x12H\n\x0bReserveBook\x12\x1b.library.ReservationRequest\x1a\x1c.library.ReservationResponse\x12\x46\n\nReturnbook\x12\x1a.library.ReturnbookRequest\x1a\x1c.library.ReservationResponse\x12O\n\x11\x44\x65leteReservation\x12\x1c.library.DeleteReservRequest\x1a\x1c.library.ReservationResponse\x12Q\n\x12GetAllReservations\x12\x1c.library.GetAllReservRequest\x1a\x1d.library.GetAllReservResponse\x12W\n\x10ListReservations\x12 .library.ListReservationsRequest\x1a!.library.ListReservationsResponse\x12Z\n\x11PurgeReservations\x12!.library.PurgeReservationsRequest\x1a\".library.PurgeReservationsResponse\x12K\n\rSetBookCopies\x12\x1d.library.SetBookCopiesRequest\x1a\x1b.library.BookCopiesResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'reservation_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_RESERVATIONREQUEST']._serialized_start=30
-  _globals['_RESERVATIONREQUEST']._serialized_end=84
-  _globals['_RESERVATIONRESPONSE']._serialized_start=86
-  _globals['_RESERVATIONRESPONSE']._serialized_end=131
-  _globals['_RETURNBOOKREQUEST']._serialized_start=133
-  _globals['_RETURNBOOKREQUEST']._serialized_end=176
-  _globals['_DELETERESERVREQUEST']._serialized_start=178
-  _globals['_DELETERESERVREQUEST']._serialized_end=223
-  _globals['_GETALLRESERVREQUEST']._serialized_start=225
-  _globals['_GETALLRESERVREQUEST']._serialized_end=246
-  _globals['_RESERVATION_DETAILS']._serialized_start=248
-  _globals['_RESERVATION_DETAILS']._serialized_end=365
-  _globals['_GETALLRESERVRESPONSE']._serialized_start=367
-  _globals['_GETALLRESERVRESPONSE']._serialized_end=440
-  _globals['_RESERVATIONSERVICE']._serialized_start=443
-  _globals['_RESERVATIONSERVICE']._serialized_end=773
+  _globals['_RESERVATIONREQUEST']._serialized_start=63
+  _globals['_RESERVATIONREQUEST']._serialized_end=135
+  _globals['_RESERVATIONRESPONSE']._serialized_start=137
+  _globals['_RESERVATIONRESPONSE']._serialized_end=182
+  _globals['_RETURNBOOKREQUEST']._serialized_start=184
+  _globals['_RETURNBOOKREQUEST']._serialized_end=227
+  _globals['_DELETERESERVREQUEST']._serialized_start=229
+  _globals['_DELETERESERVREQUEST']._serialized_end=274
+  _globals['_GETALLRESERVREQUEST']._serialized_start=276
+  _globals['_GETALLRESERVREQUEST']._serialized_end=297
+  _globals['_RESERVATION_DETAILS']._serialized_start=300
+  _globals['_RESERVATION_DETAILS']._serialized_end=594
+  _globals['_GETALLRESERVRESPONSE']._serialized_start=596
+  _globals['_GETALLRESERVRESPONSE']._serialized_end=669
+  _globals['_LISTRESERVATIONSREQUEST']._serialized_start=672
+  _globals['_LISTRESERVATIONSREQUEST']._serialized_end=884
+  _globals['_LISTRESERVATIONSRESPONSE']._serialized_start=886
+  _globals['_LISTRESERVATIONSRESPONSE']._serialized_end=988
+  _globals['_PURGERESERVATIONSREQUEST']._serialized_start=990
+  _globals['_PURGERESERVATIONSREQUEST']._serialized_end=1089
+  _globals['_PURGERESERVATIONSRESPONSE']._serialized_start=1091
+  _globals['_PURGERESERVATIONSRESPONSE']._serialized_end=1215
+  _globals['_SETBOOKCOPIESREQUEST']._serialized_start=1217
+  _globals['_SETBOOKCOPIESREQUEST']._serialized_end=1278
+  _globals['_BOOKCOPIESRESPONSE']._serialized_start=1280
+  _globals['_BOOKCOPIESRESPONSE']._serialized_end=1365
+  _globals['_RESERVATIONSERVICE']._serialized_start=1368
+  _globals['_RESERVATIONSERVICE']._serialized_end=1956
 # @@protoc_insertion_point(module_scope)
@@ -54,6 +54,21 @@ class ReservationServiceStub(object):
                 request_serializer=reservation__pb2.GetAllReservRequest.SerializeToString,
                 response_deserializer=reservation__pb2.GetAllReservResponse.FromString,
                 _registered_method=True)
+        self.ListReservations = channel.unary_unary(
+                '/library.ReservationService/ListReservations',
+                request_serializer=reservation__pb2.ListReservationsRequest.SerializeToString,
+                response_deserializer=reservation__pb2.ListReservationsResponse.FromString,
+                _registered_method=True)
+        self.PurgeReservations = channel.unary_unary(
+                '/library.ReservationService/PurgeReservations',
+                request_serializer=reservation__pb2.PurgeReservationsRequest.SerializeToString,
+                response_deserializer=reservation__pb2.PurgeReservationsResponse.FromString,
+                _registered_method=True)
+        self.SetBookCopies = channel.unary_unary(
+                '/library.ReservationService/SetBookCopies',
+                request_serializer=reservation__pb2.SetBookCopiesRequest.SerializeToString,
+                response_deserializer=reservation__pb2.BookCopiesResponse.FromString,
+                _registered_method=True)
 
 
 class ReservationServiceServicer(object):
@@ -83,6 +98,24 @@ class ReservationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListReservations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PurgeReservations(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SetBookCopies(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_ReservationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -106,6 +139,21 @@ def add_ReservationServiceServicer_to_server(servicer, server):
                     request_deserializer=reservation__pb2.GetAllReservRequest.FromString,
                     response_serializer=reservation__pb2.GetAllReservResponse.SerializeToString,
             ),
+            'ListReservations': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListReservations,
+                    request_deserializer=reservation__pb2.ListReservationsRequest.FromString,
+                    response_serializer=reservation__pb2.ListReservationsResponse.SerializeToString,
+            ),
+            'PurgeReservations': grpc.unary_unary_rpc_method_handler(
+                    servicer.PurgeReservations,
+                    request_deserializer=reservation__pb2.PurgeReservationsRequest.FromString,
+                    response_serializer=reservation__pb2.PurgeReservationsResponse.SerializeToString,
+            ),
+            'SetBookCopies': grpc.unary_unary_rpc_method_handler(
+                    servicer.SetBookCopies,
+                    request_deserializer=reservation__pb2.SetBookCopiesRequest.FromString,
+                    response_serializer=reservation__pb2.BookCopiesResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'library.ReservationService', rpc_method_handlers)
@@ -224,3 +272,84 @@ class ReservationService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ListReservations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.ReservationService/ListReservations',
+            reservation__pb2.ListReservationsRequest.SerializeToString,
+            reservation__pb2.ListReservationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PurgeReservations(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.ReservationService/PurgeReservations',
+            reservation__pb2.PurgeReservationsRequest.SerializeToString,
+            reservation__pb2.PurgeReservationsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SetBookCopies(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.ReservationService/SetBookCopies',
+            reservation__pb2.SetBookCopiesRequest.SerializeToString,
+            reservation__pb2.BookCopiesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
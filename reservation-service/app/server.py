@@ -1,22 +1,38 @@
 
 import asyncio
 from grpc.experimental import aio
-from opentelemetry.instrumentation.grpc import GrpcInstrumentorServer
-from common.telemetry import setup_tracing
+from opentelemetry.instrumentation.grpc import GrpcInstrumentorServer, GrpcAioInstrumentorClient
+from common.telemetry import setup_tracing, setup_metrics
 import reservation_pb2_grpc
 from service import ReservationService
+from clients import clients
+from directory import sync_forever
+from purge import purge_forever, RESERVATION_RETENTION_DAYS
 
 setup_tracing("reservation-service")
+setup_metrics("reservation-service")
 GrpcInstrumentorServer().instrument()
+# propagates trace context on calls to user-service and book-service
+GrpcAioInstrumentorClient().instrument()
 
 async def serve():
+    # shared channels to user-service and book-service, opened once
+    clients.open()
     server = aio.server()
     #register service here
     reservation_pb2_grpc.add_ReservationServiceServicer_to_server(ReservationService(), server)
     server.add_insecure_port("[::]:5003")
     await server.start()
+    # keeps the local user/book name directory in sync
+    directory_sync = asyncio.create_task(sync_forever())
+    # archives returned reservations past their retention, if configured
+    if RESERVATION_RETENTION_DAYS > 0:
+        reservation_purge = asyncio.create_task(purge_forever())
     print("reservation-service running")
-    await server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await clients.close()
 
 if __name__ == "__main__":
     asyncio.run(serve())
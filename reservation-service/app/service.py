@@ -1,197 +1,243 @@
 import asyncio
-import aiohttp
+import time
+import grpc
 import reservation_pb2
 import reservation_pb2_grpc
-from models import Reservation, UserReservation
-from repositories import ReservationRepository
+from repositories import ReservationRepository, InventoryRepository
 from database import get_session
 from opentelemetry import trace
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+import user_pb2
+import book_pb2
+from clients import clients, LOOKUP_DEADLINE_SECONDS
+from lookups import user_names, book_names
+import directory
+from utils import to_reservation_details
+from common.paging import MAX_PAGE_SIZE, clamp_page_size, encode_page_token, decode_page_token
+from purge import purge_returned_before, PURGE_BATCH_SIZE
 
 tracer = trace.get_tracer(__name__)
 
-class ReservationService(reservation_pb2_grpc.ReservationServiceServicer):
-
-    async def ReserveBook(self, request, context):
-        with tracer.start_as_current_span("reserve_book"):
-            async with get_session() as session:
-                # Defensive validation in the service as well
-                if not getattr(request, "user_id", None) or not getattr(request, "book_id", None):
-                    context.set_code(3)  # INVALID_ARGUMENT
-                    context.set_details("user_id and book_id are required")
-                    return reservation_pb2.ReservationResponse()
+MAX_BOOKS_PER_RESERVATION = 50
+# ListReservationsRequest.status -> reservation returned?
+STATUS_FILTERS = {"": None, "ACTIVE": False, "RETURNED": True}
 
-                user_id = int(request.user_id)
-                book_id = int(request.book_id)
 
-                # Validate existence of user and book by calling the API gateway
-                gateway_url = "http://api-gateway:8080"
+class NoCopiesAvailable(Exception):
+    # raised inside the reservation transaction so it rolls back
+    def __init__(self, book_ids):
+        super().__init__(f"no copies available: {sorted(book_ids)}")
+        self.book_ids = book_ids
 
-                async def fetch(path):
-                    try:
-                        timeout = aiohttp.ClientTimeout(total=5)
-                        async with aiohttp.ClientSession(timeout=timeout) as sess:
-                            resp = await sess.get(f"{gateway_url}{path}")
-                            return resp
-                    except Exception as e:
-                        return e
 
-                user_path = f"/users/{user_id}"
-                book_path = f"/books/{book_id}"
+async def resolve_names(user_ids, book_ids):
+    # ({user_id: name}, {book_id: name}). Names come from the local
+    # directory; only ids it has no name for are looked up remotely, users
+    # and books in parallel. Names that cannot be resolved are left out.
+    users_map, unknown_users = directory.users.lookup(user_ids)
+    books_map, unknown_books = directory.books.lookup(book_ids)
+    if unknown_users or unknown_books:
+        fetched_users, fetched_books = await asyncio.gather(
+            user_names(unknown_users), book_names(unknown_books)
+        )
+        directory.users.remember(fetched_users)
+        directory.books.remember(fetched_books)
+        users_map.update(fetched_users)
+        books_map.update(fetched_books)
+    return users_map, books_map
 
-                results = await asyncio.gather(fetch(user_path), fetch(book_path))
 
-                # Check user result
-                user_res = results[0]
-                if isinstance(user_res, Exception):
-                    context.set_code(14)  # UNAVAILABLE
-                    context.set_details("user-service (via API gateway) unavailable")
-                    return reservation_pb2.ReservationResponse()
-                if user_res.status == 404 or user_res.status >= 400:
-                    context.set_code(5)  # NOT_FOUND
-                    context.set_details("user not found")
-                    return reservation_pb2.ReservationResponse()
+def lookup_failure(result, service, what):
+    # (code, details) for a failed GetUser/GetBook call, or None if it succeeded
+    if not isinstance(result, Exception):
+        return None
+    if isinstance(result, grpc.aio.AioRpcError) and result.code() == grpc.StatusCode.NOT_FOUND:
+        return 5, f"{what} not found"  # NOT_FOUND
+    return 14, f"{service} unavailable"  # UNAVAILABLE
 
-                # Check book result
-                book_res = results[1]
-                if isinstance(book_res, Exception):
-                    context.set_code(14)  # UNAVAILABLE
-                    context.set_details("book-service (via API gateway) unavailable")
-                    return reservation_pb2.ReservationResponse()
-                if book_res.status == 404 or book_res.status >= 400:
-                    context.set_code(5)  # NOT_FOUND
-                    context.set_details("book not found")
-                    return reservation_pb2.ReservationResponse()
 
-                # all validations passed — create reservation
-                reservation = Reservation(user_id=user_id)
-                await ReservationRepository.create_reservation(session, reservation)
-
-                user_reservation = UserReservation(
-                    reservation_id=reservation.reservation_id,
-                    book_id=book_id
-                )
-                await ReservationRepository.create_user_reservation(session, user_reservation)
+class ReservationService(reservation_pb2_grpc.ReservationServiceServicer):
 
-                # per reservation.proto, only reservation_id is returned
-                return reservation_pb2.ReservationResponse(reservation_id=reservation.reservation_id)
+    async def ReserveBook(self, request, context):
+        with tracer.start_as_current_span("reserve_book"):
+            # book_id is kept for single-book callers; duplicates are ignored
+            book_ids = list(dict.fromkeys(
+                ([request.book_id] if request.book_id else []) + list(request.book_ids)
+            ))
+            # Defensive validation in the service as well
+            if not request.user_id or not book_ids or any(book_id <= 0 for book_id in book_ids):
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("user_id and book_id are required")
+                return reservation_pb2.ReservationResponse()
+            if len(book_ids) > MAX_BOOKS_PER_RESERVATION:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details(f"At most {MAX_BOOKS_PER_RESERVATION} books per reservation")
+                return reservation_pb2.ReservationResponse()
+
+            user_id = int(request.user_id)
+
+            # Validate the user and all the books directly against their
+            # services, one call each and in parallel, before taking a
+            # database connection
+            user_res, books_res = await asyncio.gather(
+                clients.users.GetUser(user_pb2.GeteUserRequest(user_id=user_id), timeout=LOOKUP_DEADLINE_SECONDS),
+                clients.books.GetBooks(book_pb2.GetBooksRequest(book_id=book_ids), timeout=LOOKUP_DEADLINE_SECONDS),
+                return_exceptions=True,
+            )
+            for failure in (
+                lookup_failure(user_res, "user-service", "user"),
+                lookup_failure(books_res, "book-service", "book"),
+            ):
+                if failure:
+                    context.set_code(failure[0])
+                    context.set_details(failure[1])
+                    return reservation_pb2.ReservationResponse()
+            if books_res.missing_book_id:
+                context.set_code(5)  # NOT_FOUND
+                context.set_details(f"books not found: {sorted(books_res.missing_book_id)}")
+                return reservation_pb2.ReservationResponse()
+
+            # all validations passed — take a copy of every book, then create
+            # the reservation with all its books, in one transaction
+            try:
+                async with get_session() as session:
+                    unavailable = await InventoryRepository.take_copies(session, book_ids)
+                    if unavailable:
+                        raise NoCopiesAvailable(unavailable)
+                    reservation_id = await ReservationRepository.create_reservation(session, user_id, book_ids)
+            except NoCopiesAvailable as e:
+                context.set_code(9)  # FAILED_PRECONDITION
+                context.set_details(str(e))
+                return reservation_pb2.ReservationResponse()
+
+            # per reservation.proto, only reservation_id is returned
+            return reservation_pb2.ReservationResponse(reservation_id=reservation_id)
 
     async def Returnbook(self, request, context):
         with tracer.start_as_current_span("return_book"):
             async with get_session() as session:
-                reservation = await ReservationRepository.mark_return(session, request.reservation_id)
-                if not reservation:
+                returned = await ReservationRepository.mark_return(session, request.reservation_id)
+                if not returned:
                     context.set_code(5)  # NOT_FOUND
                     context.set_details("Reservation not found")
                     return reservation_pb2.ReservationResponse()
-                return reservation_pb2.ReservationResponse(reservation_id=reservation.reservation_id)
+                reservation_id, book_ids = returned
+                await InventoryRepository.return_copies(session, book_ids)
+            return reservation_pb2.ReservationResponse(reservation_id=reservation_id)
 
     async def DeleteReservation(self, request, context):
         with tracer.start_as_current_span("delete_reservation"):
             async with get_session() as session:
-                reservation = await ReservationRepository.delete_reservation(session, request.reservation_id)
-                if not reservation:
+                deleted = await ReservationRepository.delete_reservation(session, request.reservation_id)
+                if deleted is None:
                     context.set_code(5)
                     context.set_details("Reservation not found")
                     return reservation_pb2.ReservationResponse()
-                return reservation_pb2.ReservationResponse(reservation_id=reservation.reservation_id)
+                # copies of books that were never returned go back on the shelf
+                reservation_id, book_ids = deleted
+                await InventoryRepository.return_copies(session, book_ids)
+            return reservation_pb2.ReservationResponse(reservation_id=reservation_id)
+
+    async def SetBookCopies(self, request, context):
+        with tracer.start_as_current_span("set_book_copies"):
+            if request.book_id <= 0 or request.total_copies < 0:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("book_id and a non-negative total_copies are required")
+                return reservation_pb2.BookCopiesResponse()
+            try:
+                async with get_session() as session:
+                    book_id, total, available = await InventoryRepository.set_copies(
+                        session, request.book_id, request.total_copies
+                    )
+            except IntegrityError:
+                context.set_code(9)  # FAILED_PRECONDITION
+                context.set_details("total_copies is below the copies currently reserved")
+                return reservation_pb2.BookCopiesResponse()
+            return reservation_pb2.BookCopiesResponse(
+                book_id=book_id, total_copies=total, available_copies=available
+            )
+
+    async def PurgeReservations(self, request, context):
+        with tracer.start_as_current_span("purge_reservations"):
+            if not request.HasField("returned_before"):
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("returned_before is required")
+                return reservation_pb2.PurgeReservationsResponse()
+            batch_size = min(request.batch_size, MAX_PAGE_SIZE) if request.batch_size > 0 else PURGE_BATCH_SIZE
+            started = time.perf_counter()
+            reservations, books, batches = await purge_returned_before(
+                request.returned_before.ToDatetime(), batch_size
+            )
+            return reservation_pb2.PurgeReservationsResponse(
+                archived_reservations=reservations,
+                archived_books=books,
+                batches=batches,
+                elapsed_seconds=time.perf_counter() - started,
+            )
 
     async def GetAllReservations(self, request, context):
         with tracer.start_as_current_span("get_all_reservations"):
             async with get_session() as session:
                 rows = await ReservationRepository.get_all_reservations(session)
 
-                # Build a simple mapped list and collect unique user/book ids
-                mapped = []
-                user_ids = set()
-                book_ids = set()
-                for reservation, user_res in rows:
-                    bid = user_res.book_id if user_res else 0
-                    mapped.append({
-                        "reservation_id": reservation.reservation_id,
-                        "user_id": reservation.user_id,
-                        "user_name": "",
-                        "book_id": bid,
-                        "book_name": "",
-                    })
-                    if reservation.user_id:
-                        user_ids.add(int(reservation.user_id))
-                    if bid:
-                        book_ids.add(int(bid))
-
-                # Call API gateway to fetch user and book details in parallel
-                gateway_url = "http://api-gateway:8080"
-                async def fetch_many(paths):
-                    results = {}
-                    timeout = aiohttp.ClientTimeout(total=5)
-                    async with aiohttp.ClientSession(timeout=timeout) as sess:
-                        coros = [sess.get(f"{gateway_url}{p}") for p in paths]
-                        responses = await asyncio.gather(*coros, return_exceptions=True)
-                        for p, r in zip(paths, responses):
-                            results[p] = r
-                    return results
-
-                user_paths = [f"/users/{uid}" for uid in user_ids]
-                book_paths = [f"/books/{bid}" for bid in book_ids]
-
-                users_map = {}
-                books_map = {}
-                try:
-                    user_results = await fetch_many(user_paths) if user_paths else {}
-                    book_results = await fetch_many(book_paths) if book_paths else {}
-
-                    # parse user responses
-                    for path, resp in user_results.items():
-                        if isinstance(resp, Exception) or getattr(resp, "status", 500) >= 400:
-                            users_map[int(path.rsplit("/", 1)[1])] = None
-                            continue
-                        try:
-                            data = await resp.json()
-                        except Exception:
-                            users_map[int(path.rsplit("/", 1)[1])] = None
-                            continue
-                        # Heuristically extract a name field
-                        name = None
-                        if isinstance(data, dict):
-                            name = data.get("name") or data.get("user_name") or data.get("user") and data.get("user").get("name")
-                        users_map[int(path.rsplit("/", 1)[1])] = name or None
-
-                    # parse book responses
-                    for path, resp in book_results.items():
-                        if isinstance(resp, Exception) or getattr(resp, "status", 500) >= 400:
-                            books_map[int(path.rsplit("/", 1)[1])] = None
-                            continue
-                        try:
-                            data = await resp.json()
-                        except Exception:
-                            books_map[int(path.rsplit("/", 1)[1])] = None
-                            continue
-                        bname = None
-                        if isinstance(data, dict):
-                            # Common shapes: { book: { book_name: ... } } or { book_name: ... }
-                            if "book" in data and isinstance(data.get("book"), dict):
-                                bname = data["book"].get("book_name") or data["book"].get("name")
-                            bname = bname or data.get("book_name") or data.get("name")
-                        books_map[int(path.rsplit("/", 1)[1])] = bname or None
-                except Exception:
-                    # On any error, leave names blank — do not fail the whole call
-                    users_map = {}
-                    books_map = {}
-
-                # Build proto response items using maps
-                resp_items = []
-                for m in mapped:
-                    uid = int(m["user_id"]) if m["user_id"] else 0
-                    bid = int(m["book_id"]) if m["book_id"] else 0
-                    user_name = users_map.get(uid) if uid else ""
-                    book_name = books_map.get(bid) if bid else ""
-                    item = reservation_pb2.Reservation_details(
-                        reservation_id=m["reservation_id"],
-                        user_id=m["user_id"],
-                        user_name=user_name or "",
-                        book_id=m["book_id"],
-                        book_name=book_name or ""
-                    )
-                    resp_items.append(item)
+            user_ids = {int(reservation.user_id) for reservation, _ in rows if reservation.user_id}
+            book_ids = {int(user_res.book_id) for _, user_res in rows if user_res and user_res.book_id}
+
+            users_map, books_map = await resolve_names(user_ids, book_ids)
 
-                return reservation_pb2.GetAllReservResponse(Reservation=resp_items)
+            resp_items = []
+            for reservation, user_res in rows:
+                bid = user_res.book_id if user_res else 0
+                resp_items.append(reservation_pb2.Reservation_details(
+                    reservation_id=reservation.reservation_id,
+                    user_id=reservation.user_id,
+                    user_name=users_map.get(reservation.user_id, ""),
+                    book_id=bid,
+                    book_name=books_map.get(bid, "")
+                ))
+
+            return reservation_pb2.GetAllReservResponse(Reservation=resp_items)
+
+    async def ListReservations(self, request, context):
+        with tracer.start_as_current_span("list_reservations"):
+            if request.status not in STATUS_FILTERS:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("status must be ACTIVE, RETURNED or empty")
+                return reservation_pb2.ListReservationsResponse()
+            page_size = clamp_page_size(request.page_size)
+            try:
+                after_id = decode_page_token(request.page_token)
+            except ValueError:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("Invalid page_token")
+                return reservation_pb2.ListReservationsResponse()
+
+            filters = {
+                "user_id": request.user_id or None,
+                "book_id": request.book_id or None,
+                "returned": STATUS_FILTERS[request.status],
+                "created_from": request.created_from.ToDatetime() if request.HasField("created_from") else None,
+                "created_to": request.created_to.ToDatetime() if request.HasField("created_to") else None,
+            }
+            async with get_session() as session:
+                # fetch one extra reservation to learn whether another page exists
+                rows = await ReservationRepository.list_reservations(session, after_id, page_size + 1, **filters)
+
+            next_page_token = ""
+            reservation_ids = list(dict.fromkeys(row.reservation_id for row in rows))
+            if len(reservation_ids) > page_size:
+                last_id = reservation_ids[page_size - 1]
+                rows = [row for row in rows if row.reservation_id <= last_id]
+                next_page_token = encode_page_token(last_id)
+
+            users_map, books_map = await resolve_names(
+                {row.user_id for row in rows if row.user_id},
+                {row.book_id for row in rows if row.book_id},
+            )
+            return reservation_pb2.ListReservationsResponse(
+                Reservation=[
+                    to_reservation_details(row, users_map.get(row.user_id, ""), books_map.get(row.book_id, ""))
+                    for row in rows
+                ],
+                next_page_token=next_page_token,
+            )
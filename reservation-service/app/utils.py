@@ -0,0 +1,19 @@
+from reservation_pb2 import Reservation_details
+
+
+def to_reservation_details(row, user_name, book_name):
+    # row is a ReservationRepository.list_reservations row
+    details = Reservation_details(
+        reservation_id=row.reservation_id,
+        user_id=row.user_id or 0,
+        user_name=user_name,
+        book_id=row.book_id or 0,
+        book_name=book_name,
+    )
+    # stored as naive UTC, which is how FromDatetime reads them
+    details.reservation_created_date.FromDatetime(row.reservation_created_date)
+    if row.reservation_return_date:
+        details.reservation_return_date.FromDatetime(row.reservation_return_date)
+    if row.book_return_date:
+        details.book_return_date.FromDatetime(row.book_return_date)
+    return details
@@ -0,0 +1,118 @@
+"""Reservations per second on one hot title, and whether it oversells.
+
+CONCURRENCY tasks race to reserve a book that has COPIES copies, each in its
+own transaction, two ways:
+
+  check-then-insert  count the copies on loan, insert if one is left (what a
+                     count-based ReserveBook would do)
+  take_copies        the conditional decrement ReserveBook uses
+
+The first can hand out more copies than exist; the second must reserve
+exactly COPIES and turn every other attempt away as sold out. Needs the
+Postgres in DATABASE_URL (database.py) with the schema from
+generate_tables.sql; the user, book and reservations it creates are removed
+afterwards. Run from reservation-service/:
+
+    DATABASE_URL=postgresql+asyncpg://... PYTHONPATH=..:app python benchmarks/bench_contention.py
+"""
+import asyncio
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import select, delete, func, text
+
+from database import engine, get_session
+from models import BookInventory, UserReservation, Reservation
+from repositories import ReservationRepository, InventoryRepository
+from service import NoCopiesAvailable
+
+COPIES = 50
+CONCURRENCY = 500
+
+# reservations need a real user and book (reservation.user_id and
+# user_reservation.book_id are foreign keys), so the benchmark makes its own
+_CREATE_USER = text(
+    "INSERT INTO user_member (user_name, email_id) VALUES ('bench user', :email) RETURNING user_id"
+)
+_CREATE_BOOK = text("INSERT INTO book (book_name) VALUES ('bench hot title') RETURNING book_id")
+_DROP_USER = text("DELETE FROM user_member WHERE user_id = :user_id")
+_DROP_BOOK = text("DELETE FROM book WHERE book_id = :book_id")
+
+
+async def on_loan(session, book_id):
+    result = await session.execute(
+        select(func.count())
+        .select_from(UserReservation)
+        .where(UserReservation.book_id == book_id, UserReservation.book_return_date.is_(None))
+    )
+    return result.scalar_one()
+
+
+async def check_then_insert(user_id, book_id):
+    async with get_session() as session:
+        if await on_loan(session, book_id) >= COPIES:
+            raise NoCopiesAvailable([book_id])
+        return await ReservationRepository.create_reservation(session, user_id, [book_id])
+
+
+async def take_copies(user_id, book_id):
+    async with get_session() as session:
+        if await InventoryRepository.take_copies(session, [book_id]):
+            raise NoCopiesAvailable([book_id])
+        return await ReservationRepository.create_reservation(session, user_id, [book_id])
+
+
+async def reset(user_id, book_id):
+    async with get_session() as session:
+        await session.execute(delete(Reservation).where(Reservation.user_id == user_id))
+        await session.execute(delete(BookInventory).where(BookInventory.book_id == book_id))
+        await InventoryRepository.set_copies(session, book_id, COPIES)
+
+
+async def run(name, reserve, user_id, book_id):
+    await reset(user_id, book_id)
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(reserve(user_id, book_id) for _ in range(CONCURRENCY)), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - started
+
+    reserved = sum(1 for r in results if isinstance(r, int))
+    sold_out = sum(1 for r in results if isinstance(r, NoCopiesAvailable))
+    errors = [r for r in results if isinstance(r, BaseException) and not isinstance(r, NoCopiesAvailable)]
+    async with get_session() as session:
+        loaned = await on_loan(session, book_id)
+    print(f"{name:<20}{CONCURRENCY / elapsed:>10.0f}/s{reserved:>10}{sold_out:>10}{len(errors):>8}{loaned - COPIES:>10}")
+    return reserved, sold_out, errors
+
+
+async def main():
+    async with get_session() as session:
+        user_id = (await session.execute(_CREATE_USER, {"email": f"bench-{uuid.uuid4().hex}@example.com"})).scalar_one()
+        book_id = (await session.execute(_CREATE_BOOK)).scalar_one()
+
+    print(f"{COPIES} copies, {CONCURRENCY} concurrent reservations")
+    print(f"{'strategy':<20}{'attempts':>12}{'reserved':>10}{'sold out':>10}{'errors':>8}{'oversold':>10}")
+    try:
+        await run("check-then-insert", check_then_insert, user_id, book_id)
+        reserved, sold_out, errors = await run("take_copies", take_copies, user_id, book_id)
+    finally:
+        async with get_session() as session:
+            await session.execute(delete(Reservation).where(Reservation.user_id == user_id))
+            await session.execute(delete(BookInventory).where(BookInventory.book_id == book_id))
+            await session.execute(_DROP_BOOK, {"book_id": book_id})
+            await session.execute(_DROP_USER, {"user_id": user_id})
+        await engine.dispose()
+
+    assert not errors, f"take_copies failed with {errors[0]!r}"
+    assert reserved == COPIES, f"take_copies reserved {reserved} of {COPIES} copies"
+    assert sold_out == CONCURRENCY - COPIES, f"take_copies turned away {sold_out}, expected {CONCURRENCY - COPIES}"
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,45 @@
+"""Database tests (the in_transaction fixture) run against the Postgres in
+DATABASE_URL, with the schema from generate_tables.sql loaded, and are
+skipped without it. Every one works inside one transaction that is rolled
+back, so the seed data is left as it was. Run from reservation-service/:
+
+    DATABASE_URL=postgresql+asyncpg://... python -m pytest tests
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+if not os.getenv("DATABASE_URL"):
+    collect_ignore = ["test_inventory.py"]
+
+
+@pytest.fixture
+def in_transaction():
+    # runs test(session, user_id, book_id) in a transaction that is rolled
+    # back afterwards; user_id and book_id are rows from the seed data
+    from sqlalchemy import text
+    from database import engine, AsyncSessionLocal
+
+    def run(test):
+        async def main():
+            try:
+                async with AsyncSessionLocal() as session:
+                    user_id = (await session.execute(text("SELECT min(user_id) FROM user_member"))).scalar_one()
+                    book_id = (await session.execute(text("SELECT min(book_id) FROM book"))).scalar_one()
+                    try:
+                        await test(session, user_id, book_id)
+                    finally:
+                        await session.rollback()
+            finally:
+                # pooled connections belong to this event loop
+                await engine.dispose()
+
+        asyncio.run(main())
+
+    return run
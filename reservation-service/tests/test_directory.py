@@ -0,0 +1,40 @@
+from directory import NameDirectory
+
+
+def test_deleted_ids_resolve_blank_without_a_remote_call():
+    users = NameDirectory("users")
+    users.set(1, "ann")
+    users.set(2, "bob")
+    users.set(2, None)
+    assert users.lookup([1, 2, 3]) == ({1: "ann", 2: ""}, [3])
+
+    # recreated after the delete
+    users.set(2, "bea")
+    assert users.lookup([2]) == ({2: "bea"}, [])
+
+
+def test_remote_misses_are_kept_until_the_next_sync():
+    books = NameDirectory("books")
+    books.remember({7: "Refactoring", 8: ""})
+    assert books.lookup([7, 8, 9]) == ({7: "Refactoring", 8: ""}, [9])
+
+    books.missing.clear()
+    assert books.lookup([8]) == ({}, [8])
+
+
+def test_a_change_replaces_a_remote_miss():
+    users = NameDirectory("users")
+    users.remember({5: ""})
+    users.set(5, "cy")
+    assert users.lookup([5]) == ({5: "cy"}, [])
+
+
+def test_snapshot_keeps_deletes_but_not_remote_misses():
+    users = NameDirectory("users")
+    users.set(1, "ann")
+    users.set(2, None)
+    users.remember({3: ""})
+
+    restored = NameDirectory("users")
+    restored.load_snapshot(users.to_snapshot())
+    assert restored.lookup([1, 2, 3]) == ({1: "ann", 2: ""}, [3])
@@ -0,0 +1,72 @@
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from models import BookInventory
+from repositories import ReservationRepository, InventoryRepository
+
+
+async def untracked(session, book_id):
+    await session.execute(delete(BookInventory).where(BookInventory.book_id == book_id))
+
+
+async def copies(session, book_id):
+    result = await session.execute(
+        select(BookInventory.total_copies, BookInventory.available_copies).where(BookInventory.book_id == book_id)
+    )
+    return tuple(result.one())
+
+
+def test_set_copies_counts_open_loans(in_transaction):
+    async def test(session, user_id, book_id):
+        await untracked(session, book_id)
+        reservation_id = await ReservationRepository.create_reservation(session, user_id, [book_id])
+
+        assert tuple(await InventoryRepository.set_copies(session, book_id, 2)) == (book_id, 2, 1)
+
+        returned_id, book_ids = await ReservationRepository.mark_return(session, reservation_id)
+        await InventoryRepository.return_copies(session, book_ids)
+        assert (returned_id, book_ids) == (reservation_id, [book_id])
+        assert await copies(session, book_id) == (2, 2)
+
+    in_transaction(test)
+
+
+def test_set_copies_below_open_loans_is_rejected(in_transaction):
+    async def test(session, user_id, book_id):
+        await untracked(session, book_id)
+        await ReservationRepository.create_reservation(session, user_id, [book_id])
+        await ReservationRepository.create_reservation(session, user_id, [book_id])
+
+        with pytest.raises(IntegrityError):
+            async with session.begin_nested():
+                await InventoryRepository.set_copies(session, book_id, 1)
+
+    in_transaction(test)
+
+
+def test_return_never_exceeds_total_copies(in_transaction):
+    async def test(session, user_id, book_id):
+        # a loan that started while the title was untracked and is
+        # returned after every copy is back on the shelf
+        await untracked(session, book_id)
+        await InventoryRepository.set_copies(session, book_id, 2)
+        reservation_id = await ReservationRepository.create_reservation(session, user_id, [book_id])
+
+        _, book_ids = await ReservationRepository.mark_return(session, reservation_id)
+        await InventoryRepository.return_copies(session, book_ids)
+        assert await copies(session, book_id) == (2, 2)
+
+    in_transaction(test)
+
+
+def test_take_copies_stops_at_zero(in_transaction):
+    async def test(session, user_id, book_id):
+        await untracked(session, book_id)
+        await InventoryRepository.set_copies(session, book_id, 1)
+
+        assert await InventoryRepository.take_copies(session, [book_id]) == []
+        assert await InventoryRepository.take_copies(session, [book_id]) == [book_id]
+        assert await copies(session, book_id) == (1, 0)
+
+    in_transaction(test)
@@ -0,0 +1,27 @@
+import os
+from opentelemetry import metrics
+from common.cache import TTLCache
+
+# USER_CACHE_SIZE=0 turns the cache off entirely
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+# "not found / deleted" answers are kept for a much shorter time
+USER_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("USER_CACHE_NEGATIVE_TTL_SECONDS", "5"))
+
+meter = metrics.get_meter(__name__)
+
+# GetUserResponse messages (or NOT_FOUND) by user_id
+user_cache = TTLCache(
+    "user", USER_CACHE_SIZE, USER_CACHE_TTL_SECONDS, USER_CACHE_NEGATIVE_TTL_SECONDS, metric_prefix="user_cache"
+)
+
+
+def observe_hit_ratio(options):
+    yield metrics.Observation(user_cache.hit_ratio(), {"cache": user_cache.name})
+
+
+meter.create_observable_gauge(
+    "user_cache.hit_ratio",
+    callbacks=[observe_hit_ratio],
+    description="Fraction of user cache lookups served from the cache since start",
+)
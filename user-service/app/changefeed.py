@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import os
+from database import engine
+from repositories import USER_CHANGES_CHANNEL
+
+# WatchUsers falls back to polling user_change this often, so streams keep
+# moving even while the LISTEN connection is down
+WATCH_POLL_SECONDS = float(os.getenv("WATCH_POLL_SECONDS", "5"))
+LISTEN_RETRY_SECONDS = 5
+
+console = logging.getLogger("user-changefeed")
+
+
+class ChangeFeed:
+    """Wakes WatchUsers streams when user_change gets new rows.
+
+    One LISTEN connection per process is shared by every stream; the rows
+    themselves are always read from user_change, so a missed notification
+    only delays a stream until its next poll.
+    """
+
+    def __init__(self):
+        self.latest_seq = 0  # highest seq announced by NOTIFY so far
+        self._changed = asyncio.Event()
+
+    def _wake(self):
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _on_notify(self, connection, pid, channel, payload):
+        if payload:
+            self.latest_seq = max(self.latest_seq, int(payload))
+        self._wake()
+
+    async def wait(self, after_seq):
+        # returns once something after after_seq may have been logged, or
+        # after WATCH_POLL_SECONDS at the latest
+        if self.latest_seq > after_seq:
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), WATCH_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+    async def listen_forever(self):
+        while True:
+            try:
+                async with engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    listener = raw.driver_connection
+                    closed = asyncio.get_running_loop().create_future()
+                    listener.add_termination_listener(
+                        lambda connection: closed.done() or closed.set_result(None)
+                    )
+                    await listener.add_listener(USER_CHANGES_CHANNEL, self._on_notify)
+                    console.info("Listening on %s", USER_CHANGES_CHANNEL)
+                    # anything logged while we were not listening
+                    self._wake()
+                    try:
+                        await closed
+                    finally:
+                        if not listener.is_closed():
+                            await listener.remove_listener(USER_CHANGES_CHANNEL, self._on_notify)
+            except Exception:
+                console.exception("LISTEN %s failed", USER_CHANGES_CHANNEL)
+            await asyncio.sleep(LISTEN_RETRY_SECONDS)
+
+
+change_feed = ChangeFeed()
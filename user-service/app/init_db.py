@@ -1,10 +1,22 @@
 import asyncio
+from sqlalchemy import text, select, insert, exists, literal
 from database import engine, Base
 import models
 
 async def init_db():
     async with engine.begin() as conn:
+        # trigram index used by SearchUsers
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+        # seed an empty change log with a CREATE per existing user, so replaying
+        # WatchUsers from seq 0 yields every user
+        if not (await conn.execute(select(exists().select_from(models.UserChange)))).scalar():
+            await conn.execute(
+                insert(models.UserChange).from_select(
+                    ["user_id", "change_type"],
+                    select(models.UserMember.user_id, literal("CREATE")).order_by(models.UserMember.user_id),
+                )
+            )
 
 asyncio.run(init_db())
 # This script initializes the database by creating all tables defined in the models.
\ No newline at end of file
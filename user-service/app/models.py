@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, func, Index
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, func, Index, literal_column
 from database import Base
 
 class UserMember(Base):
@@ -16,3 +16,23 @@ class UserMember(Base):
 
 Index("idx_user_email", UserMember.email_id)
 Index("idx_user_status", UserMember.status)
+
+class UserChange(Base):
+    # append-only change log behind WatchUsers; one row per created, updated
+    # or soft-deleted user, written in the same transaction as the change
+    __tablename__ = "user_change"
+
+    seq = Column(BigInteger, primary_key=True)
+    user_id = Column(Integer, nullable=False)
+    change_type = Column(String(10), nullable=False)  # CREATE / UPDATE / DELETE
+    changed_at = Column(DateTime, server_default=func.now())
+
+# rendered as a literal rather than a bound parameter, so the planner can match
+# it to the partial indexes below even for generic (prepared) plans
+IS_ACTIVE = UserMember.status == literal_column("'ACTIVE'")
+
+# partial indexes backing SearchUsers: soft-deleted members are left out; the
+# trigram index needs the pg_trgm extension
+Index("idx_user_name_trgm", UserMember.user_name, postgresql_using="gin", postgresql_ops={"user_name": "gin_trgm_ops"}, postgresql_where=IS_ACTIVE)
+Index("idx_user_email_prefix", func.lower(UserMember.email_id).label("email_lower"), postgresql_ops={"email_lower": "text_pattern_ops"}, postgresql_where=IS_ACTIVE)
+Index("idx_user_contactno_prefix", UserMember.contactno, postgresql_ops={"contactno": "text_pattern_ops"}, postgresql_where=IS_ACTIVE)
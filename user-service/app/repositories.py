@@ -1,5 +1,151 @@
-from sqlalchemy import select
-from models import UserMember
+from sqlalchemy import select, update, func, or_, bindparam, any_, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from models import UserMember, UserChange, IS_ACTIVE
+from common.paging import stream_rows
+
+# NOTIFY channel for user_change; the payload is the highest seq logged
+USER_CHANGES_CHANNEL = "user_changes"
+# serialises change-log writers until commit, so seq order is commit order and
+# a reader that has seen seq N can never later find a committed seq below N
+CHANGE_LOG_LOCK_KEY = 0x75736572
+
+# Userdetails columns as plain rows: no UserMember entities, identity map or
+# attribute instrumentation on the listing paths
+_USER_COLUMNS = select(
+    UserMember.user_id,
+    UserMember.user_name,
+    UserMember.email_id,
+    UserMember.contactno,
+    UserMember.address,
+    UserMember.aadhar_id,
+)
+_ACTIVE_USER_BY_ID = _USER_COLUMNS.where(UserMember.user_id == bindparam("user_id"), UserMember.status == "ACTIVE")
+_ALL_ACTIVE_USERS = _USER_COLUMNS.where(UserMember.status == "ACTIVE")
+# keyset page on the primary key, so page N costs the same as page 1
+_ACTIVE_USERS_AFTER = (
+    _USER_COLUMNS.where(UserMember.status == "ACTIVE", UserMember.user_id > bindparam("after_id"))
+    .order_by(UserMember.user_id)
+    .limit(bindparam("limit", type_=Integer))
+)
+# one bound array parameter instead of an expanding IN list, so the statement
+# text is the same for any number of ids
+_ACTIVE_USERS_BY_IDS = _USER_COLUMNS.where(
+    UserMember.user_id == any_(bindparam("user_ids", type_=ARRAY(Integer))),
+    UserMember.status == "ACTIVE",
+)
+
+
+
+def _escape_like(value):
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_stmt(by_name: bool, by_email: bool, by_contactno: bool):
+    # binds :limit, :offset and, for each enabled filter, :name and
+    # :name_pattern, :email_pattern or :contactno_pattern. Every filter is
+    # ANDed with IS_ACTIVE so it can use its partial index.
+    conditions = [IS_ACTIVE]
+    order_by = [UserMember.user_id]
+    if by_name:
+        name = bindparam("name", type_=String)
+        # substring match or trigram word match (typo tolerance), both served
+        # by idx_user_name_trgm; closest names first
+        conditions.append(or_(
+            UserMember.user_name.ilike(bindparam("name_pattern", type_=String), escape="\\"),
+            UserMember.user_name.op("%>")(name),
+        ))
+        order_by.insert(0, func.word_similarity(name, UserMember.user_name).desc())
+    if by_email:
+        conditions.append(
+            func.lower(UserMember.email_id).like(bindparam("email_pattern", type_=String), escape="\\")
+        )
+    if by_contactno:
+        conditions.append(
+            UserMember.contactno.like(bindparam("contactno_pattern", type_=String), escape="\\")
+        )
+    return (
+        _USER_COLUMNS.where(*conditions)
+        .order_by(*order_by)
+        .limit(bindparam("limit", type_=Integer))
+        .offset(bindparam("offset", type_=Integer))
+    )
+
+
+# one prebuilt statement per combination of filters, keyed by
+# (by_name, by_email, by_contactno)
+_SEARCH = {
+    (by_name, by_email, by_contactno): _search_stmt(by_name, by_email, by_contactno)
+    for by_name in (False, True)
+    for by_email in (False, True)
+    for by_contactno in (False, True)
+    if by_name or by_email or by_contactno
+}
+
+# single-statement writes against the Core table: no SELECT first and no ORM
+# change tracking, and the status check in the WHERE clause makes them atomic.
+# The SET clause is taken from whichever column keys are passed as parameters.
+_USER_TABLE = UserMember.__table__
+_UPDATE_ACTIVE_USER = (
+    update(_USER_TABLE)
+    .where(_USER_TABLE.c.user_id == bindparam("target_user_id"), _USER_TABLE.c.status == "ACTIVE")
+    .returning(_USER_TABLE.c.user_id)
+)
+
+_LOCK_CHANGE_LOG = select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK_KEY))
+# logs one change_type for many users and notifies watchers; NOTIFY is only
+# delivered once the transaction commits
+_LOGGED_CHANGES = (
+    insert(UserChange)
+    .from_select(
+        ["user_id", "change_type"],
+        select(func.unnest(bindparam("user_ids", type_=ARRAY(Integer))), bindparam("change_type", type_=String)),
+    )
+    .returning(UserChange.seq)
+    .cte("logged")
+)
+_LOG_CHANGES = select(func.pg_notify(USER_CHANGES_CHANNEL, func.max(_LOGGED_CHANGES.c.seq).cast(String)))
+# changes after a seq, with the user's current details when still active
+_CHANGES_AFTER = (
+    select(
+        UserChange.seq,
+        UserChange.change_type,
+        UserChange.user_id,
+        UserMember.user_name,
+        UserMember.email_id,
+        UserMember.contactno,
+        UserMember.address,
+        UserMember.aadhar_id,
+    )
+    .outerjoin(UserMember, (UserMember.user_id == UserChange.user_id) & (UserMember.status == "ACTIVE"))
+    .where(UserChange.seq > bindparam("after_seq"))
+    .order_by(UserChange.seq)
+    .limit(bindparam("limit", type_=Integer))
+)
+# seq of the newest change; the primary key index answers max() directly
+_HEAD_SEQ = select(func.coalesce(func.max(UserChange.seq), 0))
+
+# bulk insert: one array parameter per column, unnested server side, so a
+# whole batch is one statement whose text does not depend on the batch size.
+# Rows that hit the email_id or aadhar_id unique constraint are skipped and
+# simply missing from RETURNING.
+_BULK_COLUMNS = ("user_name", "email_id", "contactno", "address", "aadhar_id")
+_BULK_ROWS = func.unnest(
+    *(bindparam(f"{column}s", type_=ARRAY(String)) for column in _BULK_COLUMNS)
+).table_valued(*_BULK_COLUMNS).render_derived()
+# on the Core table: the ORM's bulk INSERT path does not take INSERT ... SELECT
+_INSERT_USERS = (
+    insert(_USER_TABLE)
+    .from_select(list(_BULK_COLUMNS), select(*_BULK_ROWS.c))
+    .on_conflict_do_nothing()
+    .returning(_USER_TABLE.c.user_id, _USER_TABLE.c.email_id)
+)
+# existing owners (active or deleted) of any of the given emails or aadhar ids
+_TAKEN_IDENTIFIERS = select(UserMember.email_id, UserMember.aadhar_id).where(
+    or_(
+        UserMember.email_id == any_(bindparam("email_ids", type_=ARRAY(String))),
+        UserMember.aadhar_id == any_(bindparam("aadhar_ids", type_=ARRAY(String))),
+    )
+)
 
 class UserRepository:
 
@@ -7,35 +153,100 @@ class UserRepository:
     async def create(session, user: UserMember):
         session.add(user)
         await session.flush()
+        await UserRepository.log_changes(session, [user.user_id], "CREATE")
         return user
 
+    @staticmethod
+    async def log_changes(session, user_ids, change_type):
+        if not user_ids:
+            return
+        await session.execute(_LOCK_CHANGE_LOG)
+        await session.execute(_LOG_CHANGES, {"user_ids": list(user_ids), "change_type": change_type})
+
+    @staticmethod
+    async def get_changes(session, after_seq: int, limit: int):
+        result = await session.execute(_CHANGES_AFTER, {"after_seq": after_seq, "limit": limit})
+        return result.all()
+
+    @staticmethod
+    async def head_seq(session):
+        result = await session.execute(_HEAD_SEQ)
+        return result.scalar_one()
+
+    @staticmethod
+    async def create_many(session, users):
+        # users is a list of dicts keyed by _BULK_COLUMNS with unique email_ids;
+        # returns {email_id: user_id} for the rows actually inserted
+        params = {f"{column}s": [user[column] for user in users] for column in _BULK_COLUMNS}
+        result = await session.execute(_INSERT_USERS, params)
+        user_ids = {email_id: user_id for user_id, email_id in result.all()}
+        await UserRepository.log_changes(session, sorted(user_ids.values()), "CREATE")
+        return user_ids
+
+    @staticmethod
+    async def taken_identifiers(session, email_ids, aadhar_ids):
+        # (emails, aadhar ids) among the given ones that already belong to a user
+        result = await session.execute(
+            _TAKEN_IDENTIFIERS, {"email_ids": list(email_ids), "aadhar_ids": list(aadhar_ids)}
+        )
+        rows = result.all()
+        return {email for email, _ in rows}, {aadhar for _, aadhar in rows if aadhar}
+
     @staticmethod
     async def get_by_id(session, user_id: int):
-        stmt = select(UserMember).where(UserMember.user_id == user_id, UserMember.status == "ACTIVE")
-        result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        # a _USER_COLUMNS row, or None
+        result = await session.execute(_ACTIVE_USER_BY_ID, {"user_id": user_id})
+        return result.one_or_none()
 
     @staticmethod
     async def get_all_users(session):
-        stmt = select(UserMember).where(UserMember.status == "ACTIVE")
-        result = await session.execute(stmt)
-        return result.scalars().all()
+        result = await session.execute(_ALL_ACTIVE_USERS)
+        return result.all()
 
     @staticmethod
-    async def soft_delete(session, user: UserMember):
-        user.status = "DELETED"
-        await session.flush()
-        return user
+    async def get_users_by_ids(session, user_ids):
+        result = await session.execute(_ACTIVE_USERS_BY_IDS, {"user_ids": list(user_ids)})
+        return result.all()
 
     @staticmethod
-    async def update_user(session, user_id: int, **fields):
-        stmt = select(UserMember).where(UserMember.user_id == user_id, UserMember.status == "ACTIVE")
-        result = await session.execute(stmt)
-        user = result.scalar_one_or_none()
-        if not user:
-            return None
-        for k, v in fields.items():
-            if hasattr(user, k) and v is not None:
-                setattr(user, k, v)
-        await session.flush()
-        return user
+    async def get_users_page(session, after_id: int, limit: int):
+        result = await session.execute(_ACTIVE_USERS_AFTER, {"after_id": after_id, "limit": limit})
+        return result.all()
+
+    @staticmethod
+    async def search_users(session, name, email_prefix, contactno_prefix, limit: int, offset: int):
+        # empty filters are left out; at least one must be given
+        stmt = _SEARCH[(bool(name), bool(email_prefix), bool(contactno_prefix))]
+        params = {"limit": limit, "offset": offset}
+        if name:
+            params["name"] = name
+            params["name_pattern"] = f"%{_escape_like(name)}%"
+        if email_prefix:
+            params["email_pattern"] = f"{_escape_like(email_prefix.lower())}%"
+        if contactno_prefix:
+            params["contactno_pattern"] = f"{_escape_like(contactno_prefix)}%"
+        result = await session.execute(stmt, params)
+        return result.all()
+
+    @staticmethod
+    def stream_users(session, after_id: int, limit: int):
+        return stream_rows(session, _ACTIVE_USERS_AFTER, {"after_id": after_id, "limit": limit})
+
+    @staticmethod
+    async def soft_delete(session, user_id: int):
+        # returns user_id, or None if there is no active user with that id
+        result = await session.execute(_UPDATE_ACTIVE_USER, {"target_user_id": user_id, "status": "DELETED"})
+        user_id = result.scalar_one_or_none()
+        if user_id is not None:
+            await UserRepository.log_changes(session, [user_id], "DELETE")
+        return user_id
+
+    @staticmethod
+    async def update_user(session, user_id: int, fields):
+        # fields maps user_member columns to their new values; returns user_id,
+        # or None if there is no active user with that id
+        result = await session.execute(_UPDATE_ACTIVE_USER, {"target_user_id": user_id, **fields})
+        user_id = result.scalar_one_or_none()
+        if user_id is not None:
+            await UserRepository.log_changes(session, [user_id], "UPDATE")
+        return user_id
@@ -2,19 +2,30 @@
 import asyncio
 from grpc.experimental import aio
 from opentelemetry.instrumentation.grpc import GrpcInstrumentorServer
-from common.telemetry import setup_tracing
+from common.telemetry import setup_tracing, setup_metrics
 import user_pb2_grpc
 from service import UserManagementService
+from changefeed import change_feed
 
 setup_tracing("user-service")
+setup_metrics("user-service")
 GrpcInstrumentorServer().instrument()
 
+# let clients keep idle connections alive with pings (reservation-service
+# pings every 30s); the default minimum is 5 minutes
+SERVER_OPTIONS = [
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.min_recv_ping_interval_without_data_ms", 20000),
+]
+
 async def serve():
-    server = aio.server()
+    server = aio.server(options=SERVER_OPTIONS)
     #register service here
     user_pb2_grpc.add_UserServiceServicer_to_server(UserManagementService(), server)
     server.add_insecure_port("[::]:5001")
     await server.start()
+    # wakes WatchUsers streams on NOTIFY user_changes
+    change_listener = asyncio.create_task(change_feed.listen_forever())
     print("user-service running")
     await server.wait_for_termination()
 
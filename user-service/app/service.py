@@ -5,9 +5,156 @@ from repositories import UserRepository
 from database import get_session
 from opentelemetry import trace
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from utils import to_userdetails, to_get_user_response, to_user_change
+from common.paging import clamp_page_size, decode_page_token, keyset_page, offset_page, stream_in_batches
+from cache import user_cache
+from common.cache import NOT_FOUND
+from common.ingest import ingest_stream
+from changefeed import change_feed
 
 tracer = trace.get_tracer(__name__)
 
+MAX_BATCH_IDS = 1000
+# WatchUsers initial metadata: the newest seq when the stream opened
+HEAD_SEQ_HEADER = "head-seq"
+
+
+# UpdateUserRequest field -> user_member column
+UPDATABLE_FIELDS = {
+    "name": "user_name",
+    "email": "email_id",
+    "contactno": "contactno",
+    "address": "address",
+    "aadhar_id": "aadhar_id",
+}
+REQUIRED_FIELDS = {"name", "email"}
+
+
+def update_fields(request):
+    # the columns to write for an UpdateUserRequest; raises ValueError for a
+    # mask naming an unknown field or clearing a required one
+    paths = list(request.update_mask.paths) if request.HasField("update_mask") else []
+    if not paths:
+        paths = [field for field in UPDATABLE_FIELDS if getattr(request, field)]
+    fields = {}
+    for path in paths:
+        if path not in UPDATABLE_FIELDS:
+            raise ValueError(f"unknown field in update_mask: {path}")
+        value = getattr(request, path)
+        if path in REQUIRED_FIELDS and not value.strip():
+            raise ValueError(f"{path} cannot be empty")
+        # an empty aadhar_id is stored as NULL so it never trips the unique constraint
+        if path == "aadhar_id":
+            value = value.strip() or None
+        fields[UPDATABLE_FIELDS[path]] = value
+    return fields
+
+
+def create_row_problem(row):
+    if not row.name.strip():
+        return "name is required"
+    if not row.email.strip():
+        return "email is required"
+    return None
+
+
+def conflict_error(fields, where):
+    return "{} already {}".format(" and ".join(fields), where), fields
+
+
+def claim_rows(batch, seen_emails, seen_aadhars, rejected):
+    # Splits (row_number, CreateUserRequest) pairs into rows to insert now
+    # and rows to hold back for a later round, recording invalid and
+    # already-inserted identifiers in rejected. A row that repeats an
+    # identifier of an earlier row in the same batch is held back until
+    # that row's insert has succeeded or failed.
+    valid = []
+    held = []
+    emails = set()
+    aadhars = set()
+    for row_number, row in batch:
+        problem = create_row_problem(row)
+        if problem:
+            rejected[row_number] = (problem, [])
+            continue
+        email_id = row.email.strip()
+        # a blank aadhar_id is stored as NULL so it never trips the unique constraint
+        aadhar_id = row.aadhar_id.strip() or None
+        fields = []
+        if email_id in seen_emails:
+            fields.append("email_id")
+        if aadhar_id and aadhar_id in seen_aadhars:
+            fields.append("aadhar_id")
+        if fields:
+            rejected[row_number] = conflict_error(fields, "used earlier in the stream")
+            continue
+        if email_id in emails or (aadhar_id and aadhar_id in aadhars):
+            held.append((row_number, row))
+            continue
+        emails.add(email_id)
+        if aadhar_id:
+            aadhars.add(aadhar_id)
+        valid.append((row_number, {
+            "user_name": row.name.strip(),
+            "email_id": email_id,
+            "contactno": row.contactno,
+            "address": row.address,
+            "aadhar_id": aadhar_id,
+        }))
+    return valid, held
+
+
+async def insert_rows(valid, rejected):
+    # Inserts (row_number, user) pairs in a single transaction and returns
+    # {row_number: user_id}; rows that were not inserted go into rejected.
+    try:
+        async with get_session() as session:
+            user_ids = await UserRepository.create_many(session, [user for _, user in valid])
+            skipped = [(row_number, user) for row_number, user in valid if user["email_id"] not in user_ids]
+            if skipped:
+                taken_emails, taken_aadhars = await UserRepository.taken_identifiers(
+                    session,
+                    {user["email_id"] for _, user in skipped},
+                    {user["aadhar_id"] for _, user in skipped if user["aadhar_id"]},
+                )
+                for row_number, user in skipped:
+                    fields = []
+                    if user["email_id"] in taken_emails:
+                        fields.append("email_id")
+                    if user["aadhar_id"] in taken_aadhars:
+                        fields.append("aadhar_id")
+                    rejected[row_number] = conflict_error(fields or ["email_id", "aadhar_id"], "registered")
+        return {
+            row_number: user_ids[user["email_id"]]
+            for row_number, user in valid if user["email_id"] in user_ids
+        }
+    except Exception as e:
+        for row_number, _ in valid:
+            rejected[row_number] = (f"batch failed: {e}", [])
+        return {}
+
+
+async def create_batch(batch, seen_emails, seen_aadhars):
+    # Inserts one batch of (row_number, CreateUserRequest) and returns
+    # ({row_number: user_id}, {row_number: (error, conflict_fields)}).
+    # seen_emails/seen_aadhars map identifiers to the row that inserted them
+    # earlier in the stream; only rows that were actually inserted are added.
+    inserted = {}
+    rejected = {}
+    while batch:
+        valid, batch = claim_rows(batch, seen_emails, seen_aadhars, rejected)
+        if not valid:
+            continue
+        round_inserted = await insert_rows(valid, rejected)
+        for row_number, user in valid:
+            if row_number in round_inserted:
+                seen_emails[user["email_id"]] = row_number
+                if user["aadhar_id"]:
+                    seen_aadhars[user["aadhar_id"]] = row_number
+        inserted.update(round_inserted)
+    return inserted, rejected
+
 class UserManagementService(user_pb2_grpc.UserServiceServicer):
 
     async def CreateUser(self, request, context):
@@ -21,65 +168,184 @@ class UserManagementService(user_pb2_grpc.UserServiceServicer):
                     aadhar_id=request.aadhar_id
                 )
                 await UserRepository.create(session, user)
-                return user_pb2.UserResponse(user_id=user.user_id)
+            # drop a "not found" cached by a lookup that raced ahead of the insert
+            user_cache.invalidate(user.user_id)
+            return user_pb2.UserResponse(user_id=user.user_id)
+
+    async def CreateUsers(self, request_iterator, context):
+        with tracer.start_as_current_span("create_users"):
+            seen_emails = {}
+            seen_aadhars = {}
+
+            async def write_batch(batch):
+                inserted, rejected = await create_batch(batch, seen_emails, seen_aadhars)
+                for user_id in inserted.values():
+                    user_cache.invalidate(user_id)
+                return inserted, rejected
+
+            result = await ingest_stream(request_iterator, write_batch)
+            return user_pb2.CreateUsersResponse(
+                inserted_count=result.written,
+                rejected_count=result.rejected_count,
+                error=[
+                    user_pb2.CreateUserRowError(row_number=row_number, error=error, conflict_field=fields)
+                    for row_number, (error, fields) in result.errors
+                ],
+                elapsed_seconds=result.elapsed_seconds,
+                rows_per_second=result.rows_per_second,
+            )
 
     async def GetUser(self, request, context):
         with tracer.start_as_current_span("get_user"):
+            generation = user_cache.generation(request.user_id)
+            cached = user_cache.get(request.user_id)
+            if cached is None:
+                async with get_session() as session:
+                    user = await UserRepository.get_by_id(session, request.user_id)
+                cached = to_get_user_response(user) if user else NOT_FOUND
+                # not stored if an UpdateUser/DeleteUser invalidated it meanwhile
+                user_cache.set(request.user_id, cached, generation)
+
+            if cached is NOT_FOUND:
+                context.set_code(5)  # NOT_FOUND
+                context.set_details("User not found")
+                return user_pb2.GetUserResponse()
+            return cached
+
+    async def GetUsers(self, request, context):
+        with tracer.start_as_current_span("get_users"):
+            user_ids = set(request.user_id)
+            if len(user_ids) > MAX_BATCH_IDS:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details(f"At most {MAX_BATCH_IDS} user ids per request")
+                return user_pb2.GetUsersResponse()
+            if not user_ids:
+                return user_pb2.GetUsersResponse()
+
             async with get_session() as session:
-                user = await UserRepository.get_by_id(session, request.user_id)
-                if not user:
-                    context.set_code(5)  # NOT_FOUND
-                    context.set_details("User not found")
-                    return user_pb2.GetUserResponse()
-                return user_pb2.GetUserResponse(
-                    name=user.user_name,
-                    email=user.email_id,
-                    contactno=user.contactno,
-                    address=user.address,
-                    aadhar_id=user.aadhar_id
-                )
+                rows = await UserRepository.get_users_by_ids(session, user_ids)
+
+            users = {row.user_id: to_userdetails(row) for row in rows}
+            missing = sorted(user_ids - users.keys())
+            return user_pb2.GetUsersResponse(users=users, missing_user_id=missing)
 
     async def UpdateUser(self, request, context):
         with tracer.start_as_current_span("update_user"):
-            async with get_session() as session:
-                user = await UserRepository.update_user(
-                    session,
-                    request.user_id if hasattr(request, 'user_id') else None,
-                    user_name=request.name,
-                    email_id=request.email,
-                    contactno=request.contactno,
-                    address=request.address,
-                    aadhar_id=request.aadhar_id
-                )
-                if not user:
-                    context.set_code(5)
-                    context.set_details("User not found")
-                    return user_pb2.UserResponse()
-                return user_pb2.UserResponse(user_id=user.user_id)
+            try:
+                fields = update_fields(request)
+            except ValueError as e:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details(str(e))
+                return user_pb2.UserResponse()
+            try:
+                async with get_session() as session:
+                    if fields:
+                        user_id = await UserRepository.update_user(session, request.user_id, fields)
+                    else:
+                        # nothing to write; still report whether the user exists
+                        user = await UserRepository.get_by_id(session, request.user_id)
+                        user_id = user.user_id if user else None
+            except IntegrityError:
+                context.set_code(6)  # ALREADY_EXISTS
+                context.set_details("email or aadhar_id already registered")
+                return user_pb2.UserResponse()
+            if user_id is None:
+                context.set_code(5)
+                context.set_details("User not found")
+                return user_pb2.UserResponse()
+            # invalidate only once the transaction has committed
+            user_cache.invalidate(user_id)
+            return user_pb2.UserResponse(user_id=user_id)
 
     async def DeleteUser(self, request, context):
         with tracer.start_as_current_span("delete_user"):
             async with get_session() as session:
-                user = await UserRepository.get_by_id(session, request.user_id)
-                if not user:
-                    context.set_code(5)
-                    context.set_details("User not found")
-                    return user_pb2.UserResponse()
-                await UserRepository.soft_delete(session, user)
-                return user_pb2.UserResponse(user_id=user.user_id)
+                user_id = await UserRepository.soft_delete(session, request.user_id)
+            if user_id is None:
+                context.set_code(5)
+                context.set_details("User not found")
+                return user_pb2.UserResponse()
+            user_cache.invalidate(user_id)
+            return user_pb2.UserResponse(user_id=user_id)
 
     async def GetAllUsers(self, request, context):
         with tracer.start_as_current_span("get_all_users"):
             async with get_session() as session:
-                users = await UserRepository.get_all_users(session)
-                user_msgs = []
-                for u in users:
-                    user_msgs.append(user_pb2.Userdetails(
-                        user_id=u.user_id,
-                        name=u.user_name,
-                        email=u.email_id,
-                        contactno=u.contactno or "",
-                        address=u.address or "",
-                        aadhar_id=u.aadhar_id or ""
-                    ))
-                return user_pb2.GetAllUsersResponse(User=user_msgs)
+                rows = await UserRepository.get_all_users(session)
+            return user_pb2.GetAllUsersResponse(User=[to_userdetails(row) for row in rows])
+
+    async def ListUsers(self, request, context):
+        with tracer.start_as_current_span("list_users"):
+            page_size = clamp_page_size(request.page_size)
+            try:
+                after_id = decode_page_token(request.page_token)
+            except ValueError:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("Invalid page_token")
+                return user_pb2.ListUsersResponse()
+
+            async with get_session() as session:
+                rows, next_page_token = await keyset_page(
+                    lambda after_id, limit: UserRepository.get_users_page(session, after_id, limit),
+                    after_id, page_size, key=lambda row: row.user_id,
+                )
+            return user_pb2.ListUsersResponse(
+                User=[to_userdetails(row) for row in rows],
+                next_page_token=next_page_token,
+            )
+
+    async def SearchUsers(self, request, context):
+        with tracer.start_as_current_span("search_users"):
+            name = request.name.strip()
+            email = request.email.strip()
+            contactno = request.contactno.strip()
+            if not (name or email or contactno):
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("One of name, email or contactno is required")
+                return user_pb2.SearchUsersResponse()
+            page_size = clamp_page_size(request.page_size)
+            try:
+                offset = decode_page_token(request.page_token)
+            except ValueError:
+                context.set_code(3)  # INVALID_ARGUMENT
+                context.set_details("Invalid page_token")
+                return user_pb2.SearchUsersResponse()
+
+            async with get_session() as session:
+                rows, next_page_token = await offset_page(
+                    lambda offset, limit: UserRepository.search_users(session, name, email, contactno, limit, offset),
+                    offset, page_size,
+                )
+            return user_pb2.SearchUsersResponse(
+                User=[to_userdetails(row) for row in rows],
+                next_page_token=next_page_token,
+            )
+
+    async def StreamUsers(self, request, context):
+        with tracer.start_as_current_span("stream_users"):
+            batch_size = clamp_page_size(request.batch_size)
+            after_id = max(request.after_user_id, 0)
+            rows = stream_in_batches(
+                get_session, UserRepository.stream_users, after_id, batch_size, key=lambda row: row.user_id
+            )
+            async for row in rows:
+                yield to_userdetails(row)
+
+    async def WatchUsers(self, request, context):
+        with tracer.start_as_current_span("watch_users"):
+            batch_size = clamp_page_size(request.batch_size)
+            after_seq = max(request.after_seq, 0)
+            async with get_session() as session:
+                head_seq = await UserRepository.head_seq(session)
+            # headers go out now, so a client can tell it is subscribed before
+            # the first change arrives; head-seq tells it when it has caught up
+            await context.send_initial_metadata(((HEAD_SEQ_HEADER, str(head_seq)),))
+            # runs until the client cancels the stream
+            while True:
+                async with get_session() as session:
+                    rows = await UserRepository.get_changes(session, after_seq, batch_size)
+                for row in rows:
+                    yield to_user_change(row)
+                    after_seq = row.seq
+                if len(rows) < batch_size:
+                    await change_feed.wait(after_seq)
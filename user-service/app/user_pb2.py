@@ -22,33 +22,60 @@ _runtime_version.ValidateProtobufRuntimeVersion(
 _sym_db = _symbol_database.Default()
 
 
+from google.protobuf import field_mask_pb2 as google_dot_protobuf_dot_field__mask__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nuser.proto\x12\x07library\"g\n\x11\x43reateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tcontactno\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x11\n\taadhar_id\x18\x05 \x01(\t\"\x1f\n\x0cUserResponse\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"g\n\x11UpdateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tcontactno\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x11\n\taadhar_id\x18\x05 \x01(\t\"$\n\x11\x44\x65leteUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\"\n\x0fGeteUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"e\n\x0fGetUserResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tcontactno\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x11\n\taadhar_id\x18\x05 \x01(\t\"\x14\n\x12GetAllUsersRequest\"r\n\x0bUserdetails\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x11\n\tcontactno\x18\x04 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x05 \x01(\t\x12\x11\n\taadhar_id\x18\x06 \x01(\t\"9\n\x13GetAllUsersResponse\x12\"\n\x04User\x18\x01 \x03(\x0b\x32\x14.library.Userdetails2\xd9\x02\n\x0bUserService\x12?\n\nCreateUser\x12\x1a.library.CreateUserRequest\x1a\x15.library.UserResponse\x12?\n\nUpdateUser\x12\x1a.library.UpdateUserRequest\x1a\x15.library.UserResponse\x12?\n\nDeleteUser\x12\x1a.library.DeleteUserRequest\x1a\x15.library.UserResponse\x12=\n\x07GetUser\x12\x18.library.GeteUserRequest\x1a\x18.library.GetUserResponse\x12H\n\x0bGetAllUsers\x12\x1b.library.GetAllUsersRequest\x1a\x1c.library.GetAllUsersResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\nuser.proto\x12\x07library\x1a google/protobuf/field_mask.proto\"g\n\x11\x43reateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tcontactno\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x11\n\taadhar_id\x18\x05 \x01(\t\"\x1f\n\x0cUserResponse\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"O\n\x12\x43reateUserRowError\x12\x12\n\nrow_number\x18\x01 \x01(\x05\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x16\n\x0e\x63onflict_field\x18\x03 \x03(\t\"\xa3\x01\n\x13\x43reateUsersResponse\x12\x16\n\x0einserted_count\x18\x01 \x01(\x05\x12\x16\n\x0erejected_count\x18\x02 \x01(\x05\x12*\n\x05\x65rror\x18\x03 \x03(\x0b\x32\x1b.library.CreateUserRowError\x12\x17\n\x0f\x65lapsed_seconds\x18\x04 \x01(\x01\x12\x17\n\x0frows_per_second\x18\x05 \x01(\x01\"\xa9\x01\n\x11UpdateUserRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tcontactno\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x11\n\taadhar_id\x18\x05 \x01(\t\x12\x0f\n\x07user_id\x18\x06 \x01(\x05\x12/\n\x0bupdate_mask\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.FieldMask\"$\n\x11\x44\x65leteUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"\"\n\x0fGeteUserRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\"e\n\x0fGetUserResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tcontactno\x18\x03 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x04 \x01(\t\x12\x11\n\taadhar_id\x18\x05 \x01(\t\"\"\n\x0fGetUsersRequest\x12\x0f\n\x07user_id\x18\x01 \x03(\x05\"\xa4\x01\n\x10GetUsersResponse\x12\x33\n\x05users\x18\x01 \x03(\x0b\x32$.library.GetUsersResponse.UsersEntry\x12\x17\n\x0fmissing_user_id\x18\x02 \x03(\x05\x1a\x42\n\nUsersEntry\x12\x0b\n\x03key\x18\x01 \x01(\x05\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.library.Userdetails:\x02\x38\x01\"\x14\n\x12GetAllUsersRequest\"r\n\x0bUserdetails\x12\x0f\n\x07user_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12\x11\n\tcontactno\x18\x04 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x05 \x01(\t\x12\x11\n\taadhar_id\x18\x06 \x01(\t\"9\n\x13GetAllUsersResponse\x12\"\n\x04User\x18\x01 \x03(\x0b\x32\x14.library.Userdetails\"9\n\x10ListUsersRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\"P\n\x11ListUsersResponse\x12\"\n\x04User\x18\x01 \x03(\x0b\x32\x14.library.Userdetails\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"k\n\x12SearchUsersRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tcontactno\x18\x03 \x01(\t\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"R\n\x13SearchUsersResponse\x12\"\n\x04User\x18\x01 \x03(\x0b\x32\x14.library.Userdetails\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\"?\n\x12StreamUsersRequest\x12\x12\n\nbatch_size\x18\x01 \x01(\x05\x12\x15\n\rafter_user_id\x18\x02 \x01(\x05\":\n\x11WatchUsersRequest\x12\x11\n\tafter_seq\x18\x01 \x01(\x03\x12\x12\n\nbatch_size\x18\x02 \x01(\x05\"c\n\nUserChange\x12\x0b\n\x03seq\x18\x01 \x01(\x03\x12\x0f\n\x07user_id\x18\x02 \x01(\x05\x12\x13\n\x0b\x63hange_type\x18\x03 \x01(\t\x12\"\n\x04user\x18\x04 \x01(\x0b\x32\x14.library.Userdetails2\xf8\x05\n\x0bUserService\x12?\n\nCreateUser\x12\x1a.library.CreateUserRequest\x1a\x15.library.UserResponse\x12I\n\x0b\x43reateUsers\x12\x1a.library.CreateUserRequest\x1a\x1c.library.CreateUsersResponse(\x01\x12?\n\nUpdateUser\x12\x1a.library.UpdateUserRequest\x1a\x15.library.UserResponse\x12?\n\nDeleteUser\x12\x1a.library.DeleteUserRequest\x1a\x15.library.UserResponse\x12=\n\x07GetUser\x12\x18.library.GeteUserRequest\x1a\x18.library.GetUserResponse\x12?\n\x08GetUsers\x12\x18.library.GetUsersRequest\x1a\x19.library.GetUsersResponse\x12H\n\x0bGetAllUsers\x12\x1b.library.GetAllUsersRequest\x1a\x1c.library.GetAllUsersResponse\x12\x42\n\tListUsers\x12\x19.library.ListUsersRequest\x1a\x1a.library.ListUsersResponse\x12H\n\x0bSearchUsers\x12\x1b.library.SearchUsersRequest\x1a\x1c.library.SearchUsersResponse\x12\x42\n\x0bStreamUsers\x12\x1b.library.StreamUsersRequest\x1a\x14.library.Userdetails0\x01\x12?\n\nWatchUsers\x12\x1a.library.WatchUsersRequest\x1a\x13.library.UserChange0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'user_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_CREATEUSERREQUEST']._serialized_start=23
-  _globals['_CREATEUSERREQUEST']._serialized_end=126
-  _globals['_USERRESPONSE']._serialized_start=128
-  _globals['_USERRESPONSE']._serialized_end=159
-  _globals['_UPDATEUSERREQUEST']._serialized_start=161
-  _globals['_UPDATEUSERREQUEST']._serialized_end=264
-  _globals['_DELETEUSERREQUEST']._serialized_start=266
-  _globals['_DELETEUSERREQUEST']._serialized_end=302
-  _globals['_GETEUSERREQUEST']._serialized_start=304
-  _globals['_GETEUSERREQUEST']._serialized_end=338
-  _globals['_GETUSERRESPONSE']._serialized_start=340
-  _globals['_GETUSERRESPONSE']._serialized_end=441
-  _globals['_GETALLUSERSREQUEST']._serialized_start=443
-  _globals['_GETALLUSERSREQUEST']._serialized_end=463
-  _globals['_USERDETAILS']._serialized_start=465
-  _globals['_USERDETAILS']._serialized_end=579
-  _globals['_GETALLUSERSRESPONSE']._serialized_start=581
-  _globals['_GETALLUSERSRESPONSE']._serialized_end=638
-  _globals['_USERSERVICE']._serialized_start=641
-  _globals['_USERSERVICE']._serialized_end=986
+  _globals['_GETUSERSRESPONSE_USERSENTRY']._loaded_options = None
+  _globals['_GETUSERSRESPONSE_USERSENTRY']._serialized_options = b'8\001'
+  _globals['_CREATEUSERREQUEST']._serialized_start=57
+  _globals['_CREATEUSERREQUEST']._serialized_end=160
+  _globals['_USERRESPONSE']._serialized_start=162
+  _globals['_USERRESPONSE']._serialized_end=193
+  _globals['_CREATEUSERROWERROR']._serialized_start=195
+  _globals['_CREATEUSERROWERROR']._serialized_end=274
+  _globals['_CREATEUSERSRESPONSE']._serialized_start=277
+  _globals['_CREATEUSERSRESPONSE']._serialized_end=440
+  _globals['_UPDATEUSERREQUEST']._serialized_start=443
+  _globals['_UPDATEUSERREQUEST']._serialized_end=612
+  _globals['_DELETEUSERREQUEST']._serialized_start=614
+  _globals['_DELETEUSERREQUEST']._serialized_end=650
+  _globals['_GETEUSERREQUEST']._serialized_start=652
+  _globals['_GETEUSERREQUEST']._serialized_end=686
+  _globals['_GETUSERRESPONSE']._serialized_start=688
+  _globals['_GETUSERRESPONSE']._serialized_end=789
+  _globals['_GETUSERSREQUEST']._serialized_start=791
+  _globals['_GETUSERSREQUEST']._serialized_end=825
+  _globals['_GETUSERSRESPONSE']._serialized_start=828
+  _globals['_GETUSERSRESPONSE']._serialized_end=992
+  _globals['_GETUSERSRESPONSE_USERSENTRY']._serialized_start=926
+  _globals['_GETUSERSRESPONSE_USERSENTRY']._serialized_end=992
+  _globals['_GETALLUSERSREQUEST']._serialized_start=994
+  _globals['_GETALLUSERSREQUEST']._serialized_end=1014
+  _globals['_USERDETAILS']._serialized_start=1016
+  _globals['_USERDETAILS']._serialized_end=1130
+  _globals['_GETALLUSERSRESPONSE']._serialized_start=1132
+  _globals['_GETALLUSERSRESPONSE']._serialized_end=1189
+  _globals['_LISTUSERSREQUEST']._serialized_start=1191
+  _globals['_LISTUSERSREQUEST']._serialized_end=1248
+  _globals['_LISTUSERSRESPONSE']._serialized_start=1250
+  _globals['_LISTUSERSRESPONSE']._serialized_end=1330
+  _globals['_SEARCHUSERSREQUEST']._serialized_start=1332
+  _globals['_SEARCHUSERSREQUEST']._serialized_end=1439
+  _globals['_SEARCHUSERSRESPONSE']._serialized_start=1441
+  _globals['_SEARCHUSERSRESPONSE']._serialized_end=1523
+  _globals['_STREAMUSERSREQUEST']._serialized_start=1525
+  _globals['_STREAMUSERSREQUEST']._serialized_end=1588
+  _globals['_WATCHUSERSREQUEST']._serialized_start=1590
+  _globals['_WATCHUSERSREQUEST']._serialized_end=1648
+  _globals['_USERCHANGE']._serialized_start=1650
+  _globals['_USERCHANGE']._serialized_end=1749
+  _globals['_USERSERVICE']._serialized_start=1752
+  _globals['_USERSERVICE']._serialized_end=2512
 # @@protoc_insertion_point(module_scope)
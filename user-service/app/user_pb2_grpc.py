@@ -39,6 +39,11 @@ class UserServiceStub(object):
                 request_serializer=user__pb2.CreateUserRequest.SerializeToString,
                 response_deserializer=user__pb2.UserResponse.FromString,
                 _registered_method=True)
+        self.CreateUsers = channel.stream_unary(
+                '/library.UserService/CreateUsers',
+                request_serializer=user__pb2.CreateUserRequest.SerializeToString,
+                response_deserializer=user__pb2.CreateUsersResponse.FromString,
+                _registered_method=True)
         self.UpdateUser = channel.unary_unary(
                 '/library.UserService/UpdateUser',
                 request_serializer=user__pb2.UpdateUserRequest.SerializeToString,
@@ -54,11 +59,36 @@ class UserServiceStub(object):
                 request_serializer=user__pb2.GeteUserRequest.SerializeToString,
                 response_deserializer=user__pb2.GetUserResponse.FromString,
                 _registered_method=True)
+        self.GetUsers = channel.unary_unary(
+                '/library.UserService/GetUsers',
+                request_serializer=user__pb2.GetUsersRequest.SerializeToString,
+                response_deserializer=user__pb2.GetUsersResponse.FromString,
+                _registered_method=True)
         self.GetAllUsers = channel.unary_unary(
                 '/library.UserService/GetAllUsers',
                 request_serializer=user__pb2.GetAllUsersRequest.SerializeToString,
                 response_deserializer=user__pb2.GetAllUsersResponse.FromString,
                 _registered_method=True)
+        self.ListUsers = channel.unary_unary(
+                '/library.UserService/ListUsers',
+                request_serializer=user__pb2.ListUsersRequest.SerializeToString,
+                response_deserializer=user__pb2.ListUsersResponse.FromString,
+                _registered_method=True)
+        self.SearchUsers = channel.unary_unary(
+                '/library.UserService/SearchUsers',
+                request_serializer=user__pb2.SearchUsersRequest.SerializeToString,
+                response_deserializer=user__pb2.SearchUsersResponse.FromString,
+                _registered_method=True)
+        self.StreamUsers = channel.unary_stream(
+                '/library.UserService/StreamUsers',
+                request_serializer=user__pb2.StreamUsersRequest.SerializeToString,
+                response_deserializer=user__pb2.Userdetails.FromString,
+                _registered_method=True)
+        self.WatchUsers = channel.unary_stream(
+                '/library.UserService/WatchUsers',
+                request_serializer=user__pb2.WatchUsersRequest.SerializeToString,
+                response_deserializer=user__pb2.UserChange.FromString,
+                _registered_method=True)
 
 
 class UserServiceServicer(object):
@@ -70,6 +100,12 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def CreateUsers(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UpdateUser(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -88,12 +124,42 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetAllUsers(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ListUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_UserServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -102,6 +168,11 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=user__pb2.CreateUserRequest.FromString,
                     response_serializer=user__pb2.UserResponse.SerializeToString,
             ),
+            'CreateUsers': grpc.stream_unary_rpc_method_handler(
+                    servicer.CreateUsers,
+                    request_deserializer=user__pb2.CreateUserRequest.FromString,
+                    response_serializer=user__pb2.CreateUsersResponse.SerializeToString,
+            ),
             'UpdateUser': grpc.unary_unary_rpc_method_handler(
                     servicer.UpdateUser,
                     request_deserializer=user__pb2.UpdateUserRequest.FromString,
@@ -117,11 +188,36 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=user__pb2.GeteUserRequest.FromString,
                     response_serializer=user__pb2.GetUserResponse.SerializeToString,
             ),
+            'GetUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUsers,
+                    request_deserializer=user__pb2.GetUsersRequest.FromString,
+                    response_serializer=user__pb2.GetUsersResponse.SerializeToString,
+            ),
             'GetAllUsers': grpc.unary_unary_rpc_method_handler(
                     servicer.GetAllUsers,
                     request_deserializer=user__pb2.GetAllUsersRequest.FromString,
                     response_serializer=user__pb2.GetAllUsersResponse.SerializeToString,
             ),
+            'ListUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListUsers,
+                    request_deserializer=user__pb2.ListUsersRequest.FromString,
+                    response_serializer=user__pb2.ListUsersResponse.SerializeToString,
+            ),
+            'SearchUsers': grpc.unary_unary_rpc_method_handler(
+                    servicer.SearchUsers,
+                    request_deserializer=user__pb2.SearchUsersRequest.FromString,
+                    response_serializer=user__pb2.SearchUsersResponse.SerializeToString,
+            ),
+            'StreamUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamUsers,
+                    request_deserializer=user__pb2.StreamUsersRequest.FromString,
+                    response_serializer=user__pb2.Userdetails.SerializeToString,
+            ),
+            'WatchUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchUsers,
+                    request_deserializer=user__pb2.WatchUsersRequest.FromString,
+                    response_serializer=user__pb2.UserChange.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'library.UserService', rpc_method_handlers)
@@ -160,6 +256,33 @@ class UserService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def CreateUsers(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/library.UserService/CreateUsers',
+            user__pb2.CreateUserRequest.SerializeToString,
+            user__pb2.CreateUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UpdateUser(request,
             target,
@@ -241,6 +364,33 @@ class UserService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.UserService/GetUsers',
+            user__pb2.GetUsersRequest.SerializeToString,
+            user__pb2.GetUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetAllUsers(request,
             target,
@@ -267,3 +417,111 @@ class UserService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def ListUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.UserService/ListUsers',
+            user__pb2.ListUsersRequest.SerializeToString,
+            user__pb2.ListUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/library.UserService/SearchUsers',
+            user__pb2.SearchUsersRequest.SerializeToString,
+            user__pb2.SearchUsersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/library.UserService/StreamUsers',
+            user__pb2.StreamUsersRequest.SerializeToString,
+            user__pb2.Userdetails.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WatchUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/library.UserService/WatchUsers',
+            user__pb2.WatchUsersRequest.SerializeToString,
+            user__pb2.UserChange.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
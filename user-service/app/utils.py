@@ -0,0 +1,33 @@
+from user_pb2 import Userdetails, GetUserResponse, UserChange
+
+
+def to_userdetails(row):
+    user_id, user_name, email_id, contactno, address, aadhar_id = row
+    return Userdetails(
+        user_id=user_id,
+        name=user_name,
+        email=email_id,
+        contactno=contactno or "",
+        address=address or "",
+        aadhar_id=aadhar_id or ""
+    )
+
+
+def to_get_user_response(row):
+    _, user_name, email_id, contactno, address, aadhar_id = row
+    return GetUserResponse(
+        name=user_name,
+        email=email_id,
+        contactno=contactno or "",
+        address=address or "",
+        aadhar_id=aadhar_id or ""
+    )
+
+
+def to_user_change(row):
+    seq, change_type, user_id, user_name, email_id, contactno, address, aadhar_id = row
+    change = UserChange(seq=seq, user_id=user_id, change_type=change_type)
+    # user columns are NULL when the user is no longer active
+    if user_name is not None:
+        change.user.CopyFrom(to_userdetails((user_id, user_name, email_id, contactno, address, aadhar_id)))
+    return change
@@ -0,0 +1,91 @@
+"""Rows per second for user reads: ORM entities vs Core column rows.
+
+Both paths run the same query against an in-memory SQLite copy of the
+user_member table, so driver and network cost are equal and what differs is
+the Python side: entity construction, identity map and attribute
+instrumentation vs plain tuples, each mapped into Userdetails. No Postgres is
+needed. Run from user-service/:
+
+    PYTHONPATH=..:app python benchmarks/bench_reads.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from sqlalchemy import create_engine, select, insert
+from sqlalchemy.orm import Session
+
+import repositories
+from models import UserMember
+from user_pb2 import Userdetails
+from utils import to_userdetails
+
+USERS = 50000
+ROUNDS = 5
+
+
+def legacy_get_all_users(session):
+    # GetAllUsers as it was: UserMember entities copied field by field
+    users = session.execute(select(UserMember).where(UserMember.status == "ACTIVE")).scalars().all()
+    return [
+        Userdetails(
+            user_id=u.user_id,
+            name=u.user_name,
+            email=u.email_id,
+            contactno=u.contactno or "",
+            address=u.address or "",
+            aadhar_id=u.aadhar_id or "",
+        )
+        for u in users
+    ]
+
+
+def core_get_all_users(session):
+    rows = session.execute(repositories._ALL_ACTIVE_USERS).all()
+    return [to_userdetails(row) for row in rows]
+
+
+def seed(engine):
+    UserMember.__table__.create(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(UserMember), [
+            {
+                "user_name": f"Member {i}",
+                "email_id": f"member{i}@example.org",
+                "contactno": f"98{i:08d}",
+                "address": f"{i} Library Road",
+                "aadhar_id": f"{i:012d}",
+                "status": "ACTIVE",
+            }
+            for i in range(USERS)
+        ])
+
+
+def rows_per_second(engine, read):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        # a fresh session per round, as each RPC gets its own
+        with Session(engine) as session:
+            started = time.perf_counter()
+            messages = read(session)
+            best = min(best, time.perf_counter() - started)
+        assert len(messages) == USERS
+    return USERS / best
+
+
+def main():
+    engine = create_engine("sqlite://")
+    seed(engine)
+    before = rows_per_second(engine, legacy_get_all_users)
+    after = rows_per_second(engine, core_get_all_users)
+    print(f"{'path':<22}{'rows/s':>12}")
+    print(f"{'ORM entities':<22}{before:>12,.0f}")
+    print(f"{'Core column rows':<22}{after:>12,.0f}")
+    print(f"speedup {after / before:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
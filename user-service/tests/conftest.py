@@ -0,0 +1,10 @@
+"""Unit tests; no database or other services are needed. Run from
+user-service/:
+
+    python -m pytest tests
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "app"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
@@ -0,0 +1,59 @@
+from common.cache import TTLCache, NOT_FOUND
+
+
+def make_cache(max_entries=10):
+    return TTLCache("test", max_entries, ttl_seconds=60, negative_ttl_seconds=5)
+
+
+def test_read_stores_value_when_nothing_changed():
+    cache = make_cache()
+    generation = cache.generation(1)
+    cache.set(1, "user 1", generation)
+    assert cache.get(1) == "user 1"
+
+
+def test_invalidate_between_read_and_set_drops_the_read():
+    # GetUser reads the row, DeleteUser commits and invalidates, then
+    # GetUser tries to store the row it read before the delete
+    cache = make_cache()
+    cache.set(1, "user 1")
+    cache.get(1)
+    cache.invalidate(1)
+
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    cache.set(1, "user 1", generation)
+    assert cache.get(1) is None
+
+    # the next read, after the delete, is stored
+    generation = cache.generation(1)
+    cache.set(1, NOT_FOUND, generation)
+    assert cache.get(1) is NOT_FOUND
+
+
+def test_invalidating_another_key_does_not_drop_the_read():
+    cache = make_cache()
+    generation = cache.generation(1)
+    cache.invalidate(2)
+    cache.set(1, "user 1", generation)
+    assert cache.get(1) == "user 1"
+
+
+def test_clear_between_read_and_set_drops_the_read():
+    cache = make_cache()
+    generation = cache.generation("all")
+    cache.clear()
+    cache.set("all", "catalog", generation)
+    assert cache.get("all") is None
+
+
+def test_invalidation_is_remembered_after_its_generation_is_dropped():
+    # only max_entries generations are kept; a key pushed out of them must
+    # still not accept a read that started before its invalidation
+    cache = make_cache(max_entries=2)
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    cache.invalidate(2)
+    cache.invalidate(3)
+    cache.set(1, "user 1", generation)
+    assert cache.get(1) is None
@@ -0,0 +1,108 @@
+import asyncio
+
+import user_pb2
+import service
+from service import claim_rows, create_batch
+
+
+def row(name="Asha", email="asha@example.com", aadhar_id=""):
+    return user_pb2.CreateUserRequest(name=name, email=email, aadhar_id=aadhar_id)
+
+
+def fake_insert_rows(monkeypatch, refuse=()):
+    # stands in for the database: inserts every row except those in refuse,
+    # which are rejected as already registered
+    rounds = []
+
+    async def insert_rows(valid, rejected):
+        rounds.append([row_number for row_number, _ in valid])
+        inserted = {}
+        for row_number, _ in valid:
+            if row_number in refuse:
+                rejected[row_number] = service.conflict_error(["aadhar_id"], "registered")
+            else:
+                inserted[row_number] = 100 + row_number
+        return inserted
+
+    monkeypatch.setattr(service, "insert_rows", insert_rows)
+    return rounds
+
+
+def test_claim_rows_rejects_invalid_rows_and_normalises_valid_ones():
+    rejected = {}
+    valid, held = claim_rows(
+        [(1, row(name=" ")), (2, row(email=" asha@example.com ", aadhar_id=" "))], {}, {}, rejected
+    )
+    assert rejected == {1: ("name is required", [])}
+    assert held == []
+    assert [row_number for row_number, _ in valid] == [2]
+    assert valid[0][1]["email_id"] == "asha@example.com"
+    # blank aadhar_id is stored as NULL
+    assert valid[0][1]["aadhar_id"] is None
+
+
+def test_claim_rows_rejects_identifiers_inserted_earlier_in_the_stream():
+    rejected = {}
+    valid, held = claim_rows(
+        [(3, row(email="asha@example.com", aadhar_id="1234"))],
+        {"asha@example.com": 1}, {"1234": 2}, rejected,
+    )
+    assert valid == [] and held == []
+    assert rejected == {3: ("email_id and aadhar_id already used earlier in the stream", ["email_id", "aadhar_id"])}
+
+
+def test_claim_rows_holds_back_repeats_within_the_batch():
+    rejected = {}
+    batch = [
+        (1, row(email="a@example.com", aadhar_id="1234")),
+        (2, row(email="a@example.com")),
+        (3, row(email="b@example.com", aadhar_id="1234")),
+        (4, row(email="c@example.com")),
+    ]
+    valid, held = claim_rows(batch, {}, {}, rejected)
+    assert [row_number for row_number, _ in valid] == [1, 4]
+    assert [row_number for row_number, _ in held] == [2, 3]
+    assert rejected == {}
+
+
+def test_create_batch_rejects_repeats_of_an_inserted_row(monkeypatch):
+    rounds = fake_insert_rows(monkeypatch)
+    seen_emails, seen_aadhars = {}, {}
+    batch = [(1, row(email="a@example.com", aadhar_id="1234")), (2, row(email="a@example.com"))]
+
+    inserted, rejected = asyncio.run(create_batch(batch, seen_emails, seen_aadhars))
+
+    assert rounds == [[1]]
+    assert inserted == {1: 101}
+    assert rejected == {2: ("email_id already used earlier in the stream", ["email_id"])}
+    assert seen_emails == {"a@example.com": 1}
+    assert seen_aadhars == {"1234": 1}
+
+
+def test_create_batch_retries_repeats_of_a_row_that_was_not_inserted(monkeypatch):
+    # row 1's aadhar_id is already registered, so its email is still free
+    # for row 2
+    rounds = fake_insert_rows(monkeypatch, refuse={1})
+    seen_emails, seen_aadhars = {}, {}
+    batch = [(1, row(email="a@example.com", aadhar_id="1234")), (2, row(email="a@example.com"))]
+
+    inserted, rejected = asyncio.run(create_batch(batch, seen_emails, seen_aadhars))
+
+    assert rounds == [[1], [2]]
+    assert inserted == {2: 102}
+    assert rejected == {1: ("aadhar_id already registered", ["aadhar_id"])}
+    assert seen_emails == {"a@example.com": 2}
+    assert seen_aadhars == {}
+
+
+def test_create_batch_only_remembers_inserted_rows_for_later_batches(monkeypatch):
+    fake_insert_rows(monkeypatch, refuse={1})
+    seen_emails, seen_aadhars = {}, {}
+    asyncio.run(create_batch([(1, row(email="a@example.com", aadhar_id="1234"))], seen_emails, seen_aadhars))
+
+    inserted, rejected = asyncio.run(
+        create_batch([(2, row(email="a@example.com", aadhar_id="1234"))], seen_emails, seen_aadhars)
+    )
+    # not rejected as "used earlier in the stream"; the fake inserts it
+    assert inserted == {2: 102}
+    assert rejected == {}